@@ -57,20 +57,21 @@ def main():
                 f"✅ 成功加载 {model_count} 个模型 / Successfully loaded {model_count} models"
             )
 
-            # 显示可用模型 / Show available models
-            print("\n📋 可用模型 / Available Models:")
+            # 显示可用模型，一次性写出 / Show available models in a single write
+            lines = ["\n📋 可用模型 / Available Models:"]
             for category, category_models in models.items():
                 if category_models:
-                    print(f"  {category.upper()}:")
-                    for model in category_models[:2]:  # 只显示前2个 / Only show first 2
-                        display_name = model.get(
-                            "displayName", model.get("modelId", "Unknown")
-                        )
-                        print(f"    - {display_name}")
+                    lines.append(f"  {category.upper()}:")
+                    # 只显示前2个 / Only show first 2
+                    lines.extend(
+                        f"    - {model.get('displayName', model.get('modelId', 'Unknown'))}"
+                        for model in category_models[:2]
+                    )
                     if len(category_models) > 2:
-                        print(
+                        lines.append(
                             f"    ... 还有 {len(category_models) - 2} 个模型 / ... and {len(category_models) - 2} more"
                         )
+            sys.stdout.write("\n".join(lines) + "\n")
 
         except Exception as e:
             print(f"⚠️  模型加载失败，使用默认配置: {e}")
@@ -107,13 +108,15 @@ def main():
 
         try:
             # 生成总结 / Generate summary
-            summary = app_controller.process_case_summary(
-                case_input=sample_case, model_id=default_model
-            )
-
             print("\n📄 生成的案例总结:")
             print("=" * 60)
-            print(summary)
+            # 流式输出总结 / Stream summary output
+            for chunk in app_controller.process_case_summary_stream(
+                case_input=sample_case, model_id=default_model
+            ):
+                sys.stdout.write(chunk)
+                sys.stdout.flush()
+            print()
             print("=" * 60)
             print("\n✅ 演示完成！/ Demo completed!")
 
@@ -5,11 +5,479 @@ AWS Bedrock客户端 / AWS Bedrock Client
 Responsible for interacting with AWS Bedrock service
 """
 
+import asyncio
+import functools
+import hashlib
 import json
 import logging
-from typing import Dict, List, Any, Optional
+import os
+import random
+import threading
+import time
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, Iterator, List, Any, Optional, Tuple
 import boto3
-from botocore.exceptions import ClientError, NoCredentialsError
+from botocore.config import Config
+from botocore.credentials import RefreshableCredentials
+from botocore.exceptions import (
+    ClientError,
+    ConnectionClosedError,
+    ConnectTimeoutError,
+    EndpointConnectionError,
+    NoCredentialsError,
+    ReadTimeoutError,
+)
+from urllib3.exceptions import NewConnectionError, ProtocolError
+
+try:
+    # orjson为可选依赖，缺失时回退到标准库json / orjson is optional, falls back to stdlib json
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+def _json_dumps_sorted(obj: Any) -> bytes:
+    """
+    按键排序序列化为UTF-8字节 / Serialize to UTF-8 bytes with sorted keys
+
+    Args:
+        obj: 待序列化对象 / Object to serialize
+
+    Returns:
+        JSON字节 / JSON bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS, default=str)
+    # 紧凑分隔符与orjson输出一致，缓存键不随是否安装orjson变化
+    # Compact separators match orjson output so cache keys do not depend on orjson
+    return json.dumps(
+        obj, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str
+    ).encode("utf-8")
+
+
+def _json_loads(data: Any) -> Any:
+    """
+    反序列化JSON字符串或字节 / Deserialize a JSON string or bytes
+
+    Args:
+        data: JSON字符串或字节 / JSON string or bytes
+
+    Returns:
+        反序列化结果 / Deserialized object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# 模型列表缓存有效期（秒）/ Model list cache TTL (seconds)
+MODEL_CACHE_TTL = 24 * 60 * 60
+
+# 磁盘响应缓存有效期（秒）/ On-disk response cache TTL (seconds)
+RESPONSE_CACHE_TTL = 24 * 60 * 60
+
+# 默认磁盘缓存目录 / Default on-disk cache directory
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "business_summaries"
+
+# 按区域和凭证缓存的模型数据，模型与推理配置文件的可用性因账户而异
+# Model data cached per region and credentials, since model and inference profile availability differs per account
+# (region, credential fingerprint) -> (timestamp, supported_models, inference_profiles)
+_MODEL_CACHE: Dict[Any, Tuple[float, List[Dict[str, Any]], Dict[str, str]]] = {}
+
+# 支持延迟优化推理的模型 / Models supporting latency-optimized inference
+_LATENCY_OPTIMIZED_MODELS = (
+    "anthropic.claude-3-5-haiku",
+    "amazon.nova-pro",
+    "meta.llama3-1-70b",
+    "meta.llama3-1-405b",
+)
+
+# 支持提示词缓存的模型 / Models supporting prompt caching
+_PROMPT_CACHE_MODELS = (
+    "anthropic.claude-3-5-haiku",
+    "anthropic.claude-3-7-sonnet",
+    "anthropic.claude-sonnet-4",
+    "anthropic.claude-opus-4",
+    "amazon.nova",
+)
+
+# 提示词缓存点 / Prompt cache point block
+_CACHE_POINT = {"cachePoint": {"type": "default"}}
+
+# 常见的跨区域推理配置文件映射 / Common cross-region inference profile mappings
+_CROSS_REGION_PROFILES = MappingProxyType(
+    {
+        "anthropic.claude-3-5-sonnet-20241022-v2:0": "us.anthropic.claude-3-5-sonnet-20241022-v2:0",
+        "anthropic.claude-3-5-sonnet-20240620-v1:0": "us.anthropic.claude-3-5-sonnet-20240620-v1:0",
+        "anthropic.claude-3-5-haiku-20241022-v1:0": "us.anthropic.claude-3-5-haiku-20241022-v1:0",
+        "anthropic.claude-3-opus-20240229-v1:0": "us.anthropic.claude-3-opus-20240229-v1:0",
+        "anthropic.claude-3-sonnet-20240229-v1:0": "us.anthropic.claude-3-sonnet-20240229-v1:0",
+        "anthropic.claude-3-haiku-20240307-v1:0": "us.anthropic.claude-3-haiku-20240307-v1:0",
+        "anthropic.claude-3-7-sonnet-20250219-v1:0": "us.anthropic.claude-3-7-sonnet-20250219-v1:0",
+        "anthropic.claude-opus-4-20250514-v1:0": "us.anthropic.claude-opus-4-20250514-v1:0",
+        "anthropic.claude-sonnet-4-20250514-v1:0": "us.anthropic.claude-sonnet-4-20250514-v1:0",
+        "deepseek.r1-v1:0": "us.deepseek.r1-v1:0",
+        "meta.llama3-1-8b-instruct-v1:0": "us.meta.llama3-1-8b-instruct-v1:0",
+        "meta.llama3-1-70b-instruct-v1:0": "us.meta.llama3-1-70b-instruct-v1:0",
+        "meta.llama3-2-11b-instruct-v1:0": "us.meta.llama3-2-11b-instruct-v1:0",
+        "meta.llama3-2-90b-instruct-v1:0": "us.meta.llama3-2-90b-instruct-v1:0",
+        "meta.llama3-3-70b-instruct-v1:0": "us.meta.llama3-3-70b-instruct-v1:0",
+    }
+)
+
+# 支持的四类模型匹配模式及其类别，按顺序匹配 / Supported model patterns and their categories, matched in order
+_PROVIDER_CATEGORIES = (
+    ("anthropic.claude", "claude"),
+    ("amazon.nova", "nova"),
+    ("deepseek.", "deepseek"),
+    ("openai.", "openai"),
+)
+_SUPPORTED_MODEL_PREFIXES = tuple(prefix for prefix, _ in _PROVIDER_CATEGORIES)
+
+# 跨区域推理配置文件ID的区域前缀 / Region prefixes of cross-region inference profile IDs
+_REGION_PREFIXES = frozenset({"us", "us-gov", "eu", "apac", "jp", "au", "ca", "global"})
+
+# 可用的推理类型 / Usable inference types
+_SUPPORTED_INFERENCE_TYPES = frozenset({"ON_DEMAND", "INFERENCE_PROFILE"})
+
+# 显示名称规则: (模式, ((变体标记, 名称), ...), 默认名称)，按顺序匹配
+# Display name rules: (pattern, ((variant marker, name), ...), default name), matched in order
+_CLAUDE_DISPLAY_RULES = (
+    (
+        "claude-3-sonnet-20240229",
+        ((":28k", "Claude 3 Sonnet (28K)"), (":200k", "Claude 3 Sonnet (200K)")),
+        "Claude 3 Sonnet",
+    ),
+    (
+        "claude-3-haiku-20240307",
+        ((":48k", "Claude 3 Haiku (48K)"), (":200k", "Claude 3 Haiku (200K)")),
+        "Claude 3 Haiku",
+    ),
+    (
+        "claude-3-opus-20240229",
+        (
+            (":12k", "Claude 3 Opus (12K)"),
+            (":28k", "Claude 3 Opus (28K)"),
+            (":200k", "Claude 3 Opus (200K)"),
+        ),
+        "Claude 3 Opus",
+    ),
+    ("claude-3-5-sonnet-20240620", (), "Claude 3.5 Sonnet (June)"),
+    ("claude-3-5-sonnet-20241022", (), "Claude 3.5 Sonnet (Oct)"),
+    ("claude-3-5-haiku", (), "Claude 3.5 Haiku"),
+    ("claude-3-7-sonnet", (), "Claude 3.7 Sonnet"),
+    ("claude-opus-4-1", (), "Claude Opus 4.1"),
+    ("claude-opus-4", (), "Claude Opus 4"),
+    ("claude-sonnet-4", (), "Claude Sonnet 4"),
+    ("claude-instant", ((":100k", "Claude Instant (100K)"),), "Claude Instant"),
+    (
+        "claude-v2",
+        (
+            (":1:200k", "Claude v2.1 (200K)"),
+            (":1:18k", "Claude v2.1 (18K)"),
+            (lambda s: s.endswith(":1"), "Claude v2.1"),
+            (":0:100k", "Claude v2.0 (100K)"),
+            (":0:18k", "Claude v2.0 (18K)"),
+            (lambda s: s.endswith("claude-v2"), "Claude v2.0"),
+        ),
+        "Claude v2",
+    ),
+    # 通用Claude模式匹配 / Generic Claude pattern matching
+    ("claude-5", (), "Claude 5"),
+    (
+        "claude-4",
+        (
+            ("sonnet", "Claude 4 Sonnet"),
+            ("haiku", "Claude 4 Haiku"),
+            ("opus", "Claude 4 Opus"),
+        ),
+        "Claude 4",
+    ),
+    (
+        "claude-3",
+        (
+            ("sonnet", "Claude 3 Sonnet"),
+            ("haiku", "Claude 3 Haiku"),
+            ("opus", "Claude 3 Opus"),
+        ),
+        "Claude 3",
+    ),
+)
+
+_NOVA_DISPLAY_RULES = (
+    ("nova-pro", ((":24k", "Nova Pro (24K)"), (":300k", "Nova Pro (300K)")), "Nova Pro"),
+    (
+        "nova-lite",
+        ((":24k", "Nova Lite (24K)"), (":300k", "Nova Lite (300K)")),
+        "Nova Lite",
+    ),
+    (
+        "nova-micro",
+        ((":24k", "Nova Micro (24K)"), (":128k", "Nova Micro (128K)")),
+        "Nova Micro",
+    ),
+    (
+        "nova-premier",
+        (
+            (":8k", "Nova Premier (8K)"),
+            (":20k", "Nova Premier (20K)"),
+            (":1000k", "Nova Premier (1000K)"),
+            (":mm", "Nova Premier (MM)"),
+        ),
+        "Nova Premier",
+    ),
+    ("nova-canvas", (), "Nova Canvas (Image)"),
+    ("nova-reel", (("v1:1", "Nova Reel v1.1 (Video)"),), "Nova Reel (Video)"),
+    ("nova-sonic", (), "Nova Sonic (Audio)"),
+)
+
+_DEEPSEEK_DISPLAY_RULES = (
+    ("v2.5", (), "DeepSeek V2.5"),
+    ("v3", (), "DeepSeek V3"),
+    ("r1", (), "DeepSeek R1"),
+    ("r2", (), "DeepSeek R2"),
+)
+
+_OPENAI_DISPLAY_RULES = (
+    ("gpt-4o", (), "GPT-4o"),
+    ("gpt-4", (), "GPT-4"),
+    ("gpt-5", (), "GPT-5"),
+)
+
+
+def _match_display_rules(model_id_lower: str, rules: tuple) -> Optional[str]:
+    """
+    按顺序匹配显示名称规则 / Match display name rules in order
+
+    Args:
+        model_id_lower: 小写模型ID / Lowercased model ID
+        rules: 显示名称规则 / Display name rules
+
+    Returns:
+        匹配的显示名称或None / Matched display name or None
+    """
+    for pattern, variants, default_name in rules:
+        if pattern in model_id_lower:
+            for marker, name in variants:
+                if (
+                    marker(model_id_lower)
+                    if callable(marker)
+                    else marker in model_id_lower
+                ):
+                    return name
+            return default_name
+    return None
+
+
+def _strip_region_prefix(model_id: str) -> str:
+    """
+    去掉推理配置文件ID的区域前缀 / Strip the region prefix of an inference profile ID
+
+    Args:
+        model_id: 模型ID或推理配置文件ID / Model ID or inference profile ID
+
+    Returns:
+        不含区域前缀的模型ID / Model ID without region prefix
+    """
+    head, sep, rest = model_id.partition(".")
+    if sep and head in _REGION_PREFIXES:
+        return rest
+    return model_id
+
+
+def _classify_model(model_id_lower: str) -> Optional[str]:
+    """
+    获取模型所属的提供商类别 / Get the provider category of a model
+
+    Args:
+        model_id_lower: 小写的模型ID / Lowercased model ID
+
+    Returns:
+        类别名称，不支持的模型返回None / Category name, or None for unsupported models
+    """
+    model_id_lower = _strip_region_prefix(model_id_lower)
+    if not model_id_lower.startswith(_SUPPORTED_MODEL_PREFIXES):
+        return None
+    for prefix, category in _PROVIDER_CATEGORIES:
+        if model_id_lower.startswith(prefix):
+            return category
+    return None
+
+
+def _build_client_config(max_attempts: int = 5) -> Config:
+    """
+    构建Bedrock客户端配置 / Build Bedrock client configuration
+
+    启用连接池和TCP keepalive，避免并发调用时重复建立TLS连接。
+    Enables connection pooling and TCP keepalive to avoid repeated TLS handshakes under concurrency.
+
+    Args:
+        max_attempts: botocore的最大尝试次数，1表示不重试 / botocore maximum attempts, 1 disables retries
+
+    Returns:
+        botocore配置对象 / botocore config object
+    """
+    return Config(
+        max_pool_connections=int(os.getenv("BEDROCK_MAX_POOL_CONNECTIONS", "100")),
+        tcp_keepalive=True,
+        retries={"mode": "adaptive", "max_attempts": max_attempts},
+        connect_timeout=5,
+        read_timeout=120,
+    )
+
+
+# 按session缓存的Bedrock客户端，可单独移除某个会话的客户端
+# Bedrock clients cached per session, so one session's clients can be dropped on their own
+_CLIENT_CACHE: Dict[boto3.Session, Tuple[Any, Any]] = {}
+_CLIENT_CACHE_MAX_ENTRIES = 8
+_CLIENT_CACHE_LOCK = threading.Lock()
+
+
+def _get_bedrock_clients(session: boto3.Session) -> Tuple[Any, Any]:
+    """
+    创建并缓存Bedrock客户端 / Create and cache Bedrock clients
+
+    以session为键缓存，同一会话（即同一区域和凭证）只构建一次客户端。
+    Keyed by session, so clients are built only once per session (region and credentials).
+
+    Args:
+        session: boto3会话对象 / boto3 session object
+
+    Returns:
+        (bedrock客户端, bedrock-runtime客户端) / (bedrock client, bedrock-runtime client)
+    """
+    with _CLIENT_CACHE_LOCK:
+        clients = _CLIENT_CACHE.get(session)
+        if clients is None:
+            # 运行时调用由 wait_and_retry 统一重试，botocore 不再重复重试
+            # Runtime calls are retried by wait_and_retry alone, so botocore does not retry them again
+            clients = (
+                session.client("bedrock", config=_build_client_config()),
+                session.client(
+                    "bedrock-runtime", config=_build_client_config(max_attempts=1)
+                ),
+            )
+            _CLIENT_CACHE[session] = clients
+            while len(_CLIENT_CACHE) > _CLIENT_CACHE_MAX_ENTRIES:
+                del _CLIENT_CACHE[next(iter(_CLIENT_CACHE))]
+        return clients
+
+
+def _drop_bedrock_clients(session: boto3.Session) -> None:
+    """
+    移除某个会话缓存的客户端 / Drop the cached clients of one session
+
+    Args:
+        session: boto3会话对象 / boto3 session object
+    """
+    with _CLIENT_CACHE_LOCK:
+        _CLIENT_CACHE.pop(session, None)
+
+
+# 表示连接池已失效的异常类型 / Exception types indicating a poisoned connection pool
+_STALE_CONNECTION_ERRORS = (
+    ConnectionClosedError,
+    ReadTimeoutError,
+    EndpointConnectionError,
+    ConnectTimeoutError,
+    ProtocolError,
+    NewConnectionError,
+)
+
+# AssertionError 来自这些模块时视为连接失效 / AssertionError from these modules counts as stale
+_STALE_ASSERTION_MODULES = ("urllib3.", "botocore.", "boto3.")
+
+
+def is_stale_connection_error(exc: BaseException) -> bool:
+    """
+    判断异常是否由失效的HTTP连接引起 / Check whether an exception comes from a stale HTTP connection
+
+    Args:
+        exc: 异常对象 / Exception object
+
+    Returns:
+        是否为连接失效错误 / Whether it is a stale connection error
+    """
+    if isinstance(exc, _STALE_CONNECTION_ERRORS):
+        return True
+
+    if isinstance(exc, AssertionError) and exc.__traceback__ is not None:
+        # 检查最内层栈帧所在模块 / Check the module of the innermost frame
+        tb = exc.__traceback__
+        while tb.tb_next is not None:
+            tb = tb.tb_next
+        module_name = tb.tb_frame.f_globals.get("__name__", "")
+        return module_name.startswith(_STALE_ASSERTION_MODULES)
+
+    return False
+
+
+# 批量推理任务的失败终态 / Terminal failure states of batch inference jobs
+_BATCH_FAILED_STATUSES = frozenset({"Failed", "Stopped", "Expired"})
+
+
+def _split_s3_uri(uri: str) -> Tuple[str, str]:
+    """
+    拆分S3 URI为桶和键 / Split an S3 URI into bucket and key
+
+    Args:
+        uri: s3://bucket/key 格式的URI / URI in s3://bucket/key form
+
+    Returns:
+        (桶名, 键) / (bucket, key)
+    """
+    if not uri.startswith("s3://"):
+        raise ValueError(f"无效的S3 URI: {uri} / Invalid S3 URI: {uri}")
+    bucket, _, key = uri[5:].partition("/")
+    return bucket, key
+
+
+# 可重试的瞬时错误代码 / Transient error codes worth retrying
+_RETRYABLE_ERROR_CODES = frozenset(
+    {
+        "ThrottlingException",
+        "TooManyRequestsException",
+        "ServiceUnavailableException",
+        "ServiceUnavailable",
+        "ModelNotReadyException",
+    }
+)
+
+
+def wait_and_retry(max_attempts: int = 4, base_delay: float = 1.0, max_delay: float = 20.0):
+    """
+    对瞬时ClientError进行指数退避重试的装饰器 / Decorator retrying transient ClientErrors with exponential backoff
+
+    Args:
+        max_attempts: 最大尝试次数 / Maximum number of attempts
+        base_delay: 初始等待时间（秒） / Initial delay (seconds)
+        max_delay: 最大等待时间（秒） / Maximum delay (seconds)
+
+    Returns:
+        装饰器 / Decorator
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            for attempt in range(1, max_attempts + 1):
+                try:
+                    return func(*args, **kwargs)
+                except ClientError as e:
+                    error_code = e.response.get("Error", {}).get("Code")
+                    if error_code not in _RETRYABLE_ERROR_CODES or attempt == max_attempts:
+                        raise
+                    delay = min(max_delay, base_delay * 2 ** (attempt - 1))
+                    delay += random.uniform(0, base_delay)
+                    logging.getLogger(__name__).warning(
+                        f"{error_code}，{delay:.1f}秒后重试（第{attempt}次） / {error_code}, retrying in {delay:.1f}s (attempt {attempt})"
+                    )
+                    time.sleep(delay)
+
+        return wrapper
+
+    return decorator
 
 
 class ModelInvocationError(Exception):
@@ -21,15 +489,26 @@ class ModelInvocationError(Exception):
 class BedrockClient:
     """AWS Bedrock客户端 / AWS Bedrock Client"""
 
-    def __init__(self, session: boto3.Session):
+    def __init__(
+        self,
+        session: boto3.Session,
+        cache_dir: Optional[str] = None,
+        warm_up: bool = True,
+    ):
         """
         初始化Bedrock客户端 / Initialize Bedrock client
 
         Args:
             session: boto3会话对象 / boto3 session object
+            cache_dir: 模型列表磁盘缓存目录，None表示仅使用内存缓存 / On-disk model list cache directory, None for memory-only cache
+            warm_up: 是否在后台线程预先解析凭证 / Whether to resolve credentials in a background thread
         """
         self.session = session
         self.logger = logging.getLogger(__name__)
+        self._region = getattr(session, "region_name", None) or "default"
+        # 模型缓存键，首次使用时计算以免阻塞构造 / Model cache key, computed on first use so construction doesn't block
+        self._model_cache_key: Optional[Tuple[Any, str]] = None
+        self.cache_dir = Path(cache_dir).expanduser() if cache_dir else None
         self.bedrock_client = None
         self.bedrock_runtime_client = None
         self._initialize_clients()
@@ -42,11 +521,33 @@ class BedrockClient:
             "openai",  # OpenAI系列
         }
 
+        if warm_up:
+            threading.Thread(
+                target=self._warm_up, name="bedrock-warm-up", daemon=True
+            ).start()
+
+    def _warm_up(self):
+        """
+        预先解析凭证链，避免首次调用时阻塞 / Resolve the credential chain ahead of the first call
+
+        失败时仅记录日志，首次实际调用会再次报告错误。
+        Failures are only logged; the first real call reports them again.
+        """
+        try:
+            credentials = self.session.get_credentials()
+            if credentials is not None:
+                credentials.get_frozen_credentials()
+            self.logger.debug("AWS凭证预热完成 / AWS credentials warmed up")
+        except Exception as e:
+            self.logger.debug(f"AWS凭证预热失败: {e} / AWS credential warm-up failed: {e}")
+
     def _initialize_clients(self):
         """初始化Bedrock客户端 / Initialize Bedrock clients"""
         try:
-            self.bedrock_client = self.session.client("bedrock")
-            self.bedrock_runtime_client = self.session.client("bedrock-runtime")
+            (
+                self.bedrock_client,
+                self.bedrock_runtime_client,
+            ) = _get_bedrock_clients(self.session)
             self.logger.info(
                 "Bedrock客户端初始化成功 / Bedrock clients initialized successfully"
             )
@@ -58,13 +559,80 @@ class BedrockClient:
                 f"无法初始化Bedrock客户端: {e} / Cannot initialize Bedrock client: {e}"
             )
 
-    def list_foundation_models(self) -> List[Dict[str, Any]]:
+    def _invalidate_runtime_client(self):
+        """丢弃缓存的客户端并重新创建 / Discard cached clients and recreate them"""
+        self.logger.warning(
+            "检测到连接失效，重建Bedrock客户端 / Stale connection detected, rebuilding Bedrock clients"
+        )
+        # 只重建本会话的客户端，其他会话的连接池不受影响
+        # Only this session's clients are rebuilt; other sessions keep their pools
+        _drop_bedrock_clients(self.session)
+        self._initialize_clients()
+
+    @wait_and_retry()
+    def _call_runtime(self, operation: str, request_params: Dict[str, Any]) -> Any:
+        """
+        调用bedrock-runtime接口，连接失效时重建客户端并重试一次
+        Call a bedrock-runtime operation, rebuilding clients and retrying once on stale connections
+
+        Args:
+            operation: 接口名称 / Operation name
+            request_params: 请求参数 / Request parameters
+
+        Returns:
+            API响应 / API response
+        """
+        try:
+            return getattr(self.bedrock_runtime_client, operation)(**request_params)
+        except Exception as e:
+            if not is_stale_connection_error(e):
+                raise
+            self._invalidate_runtime_client()
+            return getattr(self.bedrock_runtime_client, operation)(**request_params)
+
+    def list_foundation_models(self, force_refresh: bool = False) -> List[Dict[str, Any]]:
         """
         通过API获取可用的基础模型列表 / Get available foundation models via API
 
+        结果按区域和凭证缓存24小时；刷新失败时回退到过期缓存。
+        Results are cached per region and credentials for 24 hours; stale cache is used if a refresh fails.
+
+        Args:
+            force_refresh: 是否忽略缓存强制刷新 / Whether to bypass the cache and force a refresh
+
         Returns:
             模型列表 / List of models
 
+        Raises:
+            ModelInvocationError: 获取模型列表失败 / Failed to get model list
+        """
+        cached = self._get_cached_models()
+        if cached and not force_refresh and time.time() - cached[0] < MODEL_CACHE_TTL:
+            self.logger.debug(
+                f"使用缓存的模型列表: {self._region} / Using cached model list: {self._region}"
+            )
+            return list(cached[1])
+
+        try:
+            supported_models, inference_profiles = self._fetch_foundation_models()
+        except ModelInvocationError:
+            if cached:
+                self.logger.warning(
+                    "刷新模型列表失败，使用过期缓存 / Failed to refresh model list, using stale cache"
+                )
+                return list(cached[1])
+            raise
+
+        self._store_cached_models(supported_models, inference_profiles)
+        return list(supported_models)
+
+    def _fetch_foundation_models(self) -> Tuple[List[Dict[str, Any]], Dict[str, str]]:
+        """
+        从API获取模型列表和推理配置文件映射 / Fetch model list and inference profile mapping from API
+
+        Returns:
+            (支持的模型列表, 模型ID到推理配置文件ID的映射) / (supported models, model ID to inference profile ID mapping)
+
         Raises:
             ModelInvocationError: 获取模型列表失败 / Failed to get model list
         """
@@ -75,53 +643,46 @@ class BedrockClient:
             # 获取inference profiles / Get inference profiles
             inference_profiles = {}
             try:
-                profiles_response = self.bedrock_client.list_inference_profiles()
-                profiles = profiles_response.get("inferenceProfileSummaries", [])
-                for profile in profiles:
-                    profile_models = profile.get("models", [])
-                    for model in profile_models:
-                        model_arn = model.get("modelArn", "")
-                        # 从ARN中提取模型ID
-                        if "::foundation-model/" in model_arn:
-                            model_id = model_arn.split("::foundation-model/")[-1]
-                            inference_profiles[model_id] = profile.get(
-                                "inferenceProfileId", ""
-                            )
+                inference_profiles = self._fetch_inference_profiles()
             except Exception as e:
                 self.logger.warning(
                     f"获取inference profiles失败: {e} / Failed to get inference profiles: {e}"
                 )
 
-            # 筛选支持的模型 / Filter supported models
+            # 单次遍历筛选支持的模型 / Filter supported models in a single pass
             supported_models = []
             for model in models:
                 model_id = model.get("modelId", "")
-                if self.is_supported_model(model_id):
-                    # 检查模型是否支持ON_DEMAND或INFERENCE_PROFILE
-                    inference_types = model.get("inferenceTypesSupported", [])
-                    if (
-                        "ON_DEMAND" in inference_types
-                        or "INFERENCE_PROFILE" in inference_types
-                    ):
-                        # 如果有inference profile，优先使用inference profile ID
-                        if model_id in inference_profiles:
-                            model_copy = model.copy()
-                            model_copy["originalModelId"] = model_id
-                            model_copy["modelId"] = inference_profiles[model_id]
-                            model_copy["useInferenceProfile"] = True
-                            supported_models.append(model_copy)
-                        else:
-                            model["useInferenceProfile"] = False
-                            supported_models.append(model)
-                    else:
-                        self.logger.debug(
-                            f"跳过不支持的推理类型的模型: {model_id} / Skipping model with unsupported inference types: {model_id}"
-                        )
+                category = _classify_model(model_id.lower())
+                if category is None:
+                    continue
+
+                # 检查模型是否支持ON_DEMAND或INFERENCE_PROFILE
+                if _SUPPORTED_INFERENCE_TYPES.isdisjoint(
+                    model.get("inferenceTypesSupported", ())
+                ):
+                    self.logger.debug(
+                        f"跳过不支持的推理类型的模型: {model_id} / Skipping model with unsupported inference types: {model_id}"
+                    )
+                    continue
+
+                # 如果有inference profile，优先使用inference profile ID
+                # API每次返回新的字典，可直接原地修改 / The API returns fresh dicts, so mutate in place
+                profile_id = inference_profiles.get(model_id)
+                if profile_id:
+                    model["originalModelId"] = model_id
+                    model["modelId"] = profile_id
+                    model["useInferenceProfile"] = True
+                else:
+                    model["useInferenceProfile"] = False
+                # 预先记录提供商类别，供分组时直接使用 / Record the provider category for later grouping
+                model["_provider"] = category
+                supported_models.append(model)
 
             self.logger.info(
                 f"获取到 {len(supported_models)} 个支持的模型 / Retrieved {len(supported_models)} supported models"
             )
-            return supported_models
+            return supported_models, inference_profiles
 
         except ClientError as e:
             error_code = e.response["Error"]["Code"]
@@ -135,6 +696,145 @@ class BedrockClient:
             self.logger.error(f"获取模型列表失败: {e} / Failed to get model list: {e}")
             raise ModelInvocationError(f"获取模型列表失败: {e} / Failed to get model list: {e}")
 
+    def _fetch_inference_profiles(self) -> Dict[str, str]:
+        """
+        获取模型ID到推理配置文件ID的映射 / Get mapping from model ID to inference profile ID
+
+        Returns:
+            模型ID到推理配置文件ID的映射 / Model ID to inference profile ID mapping
+        """
+        inference_profiles = {}
+        profiles_response = self.bedrock_client.list_inference_profiles()
+        profiles = profiles_response.get("inferenceProfileSummaries", [])
+        for profile in profiles:
+            profile_models = profile.get("models", [])
+            for model in profile_models:
+                model_arn = model.get("modelArn", "")
+                # 从ARN中提取模型ID
+                if "::foundation-model/" in model_arn:
+                    model_id = model_arn.rpartition("::foundation-model/")[2]
+                    inference_profiles[model_id] = profile.get(
+                        "inferenceProfileId", ""
+                    )
+        return inference_profiles
+
+    def _get_model_cache_key(self) -> Tuple[Any, str]:
+        """
+        获取模型缓存键：区域和凭证指纹 / Get the model cache key: region and credential fingerprint
+
+        指纹由profile名称和静态访问密钥ID计算；临时凭证的密钥会轮换，只使用profile名称。
+        The fingerprint covers the profile name and a static access key ID; temporary
+        credentials rotate their keys, so only the profile name is used for them.
+
+        Returns:
+            (区域, 凭证指纹) / (region, credential fingerprint)
+        """
+        if self._model_cache_key is None:
+            parts = [str(getattr(self.session, "profile_name", None) or "default")]
+            try:
+                credentials = self.session.get_credentials()
+            except Exception:
+                credentials = None
+            if credentials is not None and not isinstance(
+                credentials, RefreshableCredentials
+            ):
+                parts.append(str(credentials.access_key or ""))
+            fingerprint = hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()[:16]
+            self._model_cache_key = (self._region, fingerprint)
+        return self._model_cache_key
+
+    def _get_cached_models(
+        self,
+    ) -> Optional[Tuple[float, List[Dict[str, Any]], Dict[str, str]]]:
+        """
+        获取当前区域和凭证的缓存模型数据（内存优先，其次磁盘） / Get cached model data for the current region and credentials (memory first, then disk)
+
+        Returns:
+            (时间戳, 模型列表, 推理配置文件映射)或None / (timestamp, models, inference profiles) or None
+        """
+        cache_key = self._get_model_cache_key()
+        cached = _MODEL_CACHE.get(cache_key)
+        if cached is None:
+            cached = self._load_disk_cache()
+            if cached is not None:
+                _MODEL_CACHE[cache_key] = cached
+        return cached
+
+    def _store_cached_models(
+        self, supported_models: List[Dict[str, Any]], inference_profiles: Dict[str, str]
+    ) -> None:
+        """
+        保存模型数据到缓存 / Store model data in cache
+
+        Args:
+            supported_models: 支持的模型列表 / Supported models list
+            inference_profiles: 推理配置文件映射 / Inference profile mapping
+        """
+        _MODEL_CACHE[self._get_model_cache_key()] = (
+            time.time(),
+            supported_models,
+            inference_profiles,
+        )
+        self._save_disk_cache(supported_models, inference_profiles)
+
+    def _disk_cache_paths(self) -> Optional[Tuple[Path, Path]]:
+        """获取磁盘缓存文件路径 / Get on-disk cache file paths"""
+        if self.cache_dir is None or not isinstance(self._region, str):
+            return None
+        region, fingerprint = self._get_model_cache_key()
+        data_path = self.cache_dir / f"bedrock_models_{region}_{fingerprint}.json"
+        return data_path, data_path.with_suffix(".last_sync")
+
+    def _load_disk_cache(
+        self,
+    ) -> Optional[Tuple[float, List[Dict[str, Any]], Dict[str, str]]]:
+        """从磁盘加载缓存的模型数据 / Load cached model data from disk"""
+        paths = self._disk_cache_paths()
+        if paths is None:
+            return None
+
+        data_path, marker_path = paths
+        try:
+            timestamp = os.stat(marker_path).st_mtime
+            with open(data_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return (
+                timestamp,
+                data.get("supported_models", []),
+                data.get("inference_profiles", {}),
+            )
+        except (OSError, ValueError):
+            return None
+
+    def _save_disk_cache(
+        self, supported_models: List[Dict[str, Any]], inference_profiles: Dict[str, str]
+    ) -> None:
+        """保存模型数据到磁盘缓存 / Save model data to on-disk cache"""
+        paths = self._disk_cache_paths()
+        if paths is None:
+            return
+
+        data_path, marker_path = paths
+        try:
+            data_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = data_path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(
+                    {
+                        "supported_models": supported_models,
+                        "inference_profiles": inference_profiles,
+                    },
+                    f,
+                    ensure_ascii=False,
+                    default=str,
+                )
+            os.replace(tmp_path, data_path)
+            marker_path.touch()
+        except OSError as e:
+            self.logger.warning(
+                f"写入模型列表缓存失败: {e} / Failed to write model list cache: {e}"
+            )
+
     def get_inference_profile_for_model(self, model_id: str) -> Optional[str]:
         """
         获取模型的推理配置文件ID / Get inference profile ID for model
@@ -145,35 +845,34 @@ class BedrockClient:
         Returns:
             推理配置文件ID或None / Inference profile ID or None
         """
-        try:
-            # 获取推理配置文件列表 / Get inference profiles list
-            response = self.bedrock_client.list_inference_profiles()
-            profiles = response.get("inferenceProfileSummaries", [])
-
-            # 查找包含指定模型的推理配置文件 / Find inference profile containing the specified model
-            for profile in profiles:
-                profile_id = profile.get("inferenceProfileId", "")
-                models = profile.get("models", [])
-
-                # 检查是否有匹配的模型 / Check if there's a matching model
-                for model in models:
-                    model_arn = model.get("modelArn", "")
-                    if model_id in model_arn:
-                        self.logger.info(
-                            f"找到模型 {model_id} 的推理配置文件: {profile_id} / Found inference profile for model {model_id}: {profile_id}"
-                        )
-                        return profile_id
-
+        profile_id = self._get_or_refresh_profiles().get(model_id)
+        if profile_id is None:
             self.logger.warning(
                 f"未找到模型 {model_id} 的推理配置文件 / No inference profile found for model {model_id}"
             )
-            return None
+        return profile_id
+
+    def _get_or_refresh_profiles(self) -> Dict[str, str]:
+        """
+        获取缓存的推理配置文件映射，缓存过期时刷新 / Get the cached inference profile mapping, refreshing when stale
+
+        Returns:
+            模型ID到推理配置文件ID的映射 / Model ID to inference profile ID mapping
+        """
+        cached = self._get_cached_models()
+        if cached and time.time() - cached[0] < MODEL_CACHE_TTL:
+            return cached[2]
 
+        try:
+            # 刷新模型列表会同时更新推理配置文件映射 / Refreshing the model list also refreshes the profile mapping
+            self.list_foundation_models()
         except Exception as e:
             self.logger.warning(
                 f"获取推理配置文件失败: {e} / Failed to get inference profiles: {e}"
             )
-            return None
+
+        cached = self._get_cached_models()
+        return cached[2] if cached else {}
 
     def filter_models_by_provider(
         self, models: List[Dict[str, Any]]
@@ -187,23 +886,21 @@ class BedrockClient:
         Returns:
             按提供商分类的模型字典 / Dictionary of models categorized by provider
         """
-        categorized_models = {"claude": [], "nova": [], "deepseek": [], "openai": []}
+        categorized_models = {category: [] for _, category in _PROVIDER_CATEGORIES}
 
         for model in models:
-            model_id = model.get("modelId", "").lower()
-
-            if "anthropic.claude" in model_id:
-                categorized_models["claude"].append(model)
-            elif "amazon.nova" in model_id:
-                categorized_models["nova"].append(model)
-            elif "deepseek" in model_id:
-                categorized_models["deepseek"].append(model)
-            elif "openai" in model_id:
-                categorized_models["openai"].append(model)
+            # 优先使用预先计算的类别 / Prefer the precomputed category
+            category = model.get("_provider") or _classify_model(
+                model.get("modelId", "").lower()
+            )
+            if category is not None:
+                categorized_models[category].append(model)
 
         return categorized_models
 
-    def is_supported_model(self, model_id: str) -> bool:
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def is_supported_model(model_id: str) -> bool:
         """
         检查模型是否属于支持的四类 / Check if model belongs to supported four types
 
@@ -213,22 +910,18 @@ class BedrockClient:
         Returns:
             是否支持 / Whether supported
         """
-        model_id_lower = model_id.lower()
-
-        # 检查是否属于支持的四类模型 / Check if belongs to supported four model types
-        supported_patterns = [
-            "anthropic.claude",  # Claude系列
-            "amazon.nova",  # Nova系列
-            "deepseek",  # DeepSeek系列
-            "openai",  # OpenAI系列
-        ]
-
-        return any(pattern in model_id_lower for pattern in supported_patterns)
+        return _strip_region_prefix(model_id.lower()).startswith(
+            _SUPPORTED_MODEL_PREFIXES
+        )
 
-    def get_model_display_name(self, model_id: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def get_model_display_name(model_id: str) -> str:
         """
         获取模型的显示名称 / Get model display name
 
+        结果按模型ID缓存 / Results are cached per model ID
+
         Args:
             model_id: 模型ID或推理配置文件ID / Model ID or inference profile ID
 
@@ -246,191 +939,77 @@ class BedrockClient:
 
         # Claude系列 - 使用更智能的模式匹配 / Claude series - using smarter pattern matching
         if "anthropic.claude" in model_id_lower:
-            return self._get_claude_display_name(original_model_id)
+            return BedrockClient._get_claude_display_name(
+                original_model_id, model_id_lower
+            )
 
         # Nova系列 / Nova series
         elif "amazon.nova" in model_id_lower:
-            return self._get_nova_display_name(original_model_id)
+            return BedrockClient._get_nova_display_name(
+                original_model_id, model_id_lower
+            )
 
         # DeepSeek系列 / DeepSeek series
         elif "deepseek" in model_id_lower:
-            return self._get_deepseek_display_name(original_model_id)
+            return BedrockClient._get_deepseek_display_name(
+                original_model_id, model_id_lower
+            )
 
         # OpenAI系列 / OpenAI series
         elif "openai" in model_id_lower:
-            return self._get_openai_display_name(original_model_id)
+            return BedrockClient._get_openai_display_name(
+                original_model_id, model_id_lower
+            )
 
         # 其他模型，尝试从模型ID中提取友好名称 / Other models, try to extract friendly name from model ID
-        return self._extract_friendly_name(original_model_id)
+        return BedrockClient._extract_friendly_name(original_model_id)
 
-    def _get_claude_display_name(self, model_id: str) -> str:
+    @staticmethod
+    def _get_claude_display_name(
+        model_id: str, model_id_lower: Optional[str] = None
+    ) -> str:
         """获取Claude模型的显示名称 / Get Claude model display name"""
-        model_id_lower = model_id.lower()
+        if model_id_lower is None:
+            model_id_lower = model_id.lower()
+        return _match_display_rules(model_id_lower, _CLAUDE_DISPLAY_RULES) or "Claude"
 
-        # 具体版本匹配 / Specific version matching
-        if "claude-3-sonnet-20240229" in model_id_lower:
-            if ":28k" in model_id_lower:
-                return "Claude 3 Sonnet (28K)"
-            elif ":200k" in model_id_lower:
-                return "Claude 3 Sonnet (200K)"
-            else:
-                return "Claude 3 Sonnet"
-        elif "claude-3-haiku-20240307" in model_id_lower:
-            if ":48k" in model_id_lower:
-                return "Claude 3 Haiku (48K)"
-            elif ":200k" in model_id_lower:
-                return "Claude 3 Haiku (200K)"
-            else:
-                return "Claude 3 Haiku"
-        elif "claude-3-opus-20240229" in model_id_lower:
-            if ":12k" in model_id_lower:
-                return "Claude 3 Opus (12K)"
-            elif ":28k" in model_id_lower:
-                return "Claude 3 Opus (28K)"
-            elif ":200k" in model_id_lower:
-                return "Claude 3 Opus (200K)"
-            else:
-                return "Claude 3 Opus"
-        elif "claude-3-5-sonnet-20240620" in model_id_lower:
-            return "Claude 3.5 Sonnet (June)"
-        elif "claude-3-5-sonnet-20241022" in model_id_lower:
-            return "Claude 3.5 Sonnet (Oct)"
-        elif "claude-3-5-haiku" in model_id_lower:
-            return "Claude 3.5 Haiku"
-        elif "claude-3-7-sonnet" in model_id_lower:
-            return "Claude 3.7 Sonnet"
-        elif "claude-opus-4-1" in model_id_lower:
-            return "Claude Opus 4.1"
-        elif "claude-opus-4" in model_id_lower:
-            return "Claude Opus 4"
-        elif "claude-sonnet-4" in model_id_lower:
-            return "Claude Sonnet 4"
-        elif "claude-instant" in model_id_lower:
-            if ":100k" in model_id_lower:
-                return "Claude Instant (100K)"
-            else:
-                return "Claude Instant"
-        elif "claude-v2" in model_id_lower:
-            if ":1:200k" in model_id_lower:
-                return "Claude v2.1 (200K)"
-            elif ":1:18k" in model_id_lower:
-                return "Claude v2.1 (18K)"
-            elif ":1" in model_id_lower and model_id_lower.endswith(":1"):
-                return "Claude v2.1"
-            elif ":0:100k" in model_id_lower:
-                return "Claude v2.0 (100K)"
-            elif ":0:18k" in model_id_lower:
-                return "Claude v2.0 (18K)"
-            elif model_id_lower.endswith("claude-v2"):
-                return "Claude v2.0"
-            else:
-                return "Claude v2"
-
-        # 通用Claude模式匹配 / Generic Claude pattern matching
-        elif "claude-5" in model_id_lower:
-            return "Claude 5"
-        elif "claude-4" in model_id_lower:
-            if "sonnet" in model_id_lower:
-                return "Claude 4 Sonnet"
-            elif "haiku" in model_id_lower:
-                return "Claude 4 Haiku"
-            elif "opus" in model_id_lower:
-                return "Claude 4 Opus"
-            else:
-                return "Claude 4"
-        elif "claude-3" in model_id_lower:
-            if "sonnet" in model_id_lower:
-                return "Claude 3 Sonnet"
-            elif "haiku" in model_id_lower:
-                return "Claude 3 Haiku"
-            elif "opus" in model_id_lower:
-                return "Claude 3 Opus"
-            else:
-                return "Claude 3"
-
-        # 默认Claude名称 / Default Claude name
-        return "Claude"
-
-    def _get_nova_display_name(self, model_id: str) -> str:
+    @staticmethod
+    def _get_nova_display_name(
+        model_id: str, model_id_lower: Optional[str] = None
+    ) -> str:
         """获取Nova模型的显示名称 / Get Nova model display name"""
-        model_id_lower = model_id.lower()
-
-        if "nova-pro" in model_id_lower:
-            if ":24k" in model_id_lower:
-                return "Nova Pro (24K)"
-            elif ":300k" in model_id_lower:
-                return "Nova Pro (300K)"
-            else:
-                return "Nova Pro"
-        elif "nova-lite" in model_id_lower:
-            if ":24k" in model_id_lower:
-                return "Nova Lite (24K)"
-            elif ":300k" in model_id_lower:
-                return "Nova Lite (300K)"
-            else:
-                return "Nova Lite"
-        elif "nova-micro" in model_id_lower:
-            if ":24k" in model_id_lower:
-                return "Nova Micro (24K)"
-            elif ":128k" in model_id_lower:
-                return "Nova Micro (128K)"
-            else:
-                return "Nova Micro"
-        elif "nova-premier" in model_id_lower:
-            if ":8k" in model_id_lower:
-                return "Nova Premier (8K)"
-            elif ":20k" in model_id_lower:
-                return "Nova Premier (20K)"
-            elif ":1000k" in model_id_lower:
-                return "Nova Premier (1000K)"
-            elif ":mm" in model_id_lower:
-                return "Nova Premier (MM)"
-            else:
-                return "Nova Premier"
-        elif "nova-canvas" in model_id_lower:
-            return "Nova Canvas (Image)"
-        elif "nova-reel" in model_id_lower:
-            if "v1:1" in model_id_lower:
-                return "Nova Reel v1.1 (Video)"
-            else:
-                return "Nova Reel (Video)"
-        elif "nova-sonic" in model_id_lower:
-            return "Nova Sonic (Audio)"
+        if model_id_lower is None:
+            model_id_lower = model_id.lower()
+        display_name = _match_display_rules(model_id_lower, _NOVA_DISPLAY_RULES)
+        if display_name:
+            return display_name
 
         # 通用Nova模式匹配 / Generic Nova pattern matching
         return "Nova " + model_id_lower.split("nova-")[-1].split(":")[0].title()
 
-    def _get_deepseek_display_name(self, model_id: str) -> str:
+    @staticmethod
+    def _get_deepseek_display_name(
+        model_id: str, model_id_lower: Optional[str] = None
+    ) -> str:
         """获取DeepSeek模型的显示名称 / Get DeepSeek model display name"""
-        model_id_lower = model_id.lower()
-
-        if "v2.5" in model_id_lower:
-            return "DeepSeek V2.5"
-        elif "v3" in model_id_lower:
-            return "DeepSeek V3"
-        elif "r1" in model_id_lower:
-            return "DeepSeek R1"
-        elif "r2" in model_id_lower:
-            return "DeepSeek R2"
-
-        # 通用DeepSeek模式匹配 / Generic DeepSeek pattern matching
-        return "DeepSeek"
-
-    def _get_openai_display_name(self, model_id: str) -> str:
+        if model_id_lower is None:
+            model_id_lower = model_id.lower()
+        return (
+            _match_display_rules(model_id_lower, _DEEPSEEK_DISPLAY_RULES)
+            or "DeepSeek"
+        )
+
+    @staticmethod
+    def _get_openai_display_name(
+        model_id: str, model_id_lower: Optional[str] = None
+    ) -> str:
         """获取OpenAI模型的显示名称 / Get OpenAI model display name"""
-        model_id_lower = model_id.lower()
-
-        if "gpt-4o" in model_id_lower:
-            return "GPT-4o"
-        elif "gpt-4" in model_id_lower:
-            return "GPT-4"
-        elif "gpt-5" in model_id_lower:
-            return "GPT-5"
+        if model_id_lower is None:
+            model_id_lower = model_id.lower()
+        return _match_display_rules(model_id_lower, _OPENAI_DISPLAY_RULES) or "GPT"
 
-        # 通用OpenAI模式匹配 / Generic OpenAI pattern matching
-        return "GPT"
-
-    def _extract_friendly_name(self, model_id: str) -> str:
+    @staticmethod
+    def _extract_friendly_name(model_id: str) -> str:
         """从模型ID中提取友好名称 / Extract friendly name from model ID"""
         # 移除提供商前缀 / Remove provider prefix
         parts = model_id.split(".")
@@ -450,16 +1029,25 @@ class BedrockClient:
         system_prompt: Optional[str] = None,
         max_tokens: int = 4000,
         temperature: float = 0.7,
+        latency_optimized: bool = False,
+        enable_prompt_cache: bool = True,
+        use_cache: bool = True,
     ) -> str:
         """
         使用Converse API调用模型 / Use Converse API to invoke model
 
+        设置了cache_dir时，相同请求的响应会缓存到磁盘，在有效期内直接返回。
+        When cache_dir is set, responses to identical requests are cached on disk and reused until they expire.
+
         Args:
             model_id: 模型ID或推理配置文件ID / Model ID or inference profile ID
             messages: 消息列表 / Message list
             system_prompt: 系统提示词 / System prompt
             max_tokens: 最大token数 / Maximum tokens
             temperature: 温度参数 / Temperature parameter
+            latency_optimized: 是否启用延迟优化推理（仅对支持的模型生效） / Whether to enable latency-optimized inference (supported models only)
+            enable_prompt_cache: 是否缓存系统提示词（仅对支持的模型生效） / Whether to cache the system prompt (supported models only)
+            use_cache: 是否使用磁盘响应缓存 / Whether to use the on-disk response cache
 
         Returns:
             模型响应内容 / Model response content
@@ -468,40 +1056,285 @@ class BedrockClient:
             ModelInvocationError: 模型调用失败 / Model invocation failed
         """
         try:
-            # 构建请求参数 / Build request parameters
-            request_params = {
-                "modelId": model_id,
-                "messages": messages,
-                "inferenceConfig": {
-                    "maxTokens": max_tokens,
-                    "temperature": temperature,
-                },
-            }
+            request_params = self._build_converse_params(
+                model_id,
+                messages,
+                system_prompt,
+                max_tokens,
+                temperature,
+                latency_optimized,
+                enable_prompt_cache,
+            )
 
-            # 添加系统提示词 / Add system prompt
-            if system_prompt and system_prompt.strip():
-                request_params["system"] = [{"text": system_prompt.strip()}]
+            cache_path = self._response_cache_path(request_params) if use_cache else None
+            if cache_path is not None:
+                cached_text = self._load_cached_response(cache_path)
+                if cached_text is not None:
+                    self.logger.debug(
+                        f"命中响应缓存: {model_id} / Response cache hit: {model_id}"
+                    )
+                    return cached_text
 
             self.logger.debug(f"调用模型: {model_id} / Invoking model: {model_id}")
 
             # 调用Converse API / Call Converse API
-            response = self.bedrock_runtime_client.converse(**request_params)
-            return self._parse_converse_response(response)
+            response = self._call_runtime("converse", request_params)
+            text = self._parse_converse_response(response)
 
-        except ClientError as e:
-            error_code = e.response["Error"]["Code"]
-            error_message = e.response["Error"]["Message"]
+            if cache_path is not None:
+                self._save_cached_response(cache_path, text)
+            return text
+
+        except Exception as e:
+            raise self._to_invocation_error(e)
+
+    def converse_stream(
+        self,
+        model_id: str,
+        messages: List[Dict[str, Any]],
+        system_prompt: Optional[str] = None,
+        max_tokens: int = 4000,
+        temperature: float = 0.7,
+        latency_optimized: bool = False,
+        enable_prompt_cache: bool = True,
+    ) -> Iterator[str]:
+        """
+        使用ConverseStream API流式调用模型 / Use ConverseStream API to stream model output
+
+        文本片段在生成时即返回，无需等待完整响应。
+        Text chunks are yielded as they are generated instead of waiting for the full response.
+
+        Args:
+            model_id: 模型ID或推理配置文件ID / Model ID or inference profile ID
+            messages: 消息列表 / Message list
+            system_prompt: 系统提示词 / System prompt
+            max_tokens: 最大token数 / Maximum tokens
+            temperature: 温度参数 / Temperature parameter
+            latency_optimized: 是否启用延迟优化推理（仅对支持的模型生效） / Whether to enable latency-optimized inference (supported models only)
+            enable_prompt_cache: 是否缓存系统提示词（仅对支持的模型生效） / Whether to cache the system prompt (supported models only)
+
+        Yields:
+            响应文本片段 / Response text chunks
+
+        Raises:
+            ModelInvocationError: 模型调用失败 / Model invocation failed
+        """
+        try:
+            request_params = self._build_converse_params(
+                model_id,
+                messages,
+                system_prompt,
+                max_tokens,
+                temperature,
+                latency_optimized,
+                enable_prompt_cache,
+            )
+
+            self.logger.debug(
+                f"流式调用模型: {model_id} / Streaming model: {model_id}"
+            )
+
+            # 调用ConverseStream API / Call ConverseStream API
+            response = self._call_runtime("converse_stream", request_params)
+            for event in response.get("stream", []):
+                text = event.get("contentBlockDelta", {}).get("delta", {}).get("text")
+                if text:
+                    yield text
+
+        except Exception as e:
+            raise self._to_invocation_error(e)
+
+    def _build_converse_params(
+        self,
+        model_id: str,
+        messages: List[Dict[str, Any]],
+        system_prompt: Optional[str],
+        max_tokens: int,
+        temperature: float,
+        latency_optimized: bool,
+        enable_prompt_cache: bool,
+    ) -> Dict[str, Any]:
+        """
+        构建Converse请求参数 / Build Converse request parameters
+
+        Returns:
+            请求参数 / Request parameters
+        """
+        # 构建请求参数 / Build request parameters
+        request_params = {
+            "modelId": model_id,
+            "messages": messages,
+            "inferenceConfig": {
+                "maxTokens": max_tokens,
+                "temperature": temperature,
+            },
+        }
+
+        # 添加系统提示词 / Add system prompt
+        if system_prompt and system_prompt.strip():
+            request_params["system"] = [{"text": system_prompt.strip()}]
+            if enable_prompt_cache and self.supports_prompt_cache(model_id):
+                request_params["system"].append(_CACHE_POINT)
+
+        # 添加延迟优化配置 / Add latency optimization config
+        if latency_optimized and self.supports_latency_optimized(model_id):
+            request_params["performanceConfig"] = {"latency": "optimized"}
+
+        return request_params
+
+    def _response_cache_path(self, request_params: Dict[str, Any]) -> Optional[Path]:
+        """获取请求对应的响应缓存路径 / Get the response cache path for a request"""
+        if self.cache_dir is None:
+            return None
+        key = hashlib.sha256(_json_dumps_sorted(request_params)).hexdigest()
+        return self.cache_dir / "converse" / f"{key}.json"
+
+    def _load_cached_response(self, cache_path: Path) -> Optional[str]:
+        """读取未过期的缓存响应 / Load a cached response that has not expired"""
+        try:
+            if time.time() - cache_path.stat().st_mtime > RESPONSE_CACHE_TTL:
+                return None
+            with open(cache_path, "rb") as f:
+                return _json_loads(f.read())["text"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _save_cached_response(self, cache_path: Path, text: str) -> None:
+        """原子写入响应缓存 / Atomically write a response to the cache"""
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(".tmp")
+            with open(tmp_path, "wb") as f:
+                f.write(_json_dumps_sorted({"text": text}))
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            self.logger.warning(
+                f"写入响应缓存失败: {e} / Failed to write response cache: {e}"
+            )
+
+    def _to_invocation_error(self, error: Exception) -> ModelInvocationError:
+        """
+        记录调用异常并转换为ModelInvocationError / Log invocation error and convert to ModelInvocationError
+
+        Args:
+            error: 原始异常 / Original exception
+
+        Returns:
+            模型调用异常 / Model invocation error
+        """
+        if isinstance(error, ClientError):
+            error_code = error.response["Error"]["Code"]
+            error_message = error.response["Error"]["Message"]
             self.logger.error(
                 f"模型调用失败 - AWS错误: {error_code}: {error_message} / Model invocation failed - AWS error: {error_code}: {error_message}"
             )
-            raise ModelInvocationError(
+            return ModelInvocationError(
                 f"AWS API错误: {error_code} - {error_message} / AWS API error: {error_code} - {error_message}"
             )
-        except Exception as e:
-            self.logger.error(f"模型调用失败: {e} / Model invocation failed: {e}")
-            raise ModelInvocationError(f"模型调用失败: {e} / Model invocation failed: {e}")
+        self.logger.error(f"模型调用失败: {error} / Model invocation failed: {error}")
+        return ModelInvocationError(
+            f"模型调用失败: {error} / Model invocation failed: {error}"
+        )
+
+    async def aconverse(
+        self,
+        model_id: str,
+        messages: List[Dict[str, Any]],
+        system_prompt: Optional[str] = None,
+        max_tokens: int = 4000,
+        temperature: float = 0.7,
+        **kwargs: Any,
+    ) -> str:
+        """
+        异步调用Converse API / Invoke Converse API asynchronously
+
+        在默认线程池中执行同步调用，复用已建立的连接池。
+        Runs the synchronous call in the default executor, reusing the pooled connections.
+
+        Args:
+            model_id: 模型ID或推理配置文件ID / Model ID or inference profile ID
+            messages: 消息列表 / Message list
+            system_prompt: 系统提示词 / System prompt
+            max_tokens: 最大token数 / Maximum tokens
+            temperature: 温度参数 / Temperature parameter
+            **kwargs: 传递给converse的其他参数 / Other arguments passed to converse
+
+        Returns:
+            模型响应内容 / Model response content
+
+        Raises:
+            ModelInvocationError: 模型调用失败 / Model invocation failed
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None,
+            functools.partial(
+                self.converse,
+                model_id=model_id,
+                messages=messages,
+                system_prompt=system_prompt,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                **kwargs,
+            ),
+        )
+
+    async def converse_many(
+        self,
+        model_ids: List[str],
+        messages: List[Dict[str, Any]],
+        system_prompt: Optional[str] = None,
+        **kwargs: Any,
+    ) -> List[str]:
+        """
+        并行调用多个模型，用于模型对比 / Invoke multiple models in parallel for comparison
+
+        Args:
+            model_ids: 模型ID列表 / List of model IDs
+            messages: 消息列表 / Message list
+            system_prompt: 系统提示词 / System prompt
+            **kwargs: 传递给converse的其他参数 / Other arguments passed to converse
+
+        Returns:
+            与model_ids顺序一致的响应列表 / Responses in the same order as model_ids
 
-    def _parse_converse_response(self, response: Dict[str, Any]) -> str:
+        Raises:
+            ModelInvocationError: 任一模型调用失败 / Any model invocation failed
+        """
+        return await asyncio.gather(
+            *[
+                self.aconverse(model_id, messages, system_prompt, **kwargs)
+                for model_id in model_ids
+            ]
+        )
+
+    def supports_latency_optimized(self, model_id: str) -> bool:
+        """
+        检查模型是否支持延迟优化推理 / Check if model supports latency-optimized inference
+
+        Args:
+            model_id: 模型ID或推理配置文件ID / Model ID or inference profile ID
+
+        Returns:
+            是否支持 / Whether supported
+        """
+        model_id_lower = model_id.lower()
+        return any(pattern in model_id_lower for pattern in _LATENCY_OPTIMIZED_MODELS)
+
+    def supports_prompt_cache(self, model_id: str) -> bool:
+        """
+        检查模型是否支持提示词缓存 / Check if model supports prompt caching
+
+        Args:
+            model_id: 模型ID或推理配置文件ID / Model ID or inference profile ID
+
+        Returns:
+            是否支持 / Whether supported
+        """
+        model_id_lower = model_id.lower()
+        return any(pattern in model_id_lower for pattern in _PROMPT_CACHE_MODELS)
+
+    def _parse_converse_response(self, response: Any) -> str:
         """
         解析Converse API响应 / Parse Converse API response
 
@@ -514,6 +1347,10 @@ class BedrockClient:
         Raises:
             ModelInvocationError: 响应解析失败 / Response parsing failed
         """
+        # 兼容原始字节或字符串形式的响应 / Accept raw bytes or string payloads
+        if isinstance(response, (bytes, bytearray, str)):
+            response = _json_loads(response)
+
         output = response.get("output", {})
         message = output.get("message", {})
         content = message.get("content", [])
@@ -537,26 +1374,7 @@ class BedrockClient:
         Returns:
             跨区域推理配置文件ID或None / Cross-region inference profile ID or None
         """
-        # 常见的跨区域推理配置文件映射 / Common cross-region inference profile mappings
-        cross_region_profiles = {
-            "anthropic.claude-3-5-sonnet-20241022-v2:0": "us.anthropic.claude-3-5-sonnet-20241022-v2:0",
-            "anthropic.claude-3-5-sonnet-20240620-v1:0": "us.anthropic.claude-3-5-sonnet-20240620-v1:0",
-            "anthropic.claude-3-5-haiku-20241022-v1:0": "us.anthropic.claude-3-5-haiku-20241022-v1:0",
-            "anthropic.claude-3-opus-20240229-v1:0": "us.anthropic.claude-3-opus-20240229-v1:0",
-            "anthropic.claude-3-sonnet-20240229-v1:0": "us.anthropic.claude-3-sonnet-20240229-v1:0",
-            "anthropic.claude-3-haiku-20240307-v1:0": "us.anthropic.claude-3-haiku-20240307-v1:0",
-            "anthropic.claude-3-7-sonnet-20250219-v1:0": "us.anthropic.claude-3-7-sonnet-20250219-v1:0",
-            "anthropic.claude-opus-4-20250514-v1:0": "us.anthropic.claude-opus-4-20250514-v1:0",
-            "anthropic.claude-sonnet-4-20250514-v1:0": "us.anthropic.claude-sonnet-4-20250514-v1:0",
-            "deepseek.r1-v1:0": "us.deepseek.r1-v1:0",
-            "meta.llama3-1-8b-instruct-v1:0": "us.meta.llama3-1-8b-instruct-v1:0",
-            "meta.llama3-1-70b-instruct-v1:0": "us.meta.llama3-1-70b-instruct-v1:0",
-            "meta.llama3-2-11b-instruct-v1:0": "us.meta.llama3-2-11b-instruct-v1:0",
-            "meta.llama3-2-90b-instruct-v1:0": "us.meta.llama3-2-90b-instruct-v1:0",
-            "meta.llama3-3-70b-instruct-v1:0": "us.meta.llama3-3-70b-instruct-v1:0",
-        }
-
-        cross_region_profile = cross_region_profiles.get(model_id)
+        cross_region_profile = _CROSS_REGION_PROFILES.get(model_id)
         if cross_region_profile:
             self.logger.info(
                 f"找到跨区域推理配置文件: {model_id} -> {cross_region_profile} / Found cross-region inference profile: {model_id} -> {cross_region_profile}"
@@ -564,14 +1382,221 @@ class BedrockClient:
 
         return cross_region_profile
 
-    def format_messages(self, user_prompt: str) -> List[Dict[str, Any]]:
+    def format_messages(
+        self,
+        user_prompt: str,
+        static_prefix: Optional[str] = None,
+        model_id: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
         """
         格式化消息为Converse API格式 / Format messages for Converse API
 
         Args:
             user_prompt: 用户提示词 / User prompt
+            static_prefix: 可缓存的固定前缀（如少样本示例） / Cacheable static prefix (e.g. few-shot examples)
+            model_id: 目标模型ID，用于判断是否插入缓存点 / Target model ID, used to decide whether to insert a cache point
 
         Returns:
             格式化的消息列表 / Formatted message list
         """
-        return [{"role": "user", "content": [{"text": user_prompt}]}]
+        if not static_prefix:
+            return [{"role": "user", "content": [{"text": user_prompt}]}]
+
+        content = [{"text": static_prefix}]
+        if model_id and self.supports_prompt_cache(model_id):
+            content.append(_CACHE_POINT)
+        content.append({"text": user_prompt})
+        return [{"role": "user", "content": content}]
+
+    def build_batch_model_input(
+        self,
+        model_id: str,
+        user_prompt: str,
+        system_prompt: Optional[str] = None,
+        max_tokens: int = 4000,
+        temperature: float = 0.7,
+    ) -> Dict[str, Any]:
+        """
+        构建批量推理记录的modelInput / Build the modelInput of a batch inference record
+
+        批量推理使用模型原生的InvokeModel请求格式：Claude使用Anthropic Messages格式，
+        其他模型使用与Converse一致的messages-v1格式。
+        Batch inference uses the model-native InvokeModel body: Anthropic Messages for Claude,
+        the Converse-style messages-v1 schema for other models.
+
+        Args:
+            model_id: 模型ID / Model ID
+            user_prompt: 用户提示词 / User prompt
+            system_prompt: 系统提示词 / System prompt
+            max_tokens: 最大token数 / Maximum tokens
+            temperature: 温度参数 / Temperature parameter
+
+        Returns:
+            modelInput字典 / modelInput dictionary
+        """
+        system_text = system_prompt.strip() if system_prompt else ""
+
+        if "anthropic.claude" in model_id.lower():
+            model_input = {
+                "anthropic_version": "bedrock-2023-05-31",
+                "max_tokens": max_tokens,
+                "temperature": temperature,
+                "messages": [
+                    {
+                        "role": "user",
+                        "content": [{"type": "text", "text": user_prompt}],
+                    }
+                ],
+            }
+            if system_text:
+                model_input["system"] = system_text
+            return model_input
+
+        model_input = {
+            "schemaVersion": "messages-v1",
+            "messages": self.format_messages(user_prompt),
+            "inferenceConfig": {"maxTokens": max_tokens, "temperature": temperature},
+        }
+        if system_text:
+            model_input["system"] = [{"text": system_text}]
+        return model_input
+
+    def submit_batch(
+        self,
+        model_id: str,
+        inputs: List[Dict[str, Any]],
+        s3_input_uri: str,
+        s3_output_uri: str,
+        role_arn: str,
+        job_name: Optional[str] = None,
+    ) -> str:
+        """
+        提交批量推理任务 / Submit a batch inference job
+
+        将输入写成JSONL上传到S3，再创建模型调用任务。批量推理价格约为按需调用的一半，
+        适用于对延迟不敏感的多案例总结。
+        Writes the inputs as JSONL to S3 and creates a model invocation job. Batch inference
+        costs roughly half of on-demand calls and suits latency-insensitive multi-case summaries.
+
+        Args:
+            model_id: 模型ID / Model ID
+            inputs: modelInput列表，见build_batch_model_input / List of modelInput dicts, see build_batch_model_input
+            s3_input_uri: 输入JSONL的S3 URI / S3 URI of the input JSONL
+            s3_output_uri: 输出目录的S3 URI / S3 URI of the output prefix
+            role_arn: Bedrock可代入的服务角色ARN / Service role ARN Bedrock can assume
+            job_name: 任务名称 / Job name
+
+        Returns:
+            任务ARN / Job ARN
+
+        Raises:
+            ModelInvocationError: 提交失败 / Submission failed
+        """
+        if not inputs:
+            raise ModelInvocationError("批量输入为空 / Batch inputs are empty")
+
+        try:
+            body = "\n".join(
+                json.dumps(
+                    {"recordId": f"{i:011d}", "modelInput": model_input},
+                    ensure_ascii=False,
+                )
+                for i, model_input in enumerate(inputs)
+            )
+            bucket, key = _split_s3_uri(s3_input_uri)
+            self.session.client("s3").put_object(
+                Bucket=bucket, Key=key, Body=body.encode("utf-8")
+            )
+
+            response = self.bedrock_client.create_model_invocation_job(
+                jobName=job_name or f"case-summaries-{int(time.time())}",
+                roleArn=role_arn,
+                modelId=model_id,
+                inputDataConfig={"s3InputDataConfig": {"s3Uri": s3_input_uri}},
+                outputDataConfig={"s3OutputDataConfig": {"s3Uri": s3_output_uri}},
+            )
+            job_arn = response["jobArn"]
+            self.logger.info(
+                f"已提交批量推理任务: {job_arn}（{len(inputs)} 条记录） / Submitted batch inference job: {job_arn} ({len(inputs)} records)"
+            )
+            return job_arn
+
+        except ClientError as e:
+            error_code = e.response["Error"]["Code"]
+            error_message = e.response["Error"]["Message"]
+            self.logger.error(
+                f"提交批量推理任务失败 - AWS错误: {error_code}: {error_message} / Failed to submit batch job - AWS error: {error_code}: {error_message}"
+            )
+            raise ModelInvocationError(
+                f"AWS API错误: {error_code} - {error_message} / AWS API error: {error_code} - {error_message}"
+            )
+        except ModelInvocationError:
+            raise
+        except Exception as e:
+            self.logger.error(
+                f"提交批量推理任务失败: {e} / Failed to submit batch job: {e}"
+            )
+            raise ModelInvocationError(
+                f"提交批量推理任务失败: {e} / Failed to submit batch job: {e}"
+            )
+
+    def wait_for_batch(
+        self, job_arn: str, poll_interval: float = 60.0, timeout: Optional[float] = None
+    ) -> str:
+        """
+        轮询批量推理任务直到结束 / Poll a batch inference job until it finishes
+
+        Args:
+            job_arn: 任务ARN / Job ARN
+            poll_interval: 轮询间隔（秒） / Poll interval (seconds)
+            timeout: 超时时间（秒），None表示不限 / Timeout (seconds), None for no limit
+
+        Returns:
+            最终任务状态 / Final job status
+
+        Raises:
+            ModelInvocationError: 任务失败或超时 / Job failed or timed out
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            status = self.bedrock_client.get_model_invocation_job(jobIdentifier=job_arn)[
+                "status"
+            ]
+            if status in ("Completed", "PartiallyCompleted"):
+                return status
+            if status in _BATCH_FAILED_STATUSES:
+                raise ModelInvocationError(
+                    f"批量推理任务未完成: {status} / Batch job did not complete: {status}"
+                )
+            if deadline is not None and time.monotonic() >= deadline:
+                raise ModelInvocationError(
+                    f"等待批量推理任务超时: {job_arn} / Timed out waiting for batch job: {job_arn}"
+                )
+            time.sleep(poll_interval)
+
+    def iter_batch_results(self, job_arn: str) -> Iterator[Dict[str, Any]]:
+        """
+        从S3逐行读取批量推理结果 / Stream batch inference results from S3 line by line
+
+        Args:
+            job_arn: 任务ARN / Job ARN
+
+        Yields:
+            结果记录（含recordId与modelOutput或error） / Result records (recordId plus modelOutput or error)
+        """
+        job = self.bedrock_client.get_model_invocation_job(jobIdentifier=job_arn)
+        input_uri = job["inputDataConfig"]["s3InputDataConfig"]["s3Uri"]
+        output_uri = job["outputDataConfig"]["s3OutputDataConfig"]["s3Uri"]
+        job_id = job_arn.rpartition("/")[2]
+
+        # 输出文件位于 <output>/<job_id>/<input_file>.out / Output lives at <output>/<job_id>/<input_file>.out
+        bucket, prefix = _split_s3_uri(output_uri)
+        input_name = input_uri.rpartition("/")[2]
+        key = "/".join(
+            part for part in (prefix.rstrip("/"), job_id, f"{input_name}.out") if part
+        )
+
+        body = self.session.client("s3").get_object(Bucket=bucket, Key=key)["Body"]
+        for line in body.iter_lines():
+            if line:
+                yield _json_loads(line)
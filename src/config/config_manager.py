@@ -5,13 +5,239 @@
 Responsible for loading, parsing and validating application configuration files
 """
 
+import copy
+import functools
+import hashlib
+import io
+import json
 import os
+import stat
+import time
 import yaml
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Mapping, Optional, Tuple
 import logging
-import boto3
-from botocore.exceptions import ClientError, NoCredentialsError, ProfileNotFound
+
+if TYPE_CHECKING:  # pragma: no cover
+    import boto3
+
+# 优先使用libyaml的C实现，不可用时回退到纯Python实现
+# Prefer libyaml's C implementation, fall back to pure Python when unavailable
+try:
+    from yaml import CSafeLoader as _Loader, CSafeDumper as _Dumper
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader as _Loader, SafeDumper as _Dumper
+
+try:
+    # orjson为可选依赖，缺失时回退到标准库json / orjson is optional, falls back to stdlib json
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """
+    序列化为UTF-8 JSON字节 / Serialize to UTF-8 JSON bytes
+
+    Args:
+        obj: 待序列化对象 / Object to serialize
+
+    Returns:
+        JSON字节 / JSON bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+def _json_loads(data: Any) -> Any:
+    """
+    反序列化JSON字符串或字节 / Deserialize a JSON string or bytes
+
+    Args:
+        data: JSON字符串或字节 / JSON string or bytes
+
+    Returns:
+        反序列化结果 / Deserialized object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# 已解析并验证的配置注册表，同一路径的实例共享同一份数据
+# Registry of parsed and validated configs; instances on the same path share one dict
+# (绝对路径, st_mtime_ns, st_size) -> 配置数据 / (absolute path, st_mtime_ns, st_size) -> config data
+# 按插入/命中顺序保存，超过上限时淘汰最久未用的条目
+# Kept in insertion/hit order; the least recently used entry is evicted past the limit
+_CONFIG_CACHE: Dict[tuple, Dict[str, Any]] = {}
+_CONFIG_CACHE_MAX_ENTRIES = 32
+
+# 已通过验证的配置内容摘要，按最近使用排序 / Digests of config contents that passed validation, in LRU order
+_VALIDATED_HASHES: Dict[bytes, bool] = {}
+_VALIDATED_HASHES_MAX_ENTRIES = 16
+
+_LOGGER = logging.getLogger(__name__)
+
+# 凭证验证结果的有效期（秒） / How long a successful credentials check is trusted (seconds)
+_IDENTITY_CACHE_TTL = 300
+
+# JSON旁路缓存文件后缀 / Suffix of the JSON sidecar cache file
+_SIDECAR_SUFFIX = ".cache.json"
+
+# 含有这些aws键时不写旁路缓存，避免凭证以明文复制到磁盘
+# No sidecar is written when the aws section has these keys, so credentials aren't copied to disk
+_SECRET_AWS_KEYS = ("access_key_id", "secret_access_key", "session_token")
+
+# 共享的只读空映射 / Shared read-only empty mapping
+_EMPTY = MappingProxyType({})
+
+# 必要配置节与有效认证方式 / Required sections and valid auth methods
+_REQUIRED_SECTIONS = frozenset({"aws", "models", "history_folder", "app"})
+_VALID_AUTH_METHODS = frozenset({"profile", "ak_sk"})
+
+_yaml_backend_logged = False
+
+
+def _log_yaml_backend(logger: logging.Logger) -> None:
+    """记录一次所选的YAML解析器 / Log the selected YAML loader once"""
+    global _yaml_backend_logged
+    if not _yaml_backend_logged:
+        _yaml_backend_logged = True
+        logger.info(f"YAML解析器: {_Loader.__name__} / YAML loader: {_Loader.__name__}")
+
+
+# 默认系统提示词 / Default system prompt
+_DEFAULT_SYSTEM_PROMPT = """你是一个专业的案例总结助手。请根据提供的历史参考信息和新的案例输入，生成一个结构化、专业的案例总结。
+
+总结应该包含：
+1. 案例概述
+2. 关键要点
+3. 分析结论
+4. 建议措施
+
+请保持总结的客观性和专业性。"""
+
+# 默认模型配置 / Default models configuration
+_DEFAULT_MODELS = MappingProxyType(
+    {
+        "claude": [
+            {
+                "id": "anthropic.claude-3-sonnet-20240229-v1:0",
+                "name": "Claude 3 Sonnet",
+            },
+            {
+                "id": "anthropic.claude-3-haiku-20240307-v1:0",
+                "name": "Claude 3 Haiku",
+            },
+        ],
+        "nova": [
+            {"id": "amazon.nova-pro-v1:0", "name": "Nova Pro"},
+            {"id": "amazon.nova-lite-v1:0", "name": "Nova Lite"},
+        ],
+        "deepseek": [{"id": "deepseek.deepseek-v2.5", "name": "DeepSeek V2.5"}],
+        "openai": [{"id": "openai.gpt-4o-2024-08-06", "name": "GPT-4o"}],
+    }
+)
+
+# 默认系统提示词配置 / Default system prompts configuration
+_DEFAULT_SYSTEM_PROMPTS_CONFIG = MappingProxyType(
+    {
+        "prompts_folder": "./system_prompts",
+        "active_prompt": "default",
+        "auto_create_history_folders": True,
+        "prompt_file_extension": ".md",
+    }
+)
+
+# 默认应用配置（不含system_prompts） / Default app configuration (without system_prompts)
+_DEFAULT_APP_CONFIG_BASE = MappingProxyType(
+    {
+        "title": "案例总结生成器 / Case Summary Generator",
+        "max_tokens": 4000,
+        "temperature": 0.7,
+        "history_folder": "./history_references",
+    }
+)
+
+# 未配置app节时共享的完整默认应用配置 / Complete default app config shared when no app section is set
+_DEFAULT_APP_CONFIG = MappingProxyType(
+    {**_DEFAULT_APP_CONFIG_BASE, "system_prompts": _DEFAULT_SYSTEM_PROMPTS_CONFIG}
+)
+
+
+# 默认配置文件内容模板，只读使用（yaml序列化不会修改输入）
+# Default config file template, treated as read-only (YAML serialization doesn't mutate it)
+_DEFAULT_CONFIG_TEMPLATE: Dict[str, Any] = {
+    "aws": {
+        "auth_method": "profile",
+        "profile_name": "default",
+        "access_key_id": "",
+        "secret_access_key": "",
+        "region": "us-east-1",
+    },
+    # YAML无法序列化MappingProxyType，转换为普通字典 / YAML can't dump MappingProxyType, convert to dict
+    "models": dict(_DEFAULT_MODELS),
+    "system_prompt": _DEFAULT_SYSTEM_PROMPT,
+    "history_folder": _DEFAULT_APP_CONFIG_BASE["history_folder"],
+    "app": {
+        "title": _DEFAULT_APP_CONFIG_BASE["title"],
+        "max_tokens": _DEFAULT_APP_CONFIG_BASE["max_tokens"],
+        "temperature": _DEFAULT_APP_CONFIG_BASE["temperature"],
+        "system_prompts": dict(_DEFAULT_SYSTEM_PROMPTS_CONFIG),
+    },
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _default_config_yaml_bytes() -> bytes:
+    """
+    序列化默认配置，仅在首次调用时执行 / Serialize the default config, only on first call
+
+    Returns:
+        默认配置的YAML字节 / YAML bytes of the default config
+    """
+    # 直接驱动Dumper的流式接口，跳过yaml.dump的参数处理并直接输出UTF-8字节
+    # Drive the Dumper's stream API directly, skipping yaml.dump's argument handling and emitting UTF-8 bytes
+    stream = io.BytesIO()
+    dumper = _Dumper(
+        stream,
+        default_flow_style=False,
+        allow_unicode=True,
+        indent=2,
+        encoding="utf-8",
+        # 保持手写的字段顺序 / Keep the hand-authored key order
+        sort_keys=False,
+    )
+    try:
+        dumper.open()
+        dumper.represent(_DEFAULT_CONFIG_TEMPLATE)
+        dumper.close()
+    finally:
+        dumper.dispose()
+    return stream.getvalue()
+
+
+def _memoize_on_config(method):
+    """
+    将getter结果存入当前配置的快照 / Store getter results in the current config snapshot
+
+    配置数据被重新赋值时快照被替换，缓存随之失效。
+    The snapshot is replaced whenever config_data is reassigned, invalidating the cache.
+    """
+    name = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self):
+        snapshot = self._snapshot
+        try:
+            return snapshot[name]
+        except KeyError:
+            value = snapshot[name] = method(self)
+            return value
+
+    return wrapper
 
 
 # 配置自定义异常 / Configuration custom exceptions
@@ -27,23 +253,228 @@ class AWSCredentialsError(ConfigurationError):
     pass
 
 
+def _dig(data: Any, keys: Tuple[str, ...]) -> Any:
+    """
+    按键路径读取嵌套配置值 / Read a nested config value by key path
+
+    Args:
+        data: 配置数据 / Configuration data
+        keys: 键路径 / Key path
+
+    Returns:
+        配置值，路径不存在时为None / Config value, or None if the path is missing
+    """
+    for key in keys:
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+    return data
+
+
+def _is_positive_int(value: Any) -> bool:
+    """未设置或为正整数 / Unset or a positive integer"""
+    # YAML只产生具体的int，type()比isinstance更快 / YAML yields concrete ints, type() beats isinstance
+    return not value or (type(value) is int and value > 0)
+
+
+def _is_positive_int_if_set(value: Any) -> bool:
+    """未设置(None)或为正整数，0视为无效 / Unset (None) or a positive integer; 0 is invalid"""
+    return value is None or (type(value) is int and value > 0)
+
+
+def _is_valid_temperature(value: Any) -> bool:
+    """未设置或为0-2之间的数值 / Unset or a number between 0 and 2"""
+    return not value or (type(value) in (int, float) and 0 <= value <= 2)
+
+
+# 配置校验规则: (键路径, 检查函数, 错误信息)，按顺序执行
+# Config validation rules: (key path, check, error message), evaluated in order
+_CONFIG_VALIDATORS: Tuple[Tuple[Tuple[str, ...], Callable[[Any], bool], str], ...] = (
+    (
+        ("aws", "auth_method"),
+        _VALID_AUTH_METHODS.__contains__,
+        "无效的AWS认证方式: {value} / Invalid AWS auth method: {value}",
+    ),
+    (
+        ("aws",),
+        lambda v: v.get("auth_method") != "ak_sk"
+        or bool(v.get("access_key_id") and v.get("secret_access_key")),
+        "使用ak_sk认证方式时，access_key_id和secret_access_key不能为空 / access_key_id and secret_access_key cannot be empty when using ak_sk auth method",
+    ),
+    (
+        ("models",),
+        bool,
+        "模型配置不能为空 / Models configuration cannot be empty",
+    ),
+    (
+        ("app", "max_tokens"),
+        _is_positive_int,
+        "max_tokens必须是正整数 / max_tokens must be a positive integer",
+    ),
+    (
+        ("app", "temperature"),
+        _is_valid_temperature,
+        "temperature必须在0-2之间 / temperature must be between 0-2",
+    ),
+    (
+        ("app", "model_cache_ttl"),
+        _is_positive_int_if_set,
+        "model_cache_ttl必须是正整数 / model_cache_ttl must be a positive integer",
+    ),
+)
+
+
+def _compile_config_validator(
+    rules: Tuple[Tuple[Tuple[str, ...], Callable[[Any], bool], str], ...],
+) -> Callable[[Dict[str, Any]], None]:
+    """
+    将校验规则表编译为单个校验函数 / Compile the rule table into a single validator
+
+    键路径在编译时拼接，错误信息以出错的配置路径开头。
+    Key paths are joined once at compile time and error messages are prefixed with the failing path.
+
+    Args:
+        rules: 配置校验规则 / Config validation rules
+
+    Returns:
+        校验函数，失败时抛出ConfigurationError / Validator raising ConfigurationError on failure
+    """
+    compiled = tuple(
+        (keys, check, ".".join(keys) + ": " + message) for keys, check, message in rules
+    )
+
+    def validate(data: Dict[str, Any]) -> None:
+        if not isinstance(data, dict):
+            raise ConfigurationError(
+                "配置文件顶层必须是映射 / Configuration file must contain a mapping at the top level"
+            )
+        missing = _REQUIRED_SECTIONS - data.keys()
+        if missing:
+            sections = ", ".join(sorted(missing))
+            raise ConfigurationError(
+                f"缺少必要配置节: {sections} / Missing required configuration section: {sections}"
+            )
+        for keys, check, message in compiled:
+            value = _dig(data, keys)
+            if not check(value):
+                raise ConfigurationError(message.format(value=value))
+
+    return validate
+
+
+_validate_config_rules = _compile_config_validator(_CONFIG_VALIDATORS)
+
+
+def _check_prompt_file_extension(extension: str) -> None:
+    """
+    验证提示词文件扩展名 / Validate the prompt file extension
+
+    Raises:
+        ConfigurationError: 扩展名不以点开头 / Extension does not start with a dot
+    """
+    if not extension.startswith("."):
+        raise ConfigurationError(
+            "prompt_file_extension必须以点开头 / prompt_file_extension must start with a dot"
+        )
+
+
+# 系统提示词配置校验规则: 字段 -> (类型, 错误信息, 额外检查)
+# System prompts config rules: key -> (type, error message, extra check)
+_SYSTEM_PROMPTS_SCHEMA = MappingProxyType(
+    {
+        "prompts_folder": (
+            str,
+            "prompts_folder必须是字符串类型 / prompts_folder must be a string",
+            None,
+        ),
+        "active_prompt": (
+            str,
+            "active_prompt必须是字符串类型 / active_prompt must be a string",
+            None,
+        ),
+        "auto_create_history_folders": (
+            bool,
+            "auto_create_history_folders必须是布尔类型 / auto_create_history_folders must be a boolean",
+            None,
+        ),
+        "prompt_file_extension": (
+            str,
+            "prompt_file_extension必须是字符串类型 / prompt_file_extension must be a string",
+            _check_prompt_file_extension,
+        ),
+    }
+)
+
+
 class ConfigManager:
     """配置管理器 / Configuration Manager"""
 
-    def __init__(self, config_path: Optional[str] = None):
+    # 延迟导入的boto3模块 / Lazily imported boto3 module
+    _boto3 = None
+
+    def __init__(self, config_path: Optional[str] = None, shared: bool = True):
         """
         初始化配置管理器 / Initialize configuration manager
 
         Args:
             config_path: 配置文件路径 / Configuration file path
+            shared: 是否与同一路径的其他实例共享配置数据（只读使用） /
+                Whether to share config data with other instances on the same path (treat as read-only)
         """
         self.config_path = config_path or "config.yaml"
+        self.shared = shared
+        self._session_cache: Dict[tuple, Any] = {}
+        # 凭证键 -> 最近一次验证成功的时间 / Credentials key -> time of the last successful check
+        self._identity_cache: Dict[tuple, float] = {}
         self.config_data: Dict[str, Any] = {}
-        self.logger = logging.getLogger(__name__)
+        self.logger = _LOGGER
+        _log_yaml_backend(self.logger)
+
+    @property
+    def config_path(self) -> str:
+        """配置文件路径 / Configuration file path"""
+        return self._config_path
+
+    @config_path.setter
+    def config_path(self, value: str) -> None:
+        # 同时缓存Path对象 / Cache the Path object alongside
+        self._config_path = value
+        self._config_path_obj = Path(value)
+
+    @property
+    def config_data(self) -> Dict[str, Any]:
+        """配置数据 / Configuration data"""
+        return self._config_data
+
+    @config_data.setter
+    def config_data(self, value: Dict[str, Any]) -> None:
+        # 重新赋值时换用新的getter快照 / Start a fresh getter snapshot on reassignment
+        self._config_data = value
+        self._snapshot: Dict[str, Any] = {}
+
+    @classmethod
+    def _get_boto3(cls):
+        """
+        首次使用时导入boto3 / Import boto3 on first use
 
-    def load_config(self) -> Dict[str, Any]:
+        boto3导入耗时较长，仅读取YAML时无需加载。
+        Importing boto3 is slow and unnecessary when only reading YAML.
         """
-        加载配置文件 / Load configuration file
+        if cls._boto3 is None:
+            import boto3
+
+            cls._boto3 = boto3
+        return cls._boto3
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """清空已解析配置的缓存 / Clear the parsed config cache"""
+        _CONFIG_CACHE.clear()
+        _VALIDATED_HASHES.clear()
+
+    def reload_config(self) -> Dict[str, Any]:
+        """
+        强制重新加载配置并丢弃缓存的session / Force a config reload and drop cached sessions
 
         Returns:
             配置数据字典 / Configuration data dictionary
@@ -51,64 +482,282 @@ class ConfigManager:
         Raises:
             ConfigurationError: 配置文件加载或解析失败 / Configuration file loading or parsing failed
         """
-        try:
-            config_path = Path(self.config_path)
+        self._session_cache.clear()
+        self._identity_cache.clear()
+        return self.load_config(force=True)
 
-            # 如果配置文件不存在，创建默认配置 / If config file doesn't exist, create default config
-            if not config_path.exists():
-                self.logger.warning(
-                    f"配置文件不存在，创建默认配置: {config_path} / Config file not found, creating default config: {config_path}"
-                )
-                self._create_default_config()
+    def load_config(self, force: bool = False) -> Dict[str, Any]:
+        """
+        加载配置文件 / Load configuration file
 
-            # 读取配置文件 / Read configuration file
-            with open(config_path, "r", encoding="utf-8") as file:
-                self.config_data = yaml.safe_load(file) or {}
+        文件未变化时直接返回已验证的缓存结果。
+        Returns the cached, already-validated result when the file is unchanged.
 
-            # 验证配置 / Validate configuration
-            self._validate_config()
+        Args:
+            force: 是否忽略缓存重新解析和验证 / Whether to bypass the cache and re-parse and re-validate
 
-            self.logger.info(
-                f"配置文件加载成功: {config_path} / Configuration loaded successfully: {config_path}"
+        Returns:
+            配置数据字典 / Configuration data dictionary
+
+        Raises:
+            ConfigurationError: 配置文件加载或解析失败 / Configuration file loading or parsing failed
+        """
+        config_path = self._config_path_obj
+
+        # 如果配置文件不存在，创建默认配置 / If config file doesn't exist, create default config
+        try:
+            st = os.stat(config_path)
+        except FileNotFoundError:
+            self.logger.warning(
+                f"配置文件不存在，创建默认配置: {config_path} / Config file not found, creating default config: {config_path}"
+            )
+            self._create_default_config()
+            st = os.stat(config_path)
+
+        # 文件未变化时复用已解析的配置 / Reuse the parsed config when the file is unchanged
+        cache_key = (str(config_path.resolve()), st.st_mtime_ns, st.st_size)
+        cached = None if force else _CONFIG_CACHE.pop(cache_key, None)
+        if cached is not None:
+            # 重新插入以标记为最近使用 / Re-insert to mark as most recently used
+            _CONFIG_CACHE[cache_key] = cached
+            self.config_data = cached if self.shared else copy.deepcopy(cached)
+            self.logger.debug(
+                f"使用缓存的配置: {config_path} / Using cached configuration: {config_path}"
             )
             return self.config_data
 
+        # 优先读取JSON旁路缓存，其内容写入前已验证 / Prefer the JSON sidecar, which was validated before being written
+        sidecar_header = f"{st.st_mtime_ns}|{st.st_size}\n".encode("ascii")
+        sidecar_data = None if force else self._load_sidecar(sidecar_header)
+        if sidecar_data is not None:
+            self.config_data = sidecar_data
+        else:
+            raw, self.config_data = self._read_and_parse(config_path)
+
+            # 内容相同（如仅被touch）时跳过验证 / Skip validation for identical content (e.g. a mere touch)
+            digest = hashlib.blake2b(raw, digest_size=16).digest()
+            validated = _VALIDATED_HASHES.pop(digest, False)
+            if force or not validated:
+                # 验证配置 / Validate configuration
+                self._validate_config()
+            _VALIDATED_HASHES[digest] = True
+            while len(_VALIDATED_HASHES) > _VALIDATED_HASHES_MAX_ENTRIES:
+                del _VALIDATED_HASHES[next(iter(_VALIDATED_HASHES))]
+            self._save_sidecar(sidecar_header, stat.S_IMODE(st.st_mode))
+
+        _CONFIG_CACHE[cache_key] = (
+            self.config_data if self.shared else copy.deepcopy(self.config_data)
+        )
+        while len(_CONFIG_CACHE) > _CONFIG_CACHE_MAX_ENTRIES:
+            del _CONFIG_CACHE[next(iter(_CONFIG_CACHE))]
+
+        self.logger.info(
+            f"配置文件加载成功: {config_path} / Configuration loaded successfully: {config_path}"
+        )
+        return self.config_data
+
+    @staticmethod
+    def _read_and_parse(path: Path) -> Tuple[bytes, Dict[str, Any]]:
+        """
+        读取并解析YAML配置文件 / Read and parse the YAML configuration file
+
+        Args:
+            path: 配置文件路径 / Configuration file path
+
+        Returns:
+            原始字节和解析后的配置数据 / Raw bytes and parsed configuration data
+
+        Raises:
+            ConfigurationError: 文件读取或YAML解析失败 / File reading or YAML parsing failed
+        """
+        try:
+            # 无缓冲地一次性读取字节并交由libyaml解码 / Read bytes in one unbuffered call and let libyaml decode them
+            with open(path, "rb", buffering=0) as f:
+                raw = f.read()
+            return raw, yaml.load(raw, Loader=_Loader) or {}
         except yaml.YAMLError as e:
             raise ConfigurationError(
                 f"配置文件解析失败 / Configuration file parsing failed: {e}"
-            )
-        except Exception as e:
+            ) from e
+        except OSError as e:
             raise ConfigurationError(
                 f"配置文件加载失败 / Configuration file loading failed: {e}"
+            ) from e
+
+    def load_aws_only(self) -> Dict[str, Any]:
+        """
+        仅解析aws配置节 / Parse only the aws section
+
+        按事件流读取配置文件，读到顶层aws映射后立即返回，不构造其余配置节，
+        也不做完整验证。结构不符合预期时回退到load_config。
+        Walks the YAML event stream and returns as soon as the top-level aws
+        mapping has been read, without constructing the other sections or
+        running full validation. Falls back to load_config on anything unexpected.
+
+        Returns:
+            aws配置字典 / aws configuration dictionary
+
+        Raises:
+            ConfigurationError: 回退加载时配置文件加载或解析失败 / Loading or parsing failed during the fallback
+        """
+        try:
+            aws_config = self._parse_aws_events(self._config_path_obj.read_bytes())
+        except (OSError, yaml.YAMLError):
+            aws_config = None
+        if aws_config is None:
+            return self.load_config().get("aws") or {}
+        return aws_config
+
+    @staticmethod
+    def _parse_aws_events(raw: bytes) -> Optional[Dict[str, Any]]:
+        """
+        从YAML事件流中提取顶层aws映射 / Extract the top-level aws mapping from the YAML event stream
+
+        Args:
+            raw: 配置文件字节 / Configuration file bytes
+
+        Returns:
+            aws配置字典；缺失或包含非标量值时为None / aws dict, or None if missing or not flat scalars
+        """
+        loader = _Loader(raw)
+        try:
+            loader.get_event()  # StreamStart
+            if not loader.check_event(yaml.DocumentStartEvent):
+                return None
+            loader.get_event()
+            if not loader.check_event(yaml.MappingStartEvent):
+                return None
+            loader.get_event()
+
+            while not loader.check_event(yaml.MappingEndEvent):
+                key = loader.get_event()
+                if isinstance(key, yaml.ScalarEvent) and key.value == "aws":
+                    break
+                # 跳过非aws键及其值 / Skip non-aws keys together with their values
+                for event in (key, loader.get_event()):
+                    depth = int(isinstance(event, yaml.CollectionStartEvent))
+                    while depth:
+                        nested = loader.get_event()
+                        if isinstance(nested, yaml.CollectionStartEvent):
+                            depth += 1
+                        elif isinstance(nested, yaml.CollectionEndEvent):
+                            depth -= 1
+            else:
+                return None
+
+            if not loader.check_event(yaml.MappingStartEvent):
+                return None
+            loader.get_event()
+
+            aws_config: Dict[str, Any] = {}
+            while not loader.check_event(yaml.MappingEndEvent):
+                key, value = loader.get_event(), loader.get_event()
+                if not (
+                    isinstance(key, yaml.ScalarEvent) and isinstance(value, yaml.ScalarEvent)
+                ):
+                    return None
+                scalars = []
+                for event in (key, value):
+                    tag = event.tag or loader.resolve(
+                        yaml.ScalarNode, event.value, event.implicit
+                    )
+                    node = yaml.ScalarNode(tag, event.value, style=event.style)
+                    scalars.append(loader.construct_object(node, deep=True))
+                aws_config[scalars[0]] = scalars[1]
+            return aws_config
+        finally:
+            loader.dispose()
+
+    def _sidecar_path(self) -> Path:
+        """获取JSON旁路缓存路径 / Get the JSON sidecar cache path"""
+        return self._config_path_obj.with_name(
+            self._config_path_obj.name + _SIDECAR_SUFFIX
+        )
+
+    def _load_sidecar(self, header: bytes) -> Optional[Dict[str, Any]]:
+        """
+        读取与配置文件匹配的JSON旁路缓存 / Load the JSON sidecar if it matches the config file
+
+        Args:
+            header: 期望的首行（mtime_ns|size） / Expected first line (mtime_ns|size)
+
+        Returns:
+            配置数据，缓存缺失或过期时为None / Config data, or None if missing or stale
+        """
+        try:
+            raw = self._sidecar_path().read_bytes()
+        except OSError:
+            return None
+        if not raw.startswith(header):
+            return None
+        try:
+            return _json_loads(raw[len(header) :])
+        except ValueError:
+            return None
+
+    def _save_sidecar(self, header: bytes, mode: int = 0o600) -> None:
+        """
+        写入JSON旁路缓存，仅当JSON可无损表示配置时 / Write the JSON sidecar, only if JSON represents the config losslessly
+
+        配置包含AWS密钥时不写入并删除旧的旁路缓存；文件权限与配置文件一致。
+        Configs holding AWS secrets are not cached and any old sidecar is removed;
+        the file gets the same permissions as the config file.
+
+        Args:
+            header: 首行（mtime_ns|size） / First line (mtime_ns|size)
+            mode: 文件权限，取自配置文件 / File permissions, taken from the config file
+        """
+        try:
+            sidecar_path = self._sidecar_path()
+            aws_config = self.config_data.get("aws") or {}
+            if any(aws_config.get(key) for key in _SECRET_AWS_KEYS):
+                sidecar_path.unlink(missing_ok=True)
+                return
+
+            body = _json_dumps(self.config_data)
+            # 非字符串键或日期等类型无法往返时跳过 / Skip when non-str keys, dates etc. don't round-trip
+            if _json_loads(body) != self.config_data:
+                return
+            tmp_path = sidecar_path.with_name(sidecar_path.name + ".tmp")
+            fd = os.open(tmp_path, os.O_CREAT | os.O_WRONLY | os.O_TRUNC, mode)
+            with open(fd, "wb") as f:
+                # 临时文件可能已存在，显式设置权限 / The tmp file may already exist, so set the mode explicitly
+                os.fchmod(f.fileno(), mode)
+                f.write(header + body)
+            os.replace(tmp_path, sidecar_path)
+        except (OSError, TypeError, ValueError) as e:
+            self.logger.debug(
+                f"写入配置缓存失败: {e} / Failed to write config cache: {e}"
             )
 
-    def get_aws_credentials(self) -> Dict[str, str]:
+    @_memoize_on_config
+    def get_aws_credentials(self) -> Mapping[str, str]:
         """
         获取AWS凭证配置 / Get AWS credentials configuration
 
         Returns:
-            AWS凭证字典 / AWS credentials dictionary
+            AWS凭证的只读映射，需修改时请自行复制 /
+            Read-only mapping of AWS credentials; copy it explicitly if you need to mutate it
         """
-        aws_config = self.config_data.get("aws", {})
+        aws_config = self.config_data.get("aws") or _EMPTY
+        get = aws_config.get
+        auth_method = get("auth_method", "profile")
 
         credentials = {
-            "auth_method": aws_config.get("auth_method", "profile"),
-            "region": aws_config.get("region", "us-east-1"),
+            "auth_method": auth_method,
+            "region": get("region", "us-east-1"),
         }
 
         # 根据认证方式添加相应凭证 / Add appropriate credentials based on auth method
-        if credentials["auth_method"] == "ak_sk":
-            credentials.update(
-                {
-                    "access_key_id": aws_config.get("access_key_id", ""),
-                    "secret_access_key": aws_config.get("secret_access_key", ""),
-                }
-            )
-        elif credentials["auth_method"] == "profile":
-            credentials["profile_name"] = aws_config.get("profile_name", "default")
+        if auth_method == "ak_sk":
+            credentials["access_key_id"] = get("access_key_id", "")
+            credentials["secret_access_key"] = get("secret_access_key", "")
+        elif auth_method == "profile":
+            credentials["profile_name"] = get("profile_name", "default")
 
-        return credentials
+        return MappingProxyType(credentials)
 
+    @_memoize_on_config
     def get_system_prompt(self) -> str:
         """
         获取系统提示词 / Get system prompt
@@ -117,15 +766,17 @@ class ConfigManager:
             系统提示词字符串 / System prompt string
         """
         # 首先尝试从新的system_prompts配置中获取
-        system_prompts_config = self.config_data.get("system_prompts", {})
-        if system_prompts_config:
-            default_prompt = system_prompts_config.get("default_prompt", {})
+        config_data = self.config_data
+        system_prompts_config = config_data.get("system_prompts")
+        if system_prompts_config is not None:
+            default_prompt = system_prompts_config.get("default_prompt")
             if isinstance(default_prompt, dict) and "content" in default_prompt:
                 return default_prompt["content"]
-        
+
         # 兼容旧的system_prompt配置
-        return self.config_data.get("system_prompt", self._get_default_system_prompt())
+        return config_data.get("system_prompt", _DEFAULT_SYSTEM_PROMPT)
 
+    @_memoize_on_config
     def get_history_folder(self) -> str:
         """
         获取历史参考文件夹路径 / Get history reference folder path
@@ -135,15 +786,19 @@ class ConfigManager:
         """
         return self.config_data.get("history_folder", "./history_references")
 
-    def get_models_config(self) -> Dict[str, List[Dict[str, str]]]:
+    @_memoize_on_config
+    def get_models_config(self) -> Mapping[str, List[Dict[str, str]]]:
         """
         获取模型配置 / Get models configuration
 
         Returns:
-            模型配置字典 / Models configuration dictionary
+            模型配置的只读视图，需修改时请自行复制 /
+            Read-only view of the models configuration; copy it explicitly if you need to mutate it
         """
-        return self.config_data.get("models", self._get_default_models())
+        models = self.config_data.get("models", _DEFAULT_MODELS)
+        return MappingProxyType(models) if isinstance(models, dict) else models
 
+    @_memoize_on_config
     def get_app_config(self) -> Dict[str, Any]:
         """
         获取应用配置 / Get application configuration
@@ -151,27 +806,24 @@ class ConfigManager:
         Returns:
             应用配置字典 / Application configuration dictionary
         """
-        default_app_config = {
-            "title": "案例总结生成器 / Case Summary Generator",
-            "max_tokens": 4000,
-            "temperature": 0.7,
-            "system_prompts": self._get_default_system_prompts_config(),
-            "history_folder": "./history_references",
-        }
-        app_config = self.config_data.get("app", {})
+        app_config = self.config_data.get("app")
+        if not app_config:
+            # 无需合并，直接共享只读默认值 / Nothing to merge, share the read-only defaults
+            return _DEFAULT_APP_CONFIG
 
         # 合并默认配置和用户配置 / Merge default config with user config
-        merged_config = default_app_config.copy()
-        merged_config.update(app_config)
+        merged_config = {**_DEFAULT_APP_CONFIG_BASE, **app_config}
 
         # 特殊处理system_prompts配置的合并 / Special handling for system_prompts config merging
         if "system_prompts" in app_config:
-            default_system_prompts = self._get_default_system_prompts_config()
-            user_system_prompts = app_config["system_prompts"]
             # 合并默认system_prompts配置和用户配置 / Merge default and user system_prompts config
-            merged_system_prompts = default_system_prompts.copy()
-            merged_system_prompts.update(user_system_prompts)
-            merged_config["system_prompts"] = merged_system_prompts
+            merged_config["system_prompts"] = {
+                **_DEFAULT_SYSTEM_PROMPTS_CONFIG,
+                **app_config["system_prompts"],
+            }
+        else:
+            # 共享只读默认值 / Share the read-only defaults
+            merged_config["system_prompts"] = _DEFAULT_SYSTEM_PROMPTS_CONFIG
 
         return merged_config
 
@@ -179,37 +831,18 @@ class ConfigManager:
         """
         创建默认配置文件 / Create default configuration file
         """
-        default_config = {
-            "aws": {
-                "auth_method": "profile",
-                "profile_name": "default",
-                "access_key_id": "",
-                "secret_access_key": "",
-                "region": "us-east-1",
-            },
-            "models": self._get_default_models(),
-            "system_prompt": self._get_default_system_prompt(),
-            "history_folder": "./history_references",
-            "app": {
-                "title": "案例总结生成器 / Case Summary Generator",
-                "max_tokens": 4000,
-                "temperature": 0.7,
-                "system_prompts": self._get_default_system_prompts_config(),
-            },
-        }
-
         try:
-            with open(self.config_path, "w", encoding="utf-8") as file:
-                yaml.dump(
-                    default_config,
-                    file,
-                    default_flow_style=False,
-                    allow_unicode=True,
-                    indent=2,
-                )
+            # 已序列化的字节一次写入，无需额外缓冲；独占创建避免覆盖并发创建的文件
+            # Write the pre-serialized bytes in one unbuffered call; exclusive create avoids clobbering a concurrently created file
+            with open(self._config_path_obj, "xb", buffering=0) as f:
+                f.write(_default_config_yaml_bytes())
             self.logger.info(
                 f"默认配置文件已创建: {self.config_path} / Default configuration file created: {self.config_path}"
             )
+        except FileExistsError:
+            self.logger.debug(
+                f"配置文件已被创建: {self.config_path} / Config file already created: {self.config_path}"
+            )
         except Exception as e:
             raise ConfigurationError(
                 f"创建默认配置文件失败 / Failed to create default configuration file: {e}"
@@ -222,56 +855,10 @@ class ConfigManager:
         Raises:
             ConfigurationError: 配置验证失败 / Configuration validation failed
         """
-        required_sections = ["aws", "models", "history_folder", "app"]
-
-        for section in required_sections:
-            if section not in self.config_data:
-                raise ConfigurationError(
-                    f"缺少必要配置节: {section} / Missing required configuration section: {section}"
-                )
-
-        # 验证AWS配置 / Validate AWS configuration
-        aws_config = self.config_data["aws"]
-        auth_method = aws_config.get("auth_method")
-
-        if auth_method not in ["profile", "ak_sk"]:
-            raise ConfigurationError(
-                f"无效的AWS认证方式: {auth_method} / Invalid AWS auth method: {auth_method}"
-            )
-
-        if auth_method == "ak_sk":
-            if not aws_config.get("access_key_id") or not aws_config.get(
-                "secret_access_key"
-            ):
-                raise ConfigurationError(
-                    "使用ak_sk认证方式时，access_key_id和secret_access_key不能为空 / access_key_id and secret_access_key cannot be empty when using ak_sk auth method"
-                )
-
-        # 验证模型配置 / Validate models configuration
-        models = self.config_data.get("models", {})
-        if not models:
-            raise ConfigurationError("模型配置不能为空 / Models configuration cannot be empty")
-
-        # 验证应用配置 / Validate app configuration
-        app_config = self.config_data.get("app", {})
-        max_tokens = app_config.get("max_tokens")
-        temperature = app_config.get("temperature")
-
-        if max_tokens and (not isinstance(max_tokens, int) or max_tokens <= 0):
-            raise ConfigurationError(
-                "max_tokens必须是正整数 / max_tokens must be a positive integer"
-            )
-
-        if temperature and (
-            not isinstance(temperature, (int, float))
-            or temperature < 0
-            or temperature > 2
-        ):
-            raise ConfigurationError(
-                "temperature必须在0-2之间 / temperature must be between 0-2"
-            )
+        _validate_config_rules(self.config_data)
 
         # 验证系统提示词配置 / Validate system prompts configuration
+        app_config = self.config_data.get("app") or {}
         self._validate_system_prompts_config(app_config.get("system_prompts", {}))
 
     def _get_default_system_prompt(self) -> str:
@@ -281,15 +868,7 @@ class ConfigManager:
         Returns:
             默认系统提示词 / Default system prompt
         """
-        return """你是一个专业的案例总结助手。请根据提供的历史参考信息和新的案例输入，生成一个结构化、专业的案例总结。
-
-总结应该包含：
-1. 案例概述
-2. 关键要点
-3. 分析结论
-4. 建议措施
-
-请保持总结的客观性和专业性。"""
+        return _DEFAULT_SYSTEM_PROMPT
 
     def _get_default_models(self) -> Dict[str, List[Dict[str, str]]]:
         """
@@ -298,24 +877,7 @@ class ConfigManager:
         Returns:
             默认模型配置 / Default models configuration
         """
-        return {
-            "claude": [
-                {
-                    "id": "anthropic.claude-3-sonnet-20240229-v1:0",
-                    "name": "Claude 3 Sonnet",
-                },
-                {
-                    "id": "anthropic.claude-3-haiku-20240307-v1:0",
-                    "name": "Claude 3 Haiku",
-                },
-            ],
-            "nova": [
-                {"id": "amazon.nova-pro-v1:0", "name": "Nova Pro"},
-                {"id": "amazon.nova-lite-v1:0", "name": "Nova Lite"},
-            ],
-            "deepseek": [{"id": "deepseek.deepseek-v2.5", "name": "DeepSeek V2.5"}],
-            "openai": [{"id": "openai.gpt-4o-2024-08-06", "name": "GPT-4o"}],
-        }
+        return _DEFAULT_MODELS
 
     def validate_aws_credentials(self) -> bool:
         """
@@ -327,24 +889,18 @@ class ConfigManager:
         Raises:
             AWSCredentialsError: AWS凭证验证失败 / AWS credentials validation failed
         """
+        from botocore.exceptions import ClientError, NoCredentialsError, ProfileNotFound
+
         try:
             credentials = self.get_aws_credentials()
+            key = self._credentials_key(credentials)
 
-            # 根据认证方式创建session / Create session based on auth method
-            if credentials["auth_method"] == "profile":
-                self.logger.info(
-                    f"使用AWS Profile: {credentials['profile_name']} / Using AWS Profile: {credentials['profile_name']}"
-                )
-                session = boto3.Session(
-                    profile_name=credentials["profile_name"],
-                    region_name=credentials["region"],
-                )
-            else:  # ak_sk
-                session = boto3.Session(
-                    aws_access_key_id=credentials["access_key_id"],
-                    aws_secret_access_key=credentials["secret_access_key"],
-                    region_name=credentials["region"],
-                )
+            # 有效期内跳过STS往返 / Skip the STS round-trip within the TTL
+            checked_at = self._identity_cache.get(key)
+            if checked_at is not None and time.monotonic() - checked_at < _IDENTITY_CACHE_TTL:
+                return True
+
+            session = self._get_or_create_session(credentials)
 
             # 尝试获取caller identity来验证凭证 / Try to get caller identity to validate credentials
             sts_client = session.client("sts")
@@ -353,6 +909,7 @@ class ConfigManager:
             self.logger.info(
                 f"AWS凭证验证成功，账户ID: {response.get('Account')} / AWS credentials validated successfully, Account ID: {response.get('Account')}"
             )
+            self._identity_cache[key] = time.monotonic()
             return True
 
         except ProfileNotFound as e:
@@ -382,7 +939,7 @@ class ConfigManager:
                 f"AWS凭证验证过程中发生错误: {e} / Error occurred during AWS credentials validation: {e}"
             )
 
-    def get_boto3_session(self) -> boto3.Session:
+    def get_boto3_session(self) -> "boto3.Session":
         """
         获取配置好的boto3 session / Get configured boto3 session
 
@@ -395,28 +952,73 @@ class ConfigManager:
         credentials = self.get_aws_credentials()
 
         try:
-            if credentials["auth_method"] == "profile":
-                self.logger.info(
-                    f"创建boto3 session，使用profile: {credentials['profile_name']} / Creating boto3 session with profile: {credentials['profile_name']}"
-                )
-                session = boto3.Session(
-                    profile_name=credentials["profile_name"],
-                    region_name=credentials["region"],
-                )
-            else:  # ak_sk
-                session = boto3.Session(
-                    aws_access_key_id=credentials["access_key_id"],
-                    aws_secret_access_key=credentials["secret_access_key"],
-                    region_name=credentials["region"],
-                )
-
-            return session
-
+            return self._get_or_create_session(credentials)
         except Exception as e:
             raise AWSCredentialsError(
                 f"创建boto3 session失败: {e} / Failed to create boto3 session: {e}"
             )
 
+    @staticmethod
+    def _credentials_key(credentials: Mapping[str, str]) -> tuple:
+        """
+        生成凭证缓存键 / Build the credentials cache key
+
+        Args:
+            credentials: AWS凭证字典 / AWS credentials dictionary
+
+        Returns:
+            可哈希的凭证键 / Hashable credentials key
+        """
+        return (
+            credentials["auth_method"],
+            credentials.get("profile_name"),
+            credentials.get("access_key_id"),
+            credentials.get("secret_access_key"),
+            credentials["region"],
+        )
+
+    def _get_or_create_session(self, credentials: Mapping[str, str]) -> "boto3.Session":
+        """
+        按凭证复用boto3 session / Reuse a boto3 session per credentials
+
+        Args:
+            credentials: AWS凭证字典 / AWS credentials dictionary
+
+        Returns:
+            boto3.Session对象 / boto3.Session object
+        """
+        key = self._credentials_key(credentials)
+        session = self._session_cache.get(key)
+        if session is None:
+            session = self._session_cache[key] = self._build_session(credentials)
+        return session
+
+    def _build_session(self, credentials: Mapping[str, str]) -> "boto3.Session":
+        """
+        按认证方式构建boto3 session / Build a boto3 session for the auth method
+
+        Args:
+            credentials: AWS凭证字典 / AWS credentials dictionary
+
+        Returns:
+            boto3.Session对象 / boto3.Session object
+        """
+        boto3 = self._get_boto3()
+        if credentials["auth_method"] == "profile":
+            self.logger.info(
+                f"创建boto3 session，使用profile: {credentials['profile_name']} / Creating boto3 session with profile: {credentials['profile_name']}"
+            )
+            return boto3.Session(
+                profile_name=credentials["profile_name"],
+                region_name=credentials["region"],
+            )
+        # ak_sk
+        return boto3.Session(
+            aws_access_key_id=credentials["access_key_id"],
+            aws_secret_access_key=credentials["secret_access_key"],
+            region_name=credentials["region"],
+        )
+
     def _get_default_system_prompts_config(self) -> Dict[str, Any]:
         """
         获取默认系统提示词配置 / Get default system prompts configuration
@@ -424,12 +1026,7 @@ class ConfigManager:
         Returns:
             默认系统提示词配置 / Default system prompts configuration
         """
-        return {
-            "prompts_folder": "./system_prompts",
-            "active_prompt": "default",
-            "auto_create_history_folders": True,
-            "prompt_file_extension": ".md",
-        }
+        return _DEFAULT_SYSTEM_PROMPTS_CONFIG
 
     def _validate_system_prompts_config(
         self, system_prompts_config: Dict[str, Any]
@@ -448,35 +1045,14 @@ class ConfigManager:
                 "system_prompts配置必须是字典类型 / system_prompts configuration must be a dictionary"
             )
 
-        # 验证prompts_folder / Validate prompts_folder
-        prompts_folder = system_prompts_config.get("prompts_folder")
-        if prompts_folder and not isinstance(prompts_folder, str):
-            raise ConfigurationError(
-                "prompts_folder必须是字符串类型 / prompts_folder must be a string"
-            )
-
-        # 验证active_prompt / Validate active_prompt
-        active_prompt = system_prompts_config.get("active_prompt")
-        if active_prompt and not isinstance(active_prompt, str):
-            raise ConfigurationError(
-                "active_prompt必须是字符串类型 / active_prompt must be a string"
-            )
-
-        # 验证auto_create_history_folders / Validate auto_create_history_folders
-        auto_create = system_prompts_config.get("auto_create_history_folders")
-        if auto_create is not None and not isinstance(auto_create, bool):
-            raise ConfigurationError(
-                "auto_create_history_folders必须是布尔类型 / auto_create_history_folders must be a boolean"
-            )
-
-        # 验证prompt_file_extension / Validate prompt_file_extension
-        extension = system_prompts_config.get("prompt_file_extension")
-        if extension and not isinstance(extension, str):
-            raise ConfigurationError(
-                "prompt_file_extension必须是字符串类型 / prompt_file_extension must be a string"
-            )
-
-        if extension and not extension.startswith("."):
-            raise ConfigurationError(
-                "prompt_file_extension必须以点开头 / prompt_file_extension must start with a dot"
-            )
+        for key, value in system_prompts_config.items():
+            rule = _SYSTEM_PROMPTS_SCHEMA.get(key)
+            # 未知字段和空值不做检查 / Unknown keys and empty values are not checked
+            if rule is None or value is None or (rule[0] is str and not value):
+                continue
+
+            expected_type, message, extra_check = rule
+            if not isinstance(value, expected_type):
+                raise ConfigurationError(message)
+            if extra_check is not None:
+                extra_check(value)
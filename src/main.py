@@ -10,13 +10,16 @@ This is the application entry point, responsible for initializing all components
 import sys
 import logging
 import argparse
+import ipaddress
+import re
+from logging.handlers import RotatingFileHandler
 from pathlib import Path
+from typing import List, Optional
 
-# 添加src目录到Python路径 / Add src directory to Python path
-sys.path.insert(0, str(Path(__file__).parent))
+DEFAULT_CONFIG_PATH = "config.yaml"
 
-from services.app_controller import AppController, CaseSummaryError
-from ui.gradio_interface import GradioInterface
+# 主机名标签: 字母数字开头结尾，可含连字符 / Hostname label: alphanumeric ends, hyphens allowed inside
+_HOSTNAME_LABEL = re.compile(r"(?!-)[A-Za-z0-9-]{1,63}(?<!-)")
 
 
 def setup_logging(debug: bool = False):
@@ -33,17 +36,94 @@ def setup_logging(debug: bool = False):
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
         handlers=[
             logging.StreamHandler(),
-            logging.FileHandler("case_summary_generator.log", encoding="utf-8"),
+            # 首次写入时才打开文件，并限制日志大小 / Open the file on first write and bound its size
+            RotatingFileHandler(
+                "case_summary_generator.log",
+                encoding="utf-8",
+                delay=True,
+                maxBytes=10_000_000,
+                backupCount=3,
+            ),
         ],
     )
 
 
-def parse_arguments():
+def _port(value: str) -> int:
     """
-    解析命令行参数 / Parse command line arguments
+    解析端口号 / Parse a port number
+
+    Args:
+        value: 命令行参数值 / Command line argument value
 
     Returns:
-        解析后的参数 / Parsed arguments
+        端口号 / Port number
+
+    Raises:
+        argparse.ArgumentTypeError: 端口无效 / Invalid port
+    """
+    try:
+        port = int(value)
+    except ValueError:
+        port = 0
+    if not 1 <= port <= 65535:
+        raise argparse.ArgumentTypeError(
+            f"端口必须是1-65535之间的整数: {value} / Port must be an integer between 1 and 65535: {value}"
+        )
+    return port
+
+
+def _host(value: str) -> str:
+    """
+    校验服务器地址 / Validate the server host
+
+    Args:
+        value: 命令行参数值 / Command line argument value
+
+    Returns:
+        IP地址或主机名 / IP address or hostname
+
+    Raises:
+        argparse.ArgumentTypeError: 地址无效 / Invalid host
+    """
+    try:
+        ipaddress.ip_address(value)
+        return value
+    except ValueError:
+        pass
+    labels = value.rstrip(".").split(".")
+    if len(value) > 253 or not all(_HOSTNAME_LABEL.fullmatch(label) for label in labels):
+        raise argparse.ArgumentTypeError(
+            f"无效的服务器地址: {value} / Invalid server host: {value}"
+        )
+    return value
+
+
+def _config_path(value: str) -> str:
+    """
+    校验配置文件路径，默认路径不存在时允许稍后创建 / Validate the config path; the default may be created later
+
+    Args:
+        value: 命令行参数值 / Command line argument value
+
+    Returns:
+        配置文件路径 / Configuration file path
+
+    Raises:
+        argparse.ArgumentTypeError: 配置文件不存在 / Configuration file not found
+    """
+    if value != DEFAULT_CONFIG_PATH and not Path(value).is_file():
+        raise argparse.ArgumentTypeError(
+            f"配置文件不存在: {value} / Config file not found: {value}"
+        )
+    return value
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """
+    构建命令行参数解析器 / Build the command line argument parser
+
+    Returns:
+        参数解析器 / Argument parser
     """
     parser = argparse.ArgumentParser(
         description="案例总结生成器 / Case Summary Generator",
@@ -53,14 +133,14 @@ def parse_arguments():
     parser.add_argument(
         "--config",
         "-c",
-        type=str,
-        default="config.yaml",
+        type=_config_path,
+        default=DEFAULT_CONFIG_PATH,
         help="配置文件路径 / Configuration file path (default: config.yaml)",
     )
 
     parser.add_argument(
         "--host",
-        type=str,
+        type=_host,
         default="127.0.0.1",
         help="服务器地址 / Server host (default: 127.0.0.1)",
     )
@@ -68,7 +148,7 @@ def parse_arguments():
     parser.add_argument(
         "--port",
         "-p",
-        type=int,
+        type=_port,
         default=7860,
         help="服务器端口 / Server port (default: 7860)",
     )
@@ -81,7 +161,24 @@ def parse_arguments():
         "--debug", action="store_true", help="启用调试模式 / Enable debug mode"
     )
 
-    return parser.parse_args()
+    return parser
+
+
+# 导入时构建一次，供每次调用复用 / Built once at import and reused by every call
+_PARSER = _build_parser()
+
+
+def parse_arguments(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """
+    解析命令行参数 / Parse command line arguments
+
+    Args:
+        argv: 参数列表，默认使用sys.argv / Argument list, defaults to sys.argv
+
+    Returns:
+        解析后的参数 / Parsed arguments
+    """
+    return _PARSER.parse_args(argv)
 
 
 def main():
@@ -91,6 +188,11 @@ def main():
     # 解析命令行参数 / Parse command line arguments
     args = parse_arguments()
 
+    # 参数解析后再导入重量级依赖（boto3、gradio），--help无需加载
+    # Import heavy dependencies (boto3, gradio) after parsing so --help skips them
+    from src.services.app_controller import AppController, CaseSummaryError
+    from src.ui.gradio_interface import GradioInterface
+
     # 设置日志 / Setup logging
     setup_logging(args.debug)
     logger = logging.getLogger(__name__)
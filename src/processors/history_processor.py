@@ -5,12 +5,204 @@
 Responsible for reading, processing and integrating historical reference files
 """
 
+import heapq
+import io
 import os
 import logging
+import math
+import mmap
+from collections import Counter, defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Optional, Set
+from typing import Any, Iterable, Iterator, List, Dict, Optional, Set, Tuple, Union
 import re
 
+try:
+    # pyahocorasick为可选依赖，缺失时回退到逐关键词计数
+    # pyahocorasick is optional, falls back to per-keyword counting
+    import ahocorasick
+except ImportError:  # pragma: no cover
+    ahocorasick = None
+
+
+# 连续的中文字符 / Runs of consecutive Chinese characters
+_CJK_RE = re.compile(r"[\u4e00-\u9fff]+")
+
+# 行首尾空白（不含换行符） / Leading/trailing whitespace on a line, excluding newlines
+_LINE_EDGE_WS_RE = re.compile(r"^[^\S\n]+|[^\S\n]+$", re.MULTILINE)
+
+# 两个及以上连续空行 / Two or more consecutive empty lines
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+
+# 段落边界：空行或标题行之前（行已去除首尾空白） / Section boundary: empty lines or before a header line (lines already stripped)
+_SECTION_SPLIT_RE = re.compile(r"\n{2,}|\n(?=#)")
+
+# 英文单词（输入已转小写） / English words (input is already lowercased)
+_EN_WORD_RE = re.compile(r"\b[a-z]{2,}\b")
+
+# 关键词提取时过滤的常见停用词 / Common stop words filtered during keyword extraction
+_STOP_WORDS = frozenset(
+    {
+        "的",
+        "了",
+        "在",
+        "是",
+        "我",
+        "有",
+        "和",
+        "就",
+        "不",
+        "人",
+        "都",
+        "一",
+        "一个",
+        "上",
+        "也",
+        "很",
+        "到",
+        "说",
+        "要",
+        "去",
+        "你",
+        "会",
+        "着",
+        "没有",
+        "看",
+        "好",
+        "自己",
+        "这",
+        "时",
+        "需要",
+        "the",
+        "a",
+        "an",
+        "and",
+        "or",
+        "but",
+        "in",
+        "on",
+        "at",
+        "to",
+        "for",
+        "of",
+        "with",
+        "by",
+        "is",
+        "are",
+        "was",
+        "were",
+        "be",
+        "been",
+        "have",
+        "has",
+        "had",
+        "do",
+        "does",
+        "did",
+        "will",
+        "would",
+        "could",
+        "should",
+    }
+)
+
+# 按BOM识别的编码 / Encodings identified by their byte order mark
+_BOM_ENCODINGS = (
+    (b"\xef\xbb\xbf", "utf-8-sig"),
+    (b"\xff\xfe", "utf-16"),
+    (b"\xfe\xff", "utf-16"),
+)
+
+# 无BOM时依次尝试的编码，gb18030兼容gbk和gb2312 / Encodings tried in order without a BOM; gb18030 covers gbk and gb2312
+_FALLBACK_ENCODINGS = ("utf-8", "gbk", "gb18030", "latin1")
+
+
+def _decode_bytes(data: Union[bytes, mmap.mmap]) -> str:
+    """
+    按BOM或候选编码解码文件字节 / Decode file bytes by BOM or candidate encodings
+
+    接受任意字节缓冲区（包括mmap），直接从缓冲区解码而不先复制为bytes。
+    Accepts any byte buffer, including mmap, and decodes straight from it
+    without copying into bytes first.
+
+    Args:
+        data: 文件字节 / File bytes
+
+    Returns:
+        解码后的文本 / Decoded text
+
+    Raises:
+        UnicodeDecodeError: BOM声明的编码无法解码 / The BOM-declared encoding fails to decode
+    """
+    head = data[:3]
+    for bom, encoding in _BOM_ENCODINGS:
+        if head.startswith(bom):
+            return str(data, encoding)
+
+    for encoding in _FALLBACK_ENCODINGS[:-1]:
+        try:
+            return str(data, encoding)
+        except UnicodeDecodeError:
+            continue
+    # latin1可解码任意字节 / latin1 decodes any byte sequence
+    return str(data, _FALLBACK_ENCODINGS[-1])
+
+
+def _count_cjk_ngrams(text: str) -> Counter:
+    """
+    统计连续中文片段内的2-4字组合 / Count 2-4 character n-grams within runs of Chinese characters
+
+    单个生成器表达式交给Counter，由C实现的计数循环一次消费，
+    避免每个片段、每种长度各调用一次update。
+    A single generator feeds Counter's C-implemented counting loop in one go,
+    instead of one update call per run and length.
+
+    Args:
+        text: 输入文本 / Input text
+
+    Returns:
+        n-gram计数 / n-gram counts
+    """
+    return Counter(
+        run[i : i + length]
+        for run in _CJK_RE.findall(text)
+        for length in (2, 3, 4)
+        for i in range(len(run) - length + 1)
+    )
+
+
+def _lower_keywords(keywords: Iterable[str]) -> Tuple[str, ...]:
+    """
+    将关键词转为小写并去重，保持原有顺序 / Lowercase and deduplicate keywords, keeping their order
+
+    Args:
+        keywords: 关键词 / Keywords
+
+    Returns:
+        小写关键词元组 / Tuple of lowercased keywords
+    """
+    return tuple(dict.fromkeys(keyword.lower() for keyword in keywords))
+
+
+# 达到该大小的文件通过mmap读取 / Files at or above this size are read through mmap
+_MMAP_THRESHOLD = 256 * 1024
+
+# 并行读取历史文件的最大线程数 / Maximum threads for reading history files in parallel
+_MAX_READ_WORKERS = 32
+
+# 类别标题与文件标题 / Category and file headers
+_CATEGORY_HEADER = "## {category}类别参考 / {category} Category Reference"
+_FILE_HEADER = "### 文件: {name} / File: {name}"
+
+# 筛选结果中最多保留的相关段落数 / Maximum relevant sections kept in the filtered result
+_MAX_RELEVANT_SECTIONS = 5
+
+# 生成历史摘要时扫描的行数 / Number of lines scanned when building the history summary
+_SUMMARY_SCAN_LINES = 20
+
+# 中文n-gram关键词的数量上限，超出时按频次保留 / Cap on Chinese n-gram keywords, kept by frequency beyond it
+_MAX_CJK_KEYWORDS = 200
+
 
 class HistoryProcessingError(Exception):
     """历史信息处理错误 / History processing error"""
@@ -31,6 +223,19 @@ class HistoryProcessor:
         self.history_folder = Path(history_folder)
         self.logger = logging.getLogger(__name__)
         self.supported_extensions = {".txt", ".md", ".markdown"}
+        # 文件夹是否存在；为False时每次加载都重新检查，以便发现之后创建的文件夹
+        # Whether the folder exists; re-checked on every load while False so a folder created later is picked up
+        self._folder_exists = self.history_folder.is_dir()
+        # 文件路径 -> (st_mtime_ns, st_size, 内容) / File path -> (st_mtime_ns, st_size, content)
+        self._file_cache: Dict[str, Tuple[int, int, str]] = {}
+        # (文件签名, 格式化后的历史内容) / (file signature, formatted history content)
+        self._history_content_cache: Optional[Tuple[tuple, str]] = None
+
+    def clear_cache(self) -> None:
+        """清空缓存的文件内容和格式化结果，并重新检查文件夹 / Clear cached file contents and formatted history, and re-check the folder"""
+        self._file_cache = {}
+        self._history_content_cache = None
+        self._folder_exists = self.history_folder.is_dir()
 
     def load_history_files(self) -> List[Dict[str, str]]:
         """
@@ -45,16 +250,45 @@ class HistoryProcessor:
         history_files = []
 
         try:
-            if not self.history_folder.exists():
+            if not self._folder_exists:
+                self._folder_exists = self.history_folder.is_dir()
+            if not self._folder_exists:
                 self.logger.warning(
                     f"历史参考文件夹不存在: {self.history_folder} / History folder not found: {self.history_folder}"
                 )
                 return history_files
 
-            # 递归读取所有支持的文件 / Recursively read all supported files
-            for file_path in self._get_supported_files():
+            # 递归读取所有支持的文件，并行读取以重叠I/O等待
+            # Recursively read all supported files in parallel to overlap I/O waits
+            # 只重新读取修改时间或大小变化的文件 / Only re-read files whose mtime or size changed
+            old_cache = self._file_cache
+            new_cache: Dict[str, Tuple[int, int, str]] = {}
+            scanned = self._scan_supported_files()
+            cached_contents: Dict[int, str] = {}
+            for index, (file_path, st) in enumerate(scanned):
+                cached = old_cache.get(str(file_path))
+                if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+                    cached_contents[index] = cached[2]
+
+            futures: Dict[int, Future] = {}
+            if len(cached_contents) < len(scanned):
+                with ThreadPoolExecutor(
+                    max_workers=min(_MAX_READ_WORKERS, len(scanned) - len(cached_contents))
+                ) as executor:
+                    for index, (file_path, _) in enumerate(scanned):
+                        if index not in cached_contents:
+                            futures[index] = executor.submit(
+                                self._read_file_content, file_path
+                            )
+
+            # 按扫描顺序收集结果，保持文件顺序稳定 / Collect in scan order to keep file order stable
+            for index, (file_path, st) in enumerate(scanned):
                 try:
-                    content = self._read_file_content(file_path)
+                    if index in cached_contents:
+                        content = cached_contents[index]
+                    else:
+                        content = futures[index].result()
+                    new_cache[str(file_path)] = (st.st_mtime_ns, st.st_size, content)
                     if content.strip():  # 只添加非空文件 / Only add non-empty files
                         history_files.append(
                             {
@@ -73,6 +307,7 @@ class HistoryProcessor:
                     )
                     continue
 
+            self._file_cache = new_cache
             self.logger.info(
                 f"成功加载 {len(history_files)} 个历史文件 / Successfully loaded {len(history_files)} history files"
             )
@@ -96,33 +331,147 @@ class HistoryProcessor:
         if not files:
             return "暂无历史参考信息 / No historical reference information available"
 
+        # 文件列表未变化时复用上次格式化结果 / Reuse the last formatted result for an unchanged file list
+        signature = tuple(
+            (file_info["path"], file_info["name"], file_info["category"], file_info["content"])
+            for file_info in files
+        )
+        cached = self._history_content_cache
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
         # 按类别组织文件 / Organize files by category
         categorized_files = self._categorize_files(files)
 
-        reference_sections = []
+        # 直接写入单个缓冲区，不再构建中间列表 / Write straight into one buffer instead of building intermediate lists
+        buffer = io.StringIO()
+        write = buffer.write
+        first_section = True
 
         for category, category_files in categorized_files.items():
             if not category_files:
                 continue
 
-            section_content = [f"\n## {category}类别参考 / {category} Category Reference\n"]
+            # 段落之间以换行分隔 / Sections are separated by a newline
+            if not first_section:
+                write("\n")
+            first_section = False
+            write(f"\n{_CATEGORY_HEADER.format(category=category)}\n")
+
+            for file_info in category_files:
+                # 添加文件标题和内容，末尾空行分隔 / Add file title and content, followed by an empty line
+                write(f"\n{_FILE_HEADER.format(name=file_info['name'])}\n")
+                write(self._format_file_content(file_info["content"]))
+                write("\n")
+
+        history_content = buffer.getvalue()
+        self._history_content_cache = (signature, history_content)
+        return history_content
+
+    def iter_history_sections(self, files: List[Dict[str, str]]) -> Iterator[str]:
+        """
+        逐个生成历史段落，不拼接完整历史文本 / Yield history sections without joining the full history
+
+        生成的段落与对process_history_content结果分段得到的段落一致。
+        Yields the same sections as splitting the output of process_history_content.
+
+        Args:
+            files: 历史文件信息列表 / List of history file information
+
+        Yields:
+            历史段落 / History sections
+        """
+        for category, category_files in self._categorize_files(files).items():
+            if not category_files:
+                continue
 
+            yield from self._split_history_sections(
+                _CATEGORY_HEADER.format(category=category)
+            )
             for file_info in category_files:
-                # 添加文件标题和内容 / Add file title and content
-                section_content.append(
-                    f"### 文件: {file_info['name']} / File: {file_info['name']}"
+                # 文件标题与内容首段属于同一段落 / The file header shares a section with the first paragraph
+                yield from self._split_history_sections(
+                    _FILE_HEADER.format(name=file_info["name"])
+                    + "\n"
+                    + self._format_file_content(file_info["content"])
                 )
-                section_content.append(self._format_file_content(file_info["content"]))
-                section_content.append("")  # 空行分隔 / Empty line separator
 
-            reference_sections.append("\n".join(section_content))
+    def filter_relevant_history_sections(
+        self, case_input: str, sections: Iterable[str]
+    ) -> Optional[str]:
+        """
+        从历史段落中筛选相关信息 / Filter relevant information from history sections
+
+        Args:
+            case_input: 案例输入内容 / Case input content
+            sections: 历史段落，通常来自iter_history_sections / History sections, usually from iter_history_sections
+
+        Returns:
+            筛选后的相关历史信息；没有关键词或没有匹配段落时为None，
+            此时需要完整历史文本回退到filter_relevant_history。
+            Filtered relevant history, or None when there are no keywords or no
+            matching sections, in which case the full history is needed to fall
+            back to filter_relevant_history.
+        """
+        if not case_input.strip():
+            return None
+
+        keywords = self._extract_keywords(case_input)
+        if not keywords:
+            return None
+
+        relevant_sections = self._rank_sections(
+            list(sections), keywords, limit=_MAX_RELEVANT_SECTIONS
+        )
+        if not relevant_sections:
+            return None
+
+        return self._join_relevant_sections(relevant_sections)
+
+    def filter_relevant_history_files(
+        self, case_input: str, files: List[Dict[str, str]]
+    ) -> str:
+        """
+        从历史文件中筛选相关信息 / Filter relevant information from history files
+
+        关键词只提取一次，段落只排序一次；只有在需要完整历史或摘要时才拼接历史文本。
+        结果与对process_history_content的输出调用filter_relevant_history一致。
+        Keywords are extracted and sections ranked only once; the full history is
+        only joined when it or its summary is returned. The result matches calling
+        filter_relevant_history on the output of process_history_content.
+
+        Args:
+            case_input: 案例输入内容 / Case input content
+            files: 历史文件信息列表 / List of history file information
+
+        Returns:
+            筛选后的相关历史信息 / Filtered relevant history information
+        """
+        keywords = self._extract_keywords(case_input) if case_input.strip() else None
+        if keywords:
+            relevant_sections = self._rank_sections(
+                list(self.iter_history_sections(files)),
+                keywords,
+                limit=_MAX_RELEVANT_SECTIONS,
+            )
+            if relevant_sections:
+                return self._join_relevant_sections(relevant_sections)
 
-        return "\n".join(reference_sections)
+        history = self.process_history_content(files)
+        if not keywords or not history.strip():
+            return history
+        # 没有相关段落时返回摘要 / Return a summary when no section is relevant
+        return self._create_history_summary(history)
 
     def filter_relevant_history(self, case_input: str, history: str) -> str:
         """
         筛选相关历史信息 / Filter relevant history information
 
+        需要先拼接完整历史文本再分段，属于较慢的路径；已有文件列表时优先使用
+        filter_relevant_history_files。
+        This is the slow path: the full history is joined and then split again.
+        Prefer filter_relevant_history_files when the file list is at hand.
+
         Args:
             case_input: 案例输入内容 / Case input content
             history: 完整历史参考信息 / Complete history reference information
@@ -142,28 +491,29 @@ class HistoryProcessor:
         # 按段落分割历史信息 / Split history by paragraphs
         history_sections = self._split_history_sections(history)
 
-        # 计算每个段落的相关性得分 / Calculate relevance score for each paragraph
-        relevant_sections = []
-        for section in history_sections:
-            relevance_score = self._calculate_relevance_score(section, keywords)
-            if relevance_score > 0:  # 有任何关键词匹配就保留 / Keep if any keywords match
-                relevant_sections.append((section, relevance_score))
+        # 计算每个段落的相关性得分，有任何关键词匹配就保留
+        # Score each section, keeping it if any keyword matches
+        relevant_sections = self._rank_sections(
+            history_sections, keywords, limit=_MAX_RELEVANT_SECTIONS
+        )
 
         if not relevant_sections:
             # 如果没有相关内容，返回原始历史信息的摘要 / If no relevant content, return summary of original history
             return self._create_history_summary(history)
 
-        # 按相关性得分排序并返回 / Sort by relevance score and return
-        relevant_sections.sort(key=lambda x: x[1], reverse=True)
+        return self._join_relevant_sections(relevant_sections)
 
+    def _join_relevant_sections(
+        self, relevant_sections: List[Tuple[str, float]]
+    ) -> str:
+        """拼接相关段落 / Join relevant sections"""
         filtered_content = []
         filtered_content.append(
             "## 相关历史参考信息 / Relevant Historical Reference Information\n"
         )
 
-        for section, score in relevant_sections[
-            :5
-        ]:  # 最多返回5个最相关的段落 / Return at most 5 most relevant paragraphs
+        # 最多返回5个最相关的段落 / Return at most 5 most relevant paragraphs
+        for section, score in relevant_sections:
             filtered_content.append(section)
             filtered_content.append("")  # 空行分隔 / Empty line separator
 
@@ -171,33 +521,63 @@ class HistoryProcessor:
 
     def _get_supported_files(self) -> List[Path]:
         """获取所有支持的文件 / Get all supported files"""
+        return [file_path for file_path, _ in self._scan_supported_files()]
+
+    def _scan_supported_files(self) -> List[Tuple[Path, os.stat_result]]:
+        """获取所有支持的文件及其stat信息 / Get all supported files with their stat info"""
         supported_files = []
+        supported_extensions = self.supported_extensions
+        splitext = os.path.splitext
+
+        # 显式栈深度优先遍历，顺序与os.walk一致；复用DirEntry缓存的类型信息
+        # Depth-first walk with an explicit stack in os.walk order, reusing DirEntry's cached type info
+        stack = [str(self.history_folder)]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as it:
+                    entries = list(it)
+            except OSError:
+                # 与os.walk一样跳过无法读取的目录 / Skip unreadable directories like os.walk does
+                continue
 
-        for root, dirs, files in os.walk(self.history_folder):
-            for file in files:
-                file_path = Path(root) / file
-                if file_path.suffix.lower() in self.supported_extensions:
-                    supported_files.append(file_path)
+            subdirs = []
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif splitext(entry.name)[1].lower() in supported_extensions and entry.is_file():
+                    try:
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    supported_files.append((Path(entry.path), st))
+            stack.extend(reversed(subdirs))
 
         return supported_files
 
     def _read_file_content(self, file_path: Path) -> str:
         """读取文件内容 / Read file content"""
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                return f.read()
+            # 一次性二进制读取，再在内存中解码；大文件通过mmap直接解码，省去一次整份复制
+            # Read once in binary mode, then decode in memory; large files are decoded
+            # straight from an mmap, skipping one full copy
+            with open(file_path, "rb") as f:
+                if os.fstat(f.fileno()).st_size >= _MMAP_THRESHOLD:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        if hasattr(mm, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+                            mm.madvise(mmap.MADV_SEQUENTIAL)
+                        text = _decode_bytes(mm)
+                else:
+                    text = _decode_bytes(f.read())
         except UnicodeDecodeError:
-            # 尝试其他编码 / Try other encodings
-            for encoding in ["gbk", "gb2312", "latin1"]:
-                try:
-                    with open(file_path, "r", encoding=encoding) as f:
-                        return f.read()
-                except UnicodeDecodeError:
-                    continue
             raise HistoryProcessingError(
                 f"无法解码文件: {file_path} / Cannot decode file: {file_path}"
             )
 
+        # 与文本模式一致地统一换行符 / Normalize newlines the way text mode does
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+        return text
+
     def _get_file_category(self, file_path: Path) -> str:
         """获取文件类别 / Get file category"""
         # 基于文件路径确定类别 / Determine category based on file path
@@ -213,184 +593,226 @@ class HistoryProcessor:
     def _categorize_files(
         self, files: List[Dict[str, str]]
     ) -> Dict[str, List[Dict[str, str]]]:
-        """按类别组织文件 / Organize files by category"""
-        categorized = {}
+        """按类别组织文件，类别保持首次出现的顺序 / Organize files by category, in order of first appearance"""
+        categorized: Dict[str, List[Dict[str, str]]] = defaultdict(list)
 
         for file_info in files:
-            category = file_info["category"]
-            if category not in categorized:
-                categorized[category] = []
-            categorized[category].append(file_info)
+            categorized[file_info["category"]].append(file_info)
 
         return categorized
 
     def _format_file_content(self, content: str) -> str:
         """格式化文件内容 / Format file content"""
-        # 清理多余的空行 / Clean excessive empty lines
-        lines = content.split("\n")
-        formatted_lines = []
-
-        prev_empty = False
-        started = False  # 标记是否已经开始添加内容 / Mark if content has started
-
-        for line in lines:
-            line = line.strip()
-            if not line:
-                if (
-                    started and not prev_empty
-                ):  # 只有在开始添加内容后才添加空行 / Only add empty lines after content starts
-                    formatted_lines.append("")
-                prev_empty = True
-            else:
-                formatted_lines.append(line)
-                prev_empty = False
-                started = True
-
-        # 移除末尾的空行 / Remove trailing empty lines
-        while formatted_lines and formatted_lines[-1] == "":
-            formatted_lines.pop()
-
-        return "\n".join(formatted_lines)
+        # 去除每行首尾空白，合并连续空行并去除首尾空行
+        # Strip each line, collapse consecutive empty lines and trim leading/trailing ones
+        content = _LINE_EDGE_WS_RE.sub("", content)
+        return _BLANK_LINES_RE.sub("\n\n", content).strip("\n")
 
     def _extract_keywords(self, text: str) -> Set[str]:
         """提取关键词 / Extract keywords"""
         # 简单的关键词提取：提取2-4个字符的中文词汇和英文单词 / Simple keyword extraction
-        import re
-
-        # 提取中文词汇（2-4个字符）/ Extract Chinese words (2-4 characters)
-        chinese_words = []
-        chinese_chars = re.findall(r"[\u4e00-\u9fff]", text)
-        chinese_text = "".join(chinese_chars)
-
-        # 生成2-4字的中文词汇组合 / Generate 2-4 character Chinese word combinations
-        for i in range(len(chinese_text)):
-            for length in [2, 3, 4]:
-                if i + length <= len(chinese_text):
-                    word = chinese_text[i : i + length]
-                    chinese_words.append(word)
+        # 在每段连续中文内生成2-4字的词汇组合，不跨越标点或英文
+        # Generate 2-4 character combinations within each Chinese run, never across punctuation or English
+        ngram_counts = _count_cjk_ngrams(text)
 
         # 提取英文单词 / Extract English words
-        english_words = re.findall(r"\b[a-zA-Z]{2,}\b", text.lower())
-
-        all_words = chinese_words + english_words
+        english_words = _EN_WORD_RE.findall(text.lower())
 
         # 过滤常见停用词 / Filter common stop words
-        stop_words = {
-            "的",
-            "了",
-            "在",
-            "是",
-            "我",
-            "有",
-            "和",
-            "就",
-            "不",
-            "人",
-            "都",
-            "一",
-            "一个",
-            "上",
-            "也",
-            "很",
-            "到",
-            "说",
-            "要",
-            "去",
-            "你",
-            "会",
-            "着",
-            "没有",
-            "看",
-            "好",
-            "自己",
-            "这",
-            "时",
-            "需要",
-            "the",
-            "a",
-            "an",
-            "and",
-            "or",
-            "but",
-            "in",
-            "on",
-            "at",
-            "to",
-            "for",
-            "of",
-            "with",
-            "by",
-            "is",
-            "are",
-            "was",
-            "were",
-            "be",
-            "been",
-            "have",
-            "has",
-            "had",
-            "do",
-            "does",
-            "did",
-            "will",
-            "would",
-            "could",
-            "should",
-        }
+        for word in _STOP_WORDS.intersection(ngram_counts):
+            del ngram_counts[word]
+
+        # 数量过多时只保留高频词 / Keep only the most frequent ones when there are too many
+        if len(ngram_counts) > _MAX_CJK_KEYWORDS:
+            chinese_words = [
+                word for word, _ in ngram_counts.most_common(_MAX_CJK_KEYWORDS)
+            ]
+        else:
+            chinese_words = list(ngram_counts)
 
-        keywords = {
-            word for word in all_words if word not in stop_words and len(word) >= 2
-        }
+        keywords = set(chinese_words)
+        keywords.update(word for word in english_words if word not in _STOP_WORDS)
         return keywords
 
     def _split_history_sections(self, history: str) -> List[str]:
         """分割历史信息为段落 / Split history into sections"""
-        # 按标题和空行分割 / Split by headers and empty lines
-        sections = []
-        current_section = []
+        # 去除每行首尾空白后，按空行和标题行分割 / After stripping each line, split on empty lines and header lines
+        history = _LINE_EDGE_WS_RE.sub("", history)
+        sections = (part.strip("\n") for part in _SECTION_SPLIT_RE.split(history))
+        return [section for section in sections if section]
 
-        lines = history.split("\n")
-        for line in lines:
-            line = line.strip()
+    def _build_keyword_automaton(self, keywords: Iterable[str]) -> Optional[Any]:
+        """
+        构建关键词Aho-Corasick自动机 / Build an Aho-Corasick automaton over the keywords
 
-            # 检查是否是标题行 / Check if it's a header line
-            if line.startswith("#") or (line and not current_section):
-                if current_section:
-                    sections.append("\n".join(current_section))
-                    current_section = []
-                current_section.append(line)
-            elif line:
-                current_section.append(line)
-            elif current_section:
-                # 遇到空行且当前段落不为空，结束当前段落 / End current section on empty line
-                sections.append("\n".join(current_section))
-                current_section = []
-
-        # 添加最后一个段落 / Add the last section
-        if current_section:
-            sections.append("\n".join(current_section))
-
-        return [section for section in sections if section.strip()]
-
-    def _calculate_relevance_score(self, section: str, keywords: Set[str]) -> int:
-        """计算段落相关性得分 / Calculate section relevance score"""
-        section_lower = section.lower()
-        score = 0
+        Args:
+            keywords: 关键词 / Keywords
+
+        Returns:
+            自动机，pyahocorasick不可用时为None / Automaton, or None if pyahocorasick is unavailable
+        """
+        if ahocorasick is None or not keywords:
+            return None
 
+        automaton = ahocorasick.Automaton()
         for keyword in keywords:
-            # 计算关键词在段落中出现的次数 / Count keyword occurrences in section
-            count = section_lower.count(keyword.lower())
-            score += count
+            keyword_lower = keyword.lower()
+            automaton.add_word(keyword_lower, keyword_lower)
+        automaton.make_automaton()
+        return automaton
+
+    def _build_keyword_charsets(self, keywords: Iterable[str]) -> List[frozenset]:
+        """
+        构建各关键词的字符集合 / Build the character set of each keyword
 
-        return score
+        Args:
+            keywords: 关键词 / Keywords
+
+        Returns:
+            小写关键词字符集合列表（已去重） / Deduplicated character sets of the lowercased keywords
+        """
+        return list({frozenset(keyword.lower()) for keyword in keywords})
+
+    def _may_contain_keyword(
+        self, section_lower: str, keyword_charsets: List[frozenset]
+    ) -> bool:
+        """
+        判断段落是否可能包含任一关键词 / Check whether a section may contain any keyword
+
+        段落必须包含某个关键词的全部字符才可能匹配；字符集合在C层构建，
+        比完整扫描便宜得多。结果可能误报，但不会漏报。
+        A section can only match a keyword if it contains all of that keyword's
+        characters; building the character set runs in C and is far cheaper than
+        a full scan. False positives are possible, false negatives are not.
+
+        Args:
+            section_lower: 小写的段落文本 / Lowercased section text
+            keyword_charsets: 关键词字符集合列表 / Keyword character sets
+
+        Returns:
+            是否可能包含关键词 / Whether the section may contain a keyword
+        """
+        section_chars = set(section_lower)
+        return any(charset <= section_chars for charset in keyword_charsets)
+
+    def _calculate_relevance_score(
+        self, section: str, keywords: Set[str], automaton: Optional[Any] = None
+    ) -> int:
+        """计算段落相关性得分 / Calculate section relevance score"""
+        return sum(
+            self._count_keywords(
+                section.lower(), _lower_keywords(keywords), automaton
+            ).values()
+        )
+
+    def _count_keywords(
+        self,
+        section_lower: str,
+        lower_keywords: Tuple[str, ...],
+        automaton: Optional[Any] = None,
+    ) -> Dict[str, int]:
+        """
+        统计各关键词在段落中的出现次数 / Count occurrences of each keyword in a section
+
+        Args:
+            section_lower: 小写的段落文本 / Lowercased section text
+            lower_keywords: 已转小写的关键词 / Already lowercased keywords
+            automaton: 可选的关键词自动机 / Optional keyword automaton
+
+        Returns:
+            小写关键词 -> 出现次数，仅包含出现过的关键词 / Lowercased keyword -> count, matched keywords only
+        """
+        if automaton is not None:
+            # 单次线性扫描统计所有关键词出现次数；与str.count一致，同一关键词的重叠匹配只计一次
+            # One linear pass counts every keyword occurrence; like str.count, overlapping
+            # matches of the same keyword are counted once
+            counts = {}
+            next_start = {}
+            for end, keyword in automaton.iter(section_lower):
+                start = end - len(keyword) + 1
+                if start >= next_start.get(keyword, 0):
+                    counts[keyword] = counts.get(keyword, 0) + 1
+                    next_start[keyword] = end + 1
+            return counts
+
+        counts = {}
+        for keyword in lower_keywords:
+            count = section_lower.count(keyword)
+            if count:
+                counts[keyword] = count
+        return counts
+
+    def _rank_sections(
+        self, sections: List[str], keywords: Set[str], limit: Optional[int] = None
+    ) -> List[Tuple[str, float]]:
+        """
+        按TF-IDF加权的关键词匹配为段落排序 / Rank sections by TF-IDF weighted keyword matches
+
+        词频取对数，出现在越多段落中的关键词权重越低，得分按段落长度归一化，
+        避免长段落和常见词占据结果。
+        Term frequencies are log-scaled, keywords found in many sections get a
+        lower IDF weight, and scores are normalized by section length so long
+        sections and ubiquitous terms don't dominate.
+
+        Args:
+            sections: 历史段落列表 / List of history sections
+            keywords: 关键词集合 / Keyword set
+            limit: 最多返回的段落数，None表示全部 / Maximum sections to return, None for all
+
+        Returns:
+            (段落, 得分)列表，按得分降序，仅包含有匹配的段落 /
+            (section, score) pairs in descending score order, matched sections only
+        """
+        # 关键词只转一次小写，自动机在所有段落间共享
+        # Keywords are lowercased once and the automaton is shared across all sections
+        lower_keywords = _lower_keywords(keywords)
+        automaton = self._build_keyword_automaton(lower_keywords)
+        keyword_charsets = self._build_keyword_charsets(lower_keywords)
+        section_counts = []
+        for section in sections:
+            section_lower = section.lower()
+            # 字符集预检快速跳过不可能匹配的段落 / Character-set pre-check skips sections that cannot match
+            if self._may_contain_keyword(section_lower, keyword_charsets):
+                section_counts.append(
+                    self._count_keywords(section_lower, lower_keywords, automaton)
+                )
+            else:
+                section_counts.append({})
+
+        document_frequency: Counter = Counter()
+        for counts in section_counts:
+            document_frequency.update(counts.keys())
+        total = len(sections)
+        idf = {
+            keyword: math.log((1 + total) / (1 + frequency)) + 1
+            for keyword, frequency in document_frequency.items()
+        }
+
+        ranked = []
+        for section, counts in zip(sections, section_counts):
+            if not counts:
+                continue
+            score = sum(
+                (1 + math.log(count)) * idf[keyword] ** 2
+                for keyword, count in counts.items()
+            ) / math.sqrt(len(section))
+            ranked.append((section, score))
+
+        # 同分时保持原始顺序；只需前几名时用堆选取，无需完整排序
+        # Ties keep the original order; a heap selects the top few without a full sort
+        if limit is not None:
+            return heapq.nlargest(limit, ranked, key=lambda item: item[1])
+        ranked.sort(key=lambda item: item[1], reverse=True)
+        return ranked
 
     def _create_history_summary(self, history: str) -> str:
         """创建历史信息摘要 / Create history summary"""
-        lines = history.split("\n")
+        # 最多拆分出前20行，不拆分整个历史文本 / Split off at most the first 20 lines, not the whole history
+        lines = history.split("\n", _SUMMARY_SCAN_LINES)[:_SUMMARY_SCAN_LINES]
         summary_lines = []
 
         # 提取标题和前几行内容作为摘要 / Extract headers and first few lines as summary
-        for line in lines[:20]:  # 只取前20行 / Only take first 20 lines
+        for line in lines:
             line = line.strip()
             if (
                 line.startswith("#") or len(line) > 10
@@ -416,6 +838,7 @@ class HistoryProcessor:
             folder_path: 新的历史文件夹路径 / New history folder path
         """
         self.history_folder = Path(folder_path)
+        self._folder_exists = self.history_folder.is_dir()
         self.logger.info(
             f"历史文件夹已切换到: {self.history_folder} / History folder switched to: {self.history_folder}"
         )
@@ -5,8 +5,9 @@
 Integrate all components and provide unified business logic interface
 """
 
+import asyncio
 import logging
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, Iterator, List, Any, Optional, Tuple
 from src.config.config_manager import (
     ConfigManager,
     ConfigurationError,
@@ -14,7 +15,11 @@ from src.config.config_manager import (
 )
 from src.processors.history_processor import HistoryProcessor, HistoryProcessingError
 from src.services.prompt_builder import PromptBuilder
-from src.clients.bedrock_client import BedrockClient, ModelInvocationError
+from src.clients.bedrock_client import (
+    BedrockClient,
+    ModelInvocationError,
+    DEFAULT_CACHE_DIR,
+)
 from src.services.model_manager import ModelManager
 from src.services.system_prompt_manager import SystemPromptManager
 
@@ -49,6 +54,10 @@ class AppController:
         self.is_initialized = False
         self.available_models = {}
 
+        # 配置快照，在重新加载配置前保持不变 / Config snapshots, invariant until config reload
+        self._app_config: Optional[Dict[str, Any]] = None
+        self._system_prompt: Optional[str] = None
+
         # 初始化应用 / Initialize application
         self._initialize_app()
 
@@ -69,7 +78,9 @@ class AppController:
 
             # 初始化Bedrock客户端 / Initialize Bedrock client
             session = self.config_manager.get_boto3_session()
-            self.bedrock_client = BedrockClient(session)
+            self.bedrock_client = BedrockClient(
+                session, cache_dir=str(DEFAULT_CACHE_DIR)
+            )
 
             # 初始化模型管理器 / Initialize model manager
             config_data = self.config_manager.config_data
@@ -80,6 +91,9 @@ class AppController:
                 self.config_manager, self.history_processor
             )
 
+            # 缓存每次请求都会用到的配置 / Cache config used on every request
+            self._snapshot_config()
+
             self.is_initialized = True
             self.logger.info("应用初始化成功 / Application initialized successfully")
 
@@ -118,6 +132,18 @@ class AppController:
             self.logger.error(f"模型初始化失败: {e} / Model initialization failed: {e}")
             raise CaseSummaryError(f"模型初始化失败: {e} / Model initialization failed: {e}")
 
+    def start_model_loading(self) -> None:
+        """
+        在后台预加载模型列表，不阻塞界面启动 / Preload the model list in the background without blocking UI startup
+
+        之后的initialize_models会等待预加载完成并复用其结果。
+        A later initialize_models call waits for the preload and reuses its result.
+        """
+        if not self.is_initialized:
+            return
+
+        self.model_manager.start_background_refresh()
+
     def process_case_summary(
         self, case_input: str, model_id: str, custom_system_prompt: Optional[str] = None
     ) -> str:
@@ -139,43 +165,61 @@ class AppController:
             raise CaseSummaryError("应用未初始化 / Application not initialized")
 
         try:
-            self.logger.info(
-                f"开始处理案例总结，模型: {model_id} / Starting case summary processing, model: {model_id}"
+            user_prompt, system_prompt = self._prepare_prompts(
+                case_input, model_id, custom_system_prompt
             )
 
-            # 验证输入 / Validate input
-            if not self.validate_input(case_input):
-                raise CaseSummaryError("输入验证失败 / Input validation failed")
+            # 调用模型生成总结 / Call model to generate summary
+            summary = self._generate_summary(model_id, user_prompt, system_prompt)
 
-            # 验证模型可用性 / Validate model availability
-            if not self.model_manager.is_model_available(model_id):
-                raise CaseSummaryError(
-                    f"模型不可用: {model_id} / Model not available: {model_id}"
-                )
+            self.logger.info("案例总结生成成功 / Case summary generated successfully")
+            return summary
 
-            # 加载历史参考信息 / Load history reference information
-            history_reference = self._load_history_reference(case_input)
+        except Exception as e:
+            self.logger.error(f"案例总结处理失败: {e} / Case summary processing failed: {e}")
+            raise CaseSummaryError(
+                f"案例总结处理失败: {e} / Case summary processing failed: {e}"
+            )
 
-            # 获取系统提示词 / Get system prompt
-            if custom_system_prompt:
-                system_prompt = custom_system_prompt
-            else:
-                # 优先使用激活的系统提示词 / Prefer active system prompt
-                active_prompt = self.get_active_prompt()
-                if active_prompt:
-                    system_prompt = active_prompt["content"]
-                else:
-                    system_prompt = self.config_manager.get_system_prompt()
-
-            # 构建提示词 / Build prompt
-            user_prompt = self.prompt_builder.build_prompt(
-                case_input=case_input,
-                history_reference=history_reference,
-                system_prompt=system_prompt,
+    async def aprocess_case_summary(
+        self, case_input: str, model_id: str, custom_system_prompt: Optional[str] = None
+    ) -> str:
+        """
+        异步处理案例总结请求 / Process case summary request asynchronously
+
+        历史文件读取和模型调用在默认线程池中执行，并发请求之间可以互相重叠。
+        History file loading and the model call run in the default executor, so
+        concurrent requests overlap with each other.
+
+        Args:
+            case_input: 案例输入内容 / Case input content
+            model_id: 模型ID / Model ID
+            custom_system_prompt: 自定义系统提示词 / Custom system prompt
+
+        Returns:
+            生成的案例总结 / Generated case summary
+
+        Raises:
+            CaseSummaryError: 处理失败 / Processing failed
+        """
+        if not self.is_initialized:
+            raise CaseSummaryError("应用未初始化 / Application not initialized")
+
+        try:
+            self._validate_request(case_input, model_id)
+
+            loop = asyncio.get_running_loop()
+            history_reference = await loop.run_in_executor(
+                None, self._load_history_reference, case_input
+            )
+            user_prompt, system_prompt = self._build_prompts(
+                case_input, history_reference, custom_system_prompt
             )
 
             # 调用模型生成总结 / Call model to generate summary
-            summary = self._generate_summary(model_id, user_prompt, system_prompt)
+            summary = await loop.run_in_executor(
+                None, self._generate_summary, model_id, user_prompt, system_prompt
+            )
 
             self.logger.info("案例总结生成成功 / Case summary generated successfully")
             return summary
@@ -186,6 +230,197 @@ class AppController:
                 f"案例总结处理失败: {e} / Case summary processing failed: {e}"
             )
 
+    def process_case_summary_stream(
+        self, case_input: str, model_id: str, custom_system_prompt: Optional[str] = None
+    ) -> Iterator[str]:
+        """
+        流式处理案例总结请求 / Process case summary request with streaming output
+
+        Args:
+            case_input: 案例输入内容 / Case input content
+            model_id: 模型ID / Model ID
+            custom_system_prompt: 自定义系统提示词 / Custom system prompt
+
+        Yields:
+            生成的案例总结片段 / Generated case summary chunks
+
+        Raises:
+            CaseSummaryError: 处理失败 / Processing failed
+        """
+        if not self.is_initialized:
+            raise CaseSummaryError("应用未初始化 / Application not initialized")
+
+        try:
+            user_prompt, system_prompt = self._prepare_prompts(
+                case_input, model_id, custom_system_prompt
+            )
+
+            app_config = self._app_config
+            messages = self.bedrock_client.format_messages(user_prompt)
+
+            # 流式调用模型 / Stream model output
+            yield from self.bedrock_client.converse_stream(
+                model_id=model_id,
+                messages=messages,
+                system_prompt=system_prompt,
+                max_tokens=app_config.get("max_tokens", 4000),
+                temperature=app_config.get("temperature", 0.7),
+                latency_optimized=app_config.get("latency_optimized", False),
+            )
+
+            self.logger.info("案例总结生成成功 / Case summary generated successfully")
+
+        except Exception as e:
+            self.logger.error(f"案例总结处理失败: {e} / Case summary processing failed: {e}")
+            raise CaseSummaryError(
+                f"案例总结处理失败: {e} / Case summary processing failed: {e}"
+            )
+
+    def submit_case_summaries_batch(
+        self,
+        case_inputs: List[str],
+        model_id: str,
+        s3_input_uri: str,
+        s3_output_uri: str,
+        role_arn: str,
+        custom_system_prompt: Optional[str] = None,
+    ) -> str:
+        """
+        以批量推理方式提交多个案例总结 / Submit multiple case summaries as a batch inference job
+
+        适用于对延迟不敏感的场景，结果通过BedrockClient.iter_batch_results读取。
+        For latency-insensitive workloads; read results with BedrockClient.iter_batch_results.
+
+        Args:
+            case_inputs: 案例输入列表 / List of case inputs
+            model_id: 模型ID / Model ID
+            s3_input_uri: 输入JSONL的S3 URI / S3 URI of the input JSONL
+            s3_output_uri: 输出目录的S3 URI / S3 URI of the output prefix
+            role_arn: Bedrock服务角色ARN / Bedrock service role ARN
+            custom_system_prompt: 自定义系统提示词 / Custom system prompt
+
+        Returns:
+            批量任务ARN / Batch job ARN
+
+        Raises:
+            CaseSummaryError: 提交失败 / Submission failed
+        """
+        if not self.is_initialized:
+            raise CaseSummaryError("应用未初始化 / Application not initialized")
+
+        try:
+            app_config = self._app_config
+            inputs = []
+            for case_input in case_inputs:
+                user_prompt, system_prompt = self._prepare_prompts(
+                    case_input, model_id, custom_system_prompt
+                )
+                inputs.append(
+                    self.bedrock_client.build_batch_model_input(
+                        model_id,
+                        user_prompt,
+                        system_prompt,
+                        max_tokens=app_config.get("max_tokens", 4000),
+                        temperature=app_config.get("temperature", 0.7),
+                    )
+                )
+
+            return self.bedrock_client.submit_batch(
+                model_id, inputs, s3_input_uri, s3_output_uri, role_arn
+            )
+
+        except Exception as e:
+            self.logger.error(f"批量总结提交失败: {e} / Batch summary submission failed: {e}")
+            raise CaseSummaryError(
+                f"批量总结提交失败: {e} / Batch summary submission failed: {e}"
+            )
+
+    def _prepare_prompts(
+        self, case_input: str, model_id: str, custom_system_prompt: Optional[str]
+    ) -> Tuple[str, str]:
+        """
+        验证输入并构建用户提示词与系统提示词 / Validate input and build user and system prompts
+
+        Args:
+            case_input: 案例输入内容 / Case input content
+            model_id: 模型ID / Model ID
+            custom_system_prompt: 自定义系统提示词 / Custom system prompt
+
+        Returns:
+            (用户提示词, 系统提示词) / (User prompt, system prompt)
+
+        Raises:
+            CaseSummaryError: 输入或模型无效 / Invalid input or model
+        """
+        self._validate_request(case_input, model_id)
+
+        # 加载历史参考信息 / Load history reference information
+        history_reference = self._load_history_reference(case_input)
+
+        return self._build_prompts(case_input, history_reference, custom_system_prompt)
+
+    def _validate_request(self, case_input: str, model_id: str) -> None:
+        """
+        验证输入与模型可用性 / Validate input and model availability
+
+        Args:
+            case_input: 案例输入内容 / Case input content
+            model_id: 模型ID / Model ID
+
+        Raises:
+            CaseSummaryError: 输入或模型无效 / Invalid input or model
+        """
+        self.logger.info(
+            f"开始处理案例总结，模型: {model_id} / Starting case summary processing, model: {model_id}"
+        )
+
+        # 验证输入 / Validate input
+        if not self.validate_input(case_input):
+            raise CaseSummaryError("输入验证失败 / Input validation failed")
+
+        # 验证模型可用性 / Validate model availability
+        if not self.model_manager.is_model_available(model_id):
+            raise CaseSummaryError(
+                f"模型不可用: {model_id} / Model not available: {model_id}"
+            )
+
+    def _build_prompts(
+        self,
+        case_input: str,
+        history_reference: str,
+        custom_system_prompt: Optional[str],
+    ) -> Tuple[str, str]:
+        """
+        构建用户提示词与系统提示词 / Build user and system prompts
+
+        Args:
+            case_input: 案例输入内容 / Case input content
+            history_reference: 历史参考信息 / History reference information
+            custom_system_prompt: 自定义系统提示词 / Custom system prompt
+
+        Returns:
+            (用户提示词, 系统提示词) / (User prompt, system prompt)
+        """
+        # 获取系统提示词 / Get system prompt
+        if custom_system_prompt:
+            system_prompt = custom_system_prompt
+        else:
+            # 优先使用激活的系统提示词 / Prefer active system prompt
+            active_prompt = self.get_active_prompt()
+            if active_prompt:
+                system_prompt = active_prompt["content"]
+            else:
+                system_prompt = self._system_prompt
+
+        # 构建提示词 / Build prompt
+        user_prompt = self.prompt_builder.build_prompt(
+            case_input=case_input,
+            history_reference=history_reference,
+            system_prompt=system_prompt,
+        )
+
+        return user_prompt, system_prompt
+
     def validate_input(self, case_input: str) -> bool:
         """
         验证输入内容 / Validate input content
@@ -217,7 +452,9 @@ class AppController:
             raise CaseSummaryError("应用未初始化 / Application not initialized")
 
         try:
-            self.available_models = self.model_manager.refresh_available_models()
+            self.available_models = self.model_manager.refresh_available_models(
+                force_refresh=True
+            )
             self.logger.info("模型列表刷新成功 / Model list refreshed successfully")
             return self.available_models
         except Exception as e:
@@ -256,6 +493,18 @@ class AppController:
             self.logger.error(f"获取默认模型失败: {e} / Failed to get default model: {e}")
             return "anthropic.claude-3-5-sonnet-20241022-v2:0"
 
+    def get_default_model_fast(self) -> str:
+        """
+        不等待模型列表加载获取默认模型ID / Get the default model ID without waiting for the model list
+
+        Returns:
+            默认模型ID / Default model ID
+        """
+        if not self.is_initialized:
+            return "anthropic.claude-3-5-sonnet-20241022-v2:0"
+
+        return self.model_manager.get_default_model_fast()
+
     def get_app_config(self) -> Dict[str, Any]:
         """
         获取应用配置 / Get application configuration
@@ -270,7 +519,33 @@ class AppController:
                 "temperature": 0.7,
             }
 
-        return self.config_manager.get_app_config()
+        return self._app_config
+
+    def reload_config(self) -> Dict[str, Any]:
+        """
+        重新加载配置并刷新配置快照 / Reload configuration and refresh config snapshots
+
+        Returns:
+            重新加载后的应用配置 / Reloaded application configuration
+
+        Raises:
+            CaseSummaryError: 配置重新加载失败 / Configuration reload failed
+        """
+        try:
+            self.config_manager.reload_config()
+            self._snapshot_config()
+            self.logger.info("配置重新加载成功 / Configuration reloaded successfully")
+            return self._app_config
+        except Exception as e:
+            self.logger.error(f"配置重新加载失败: {e} / Configuration reload failed: {e}")
+            raise CaseSummaryError(
+                f"配置重新加载失败: {e} / Configuration reload failed: {e}"
+            )
+
+    def _snapshot_config(self):
+        """缓存应用配置与默认系统提示词 / Snapshot app config and default system prompt"""
+        self._app_config = self.config_manager.get_app_config()
+        self._system_prompt = self.config_manager.get_system_prompt()
 
     # 系统提示词管理方法 / System prompt management methods
 
@@ -422,6 +697,10 @@ class AppController:
         Returns:
             历史参考信息 / History reference information
         """
+        # 输入为空时无需读取和处理历史文件 / Skip reading and processing history files for empty input
+        if not case_input or not case_input.strip():
+            return ""
+
         try:
             # 加载历史文件 / Load history files
             history_files = self.history_processor.load_history_files()
@@ -430,18 +709,12 @@ class AppController:
                 self.logger.info("未找到历史参考文件 / No history reference files found")
                 return ""
 
-            # 处理历史内容 / Process history content
-            history_content = self.history_processor.process_history_content(
-                history_files
+            # 单次排序筛选相关段落，仅在回退时拼接完整历史文本
+            # Rank sections once and join the full history only for the fallbacks
+            return self.history_processor.filter_relevant_history_files(
+                case_input, history_files
             )
 
-            # 筛选相关历史信息 / Filter relevant history information
-            relevant_history = self.history_processor.filter_relevant_history(
-                case_input, history_content
-            )
-
-            return relevant_history
-
         except HistoryProcessingError as e:
             self.logger.warning(f"历史信息处理失败: {e} / History processing failed: {e}")
             return ""
@@ -466,8 +739,8 @@ class AppController:
             生成的总结 / Generated summary
         """
         try:
-            # 获取应用配置 / Get app configuration
-            app_config = self.get_app_config()
+            # 使用缓存的应用配置 / Use cached app configuration
+            app_config = self._app_config
 
             # 格式化消息 / Format messages
             messages = self.bedrock_client.format_messages(user_prompt)
@@ -479,6 +752,8 @@ class AppController:
                 system_prompt=system_prompt,
                 max_tokens=app_config.get("max_tokens", 4000),
                 temperature=app_config.get("temperature", 0.7),
+                latency_optimized=app_config.get("latency_optimized", False),
+                use_cache=app_config.get("response_cache", False),
             )
 
             return summary
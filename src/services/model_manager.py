@@ -5,14 +5,52 @@
 Responsible for managing available model list and model-related operations
 """
 
+import itertools
 import logging
-from typing import Dict, List, Any, Optional
+import threading
+import time
+from typing import Dict, List, Any, Optional, Tuple
 from src.clients.bedrock_client import BedrockClient, ModelInvocationError
 
+# 分组模型列表的默认缓存时间（秒） / Default TTL of the categorized model list, in seconds
+DEFAULT_MODEL_CACHE_TTL = 300
+
+# 模型访问验证结果的缓存时间（秒），失败结果较短以便尽快重试
+# TTL of model access validation results, in seconds; failures expire sooner so they are retried
+_ACCESS_OK_TTL = 600
+_ACCESS_FAIL_TTL = 60
+
+# 各类别的默认模型 / Default model of each category
+DEFAULT_MODELS = {
+    "claude": "anthropic.claude-3-5-sonnet-20241022-v2:0",
+    "nova": "amazon.nova-pro-v1:0",
+    "deepseek": "deepseek.deepseek-v2.5",
+    "openai": "openai.gpt-4o-2024-08-06",
+}
+
+# 默认模型的优先顺序 / Preference order for the default model
+_PREFERRED_MODELS = (
+    "anthropic.claude-3-5-sonnet-20241022-v2:0",
+    "anthropic.claude-3-sonnet-20240229-v1:0",
+    "amazon.nova-pro-v1:0",
+    "deepseek.deepseek-v2.5",
+)
+
+# UI中的类别顺序及标签 / Category order and labels in the UI
+_CATEGORY_LABELS = {
+    "claude": "Claude (Anthropic)",
+    "nova": "Nova (Amazon)",
+    "deepseek": "DeepSeek",
+    "openai": "OpenAI",
+}
+
 
 class ModelManager:
     """模型管理器 / Model Manager"""
 
+    # 默认模型配置，所有实例共享 / Default model configuration, shared by all instances
+    default_models = DEFAULT_MODELS
+
     def __init__(self, bedrock_client: BedrockClient, config: Dict[str, Any]):
         """
         初始化模型管理器 / Initialize model manager
@@ -28,30 +66,55 @@ class ModelManager:
         # 缓存的模型列表 / Cached model list
         self._cached_models: Optional[List[Dict[str, Any]]] = None
         self._categorized_models: Optional[Dict[str, List[Dict[str, Any]]]] = None
-
-        # 默认模型配置 / Default model configuration
-        self.default_models = {
-            "claude": "anthropic.claude-3-5-sonnet-20241022-v2:0",
-            "nova": "amazon.nova-pro-v1:0",
-            "deepseek": "deepseek.deepseek-v2.5",
-            "openai": "openai.gpt-4o-2024-08-06",
-        }
-
-    def refresh_available_models(self) -> Dict[str, List[Dict[str, Any]]]:
+        # 后台预加载线程与完成事件 / Background preload thread and completion event
+        self._pending_refresh: Optional[threading.Thread] = None
+        self.models_ready = threading.Event()
+        # 缓存时间戳与有效期 / Cache timestamp and TTL
+        self._cache_timestamp = time.monotonic()
+        # 缓存被显式失效后，下次刷新绕过客户端缓存 / After explicit invalidation the next refresh bypasses the client cache
+        self._force_next_refresh = False
+        self.cache_ttl = (config.get("app") or {}).get(
+            "model_cache_ttl"
+        ) or DEFAULT_MODEL_CACHE_TTL
+
+        # 由分组字典派生的缓存及其来源 / Caches derived from the categorized dict, and their source
+        self._derived_source: Optional[Dict[str, List[Dict[str, Any]]]] = None
+        self._model_by_id: Optional[Dict[str, Dict[str, Any]]] = None
+        self._supported_cache: Optional[List[Dict[str, Any]]] = None
+        self._ui_cache: Optional[List[Dict[str, str]]] = None
+        # 模型访问验证结果及其时间戳 / Model access validation results and their timestamps
+        self._access_cache: Dict[str, Tuple[bool, float]] = {}
+
+    def refresh_available_models(
+        self, force_refresh: bool = False
+    ) -> Dict[str, List[Dict[str, Any]]]:
         """
         刷新可用模型列表 / Refresh available models list
 
+        Args:
+            force_refresh: 是否忽略客户端缓存 / Whether to bypass the client-side cache
+
         Returns:
             按类别分组的模型字典 / Dictionary of models grouped by category
 
         Raises:
             ModelInvocationError: 获取模型列表失败 / Failed to get model list
         """
+        # 后台预加载进行中时等待其完成并复用结果 / Wait for an in-flight background preload and reuse its result
+        pending = self._pending_refresh
+        if pending is not None and pending is not threading.current_thread():
+            pending.join()
+            self._pending_refresh = None
+            if not force_refresh and self._categorized_models is not None:
+                return self._categorized_models
+
         try:
             self.logger.info("开始刷新可用模型列表 / Starting to refresh available models list")
 
             # 从API获取模型列表 / Get model list from API
-            models = self.bedrock_client.list_foundation_models()
+            models = self.bedrock_client.list_foundation_models(
+                force_refresh=force_refresh
+            )
 
             # 缓存模型列表 / Cache model list
             self._cached_models = models
@@ -61,13 +124,20 @@ class ModelManager:
                 models
             )
 
-            # 为每个模型添加显示名称 / Add display name for each model
-            for category, category_models in self._categorized_models.items():
+            # 为每个模型添加显示名称；名称由模型ID纯计算并在客户端按ID缓存，
+            # 线程池只会增加开销。客户端缓存的模型字典在多次刷新间共享，已命名的跳过。
+            # Add display name for each model. Names are computed purely from the
+            # model ID and cached per ID by the client, so a thread pool would only
+            # add overhead. Model dicts from the client cache are shared across
+            # refreshes, so already named ones are skipped.
+            get_display_name = self.bedrock_client.get_model_display_name
+            for category_models in self._categorized_models.values():
                 for model in category_models:
-                    model["displayName"] = self.bedrock_client.get_model_display_name(
-                        model["modelId"]
-                    )
+                    if "displayName" not in model:
+                        model["displayName"] = get_display_name(model["modelId"])
 
+            self._cache_timestamp = time.monotonic()
+            self._force_next_refresh = False
             self.logger.info(
                 f"成功刷新模型列表，共 {len(models)} 个模型 / Successfully refreshed model list, {len(models)} models total"
             )
@@ -78,38 +148,92 @@ class ModelManager:
             self.logger.error(f"刷新模型列表失败: {e} / Failed to refresh model list: {e}")
             # 如果刷新失败，返回配置文件中的默认模型 / If refresh fails, return default models from config
             return self._get_fallback_models()
+        finally:
+            self.models_ready.set()
+
+    def start_background_refresh(self) -> threading.Event:
+        """
+        在后台线程中预加载模型列表 / Preload the model list in a background thread
+
+        启动时无需等待Bedrock往返即可先渲染界面；之后的refresh_available_models
+        调用会等待该线程并复用其结果。
+        Lets the UI render without waiting for the Bedrock round trip; a later
+        refresh_available_models call waits for the thread and reuses its result.
+
+        Returns:
+            模型列表加载完成事件 / Event set once the model list has loaded
+        """
+        if self._pending_refresh is None and self._categorized_models is None:
+            self._pending_refresh = threading.Thread(
+                target=self.refresh_available_models,
+                name="model-list-preload",
+                daemon=True,
+            )
+            self._pending_refresh.start()
+        return self.models_ready
+
+    def get_default_model_fast(self) -> str:
+        """
+        不访问网络获取默认模型ID / Get the default model ID without touching the network
+
+        Returns:
+            配置的默认Claude模型ID / Configured default Claude model ID
+        """
+        return self.default_models["claude"]
 
     def get_models_by_category(self) -> Dict[str, List[Dict[str, Any]]]:
         """
         按四个类别获取模型：Claude、Nova、DeepSeek、OpenAI / Get models by four categories
 
+        缓存超过cache_ttl秒或被invalidate_cache失效后，从API重新获取模型列表。
+        Once the cache is older than cache_ttl seconds or has been invalidated via
+        invalidate_cache, the model list is fetched from the API again.
+
         Returns:
             按类别分组的模型字典 / Dictionary of models grouped by category
         """
         if self._categorized_models is None:
-            # 如果没有缓存，尝试刷新 / If no cache, try to refresh
-            try:
-                return self.refresh_available_models()
-            except Exception as e:
-                self.logger.warning(
-                    f"无法获取实时模型列表，使用配置文件默认值: {e} / Cannot get real-time model list, using config defaults: {e}"
-                )
-                return self._get_fallback_models()
+            # 首次加载可以使用客户端缓存 / The first load may use the client-side cache
+            force_refresh = self._force_next_refresh
+        elif time.monotonic() - self._cache_timestamp >= self.cache_ttl:
+            force_refresh = True
+        else:
+            return self._categorized_models
+
+        # 如果没有缓存或缓存过期，尝试刷新 / If no cache or the cache expired, try to refresh
+        try:
+            return self.refresh_available_models(force_refresh=force_refresh)
+        except Exception as e:
+            self.logger.warning(
+                f"无法获取实时模型列表，使用配置文件默认值: {e} / Cannot get real-time model list, using config defaults: {e}"
+            )
+            return self._get_fallback_models()
 
-        return self._categorized_models
+    def invalidate_cache(self) -> None:
+        """清空缓存的模型列表和访问验证结果，下次访问时重新刷新 / Drop the cached model list and access results so the next access refreshes them"""
+        self._cached_models = None
+        self._categorized_models = None
+        self._force_next_refresh = True
+        self._access_cache.clear()
 
     def get_supported_models_only(self) -> List[Dict[str, Any]]:
         """
         仅获取支持的四类模型 / Get only the four supported model types
 
+        结果在模型列表刷新前被缓存，调用方不应修改。
+        The result is cached until the model list changes; callers must not mutate it.
+
         Returns:
             支持的模型列表 / List of supported models
         """
-        categorized = self.get_models_by_category()
-
-        supported_models = []
-        for category_models in categorized.values():
-            supported_models.extend(category_models)
+        categorized = self._current_categorized_models()
+        # 只读取一次属性并返回局部变量，其他线程可能同时替换分组字典并清空缓存
+        # Read the attribute once and return the local; another thread may swap the dict and clear the cache
+        supported_models = self._supported_cache
+        if supported_models is None:
+            supported_models = list(itertools.chain.from_iterable(categorized.values()))
+            if self._derived_source is categorized:
+                self._supported_cache = supported_models
 
         return supported_models
 
@@ -123,13 +247,7 @@ class ModelManager:
         Returns:
             模型信息字典或None / Model info dictionary or None
         """
-        supported_models = self.get_supported_models_only()
-
-        for model in supported_models:
-            if model.get("modelId") == model_id:
-                return model
-
-        return None
+        return self._get_model_index().get(model_id)
 
     def is_model_available(self, model_id: str) -> bool:
         """
@@ -141,7 +259,46 @@ class ModelManager:
         Returns:
             是否可用 / Whether available
         """
-        return self.get_model_info(model_id) is not None
+        return model_id in self._get_model_index()
+
+    def _current_categorized_models(self) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        获取当前分组模型，分组字典被替换时清空派生缓存 /
+        Get the current categorized models, clearing derived caches when the dict is replaced
+
+        刷新、回退或直接赋值都会产生新的分组字典，因此无需在各处手动失效。
+        A refresh, fallback or direct assignment always produces a new categorized
+        dict, so no call site has to invalidate the caches by hand.
+
+        Returns:
+            按类别分组的模型字典 / Dictionary of models grouped by category
+        """
+        categorized = self.get_models_by_category()
+        if categorized is not self._derived_source:
+            self._derived_source = categorized
+            self._model_by_id = None
+            self._supported_cache = None
+            self._ui_cache = None
+        return categorized
+
+    def _get_model_index(self) -> Dict[str, Dict[str, Any]]:
+        """
+        获取模型ID到模型信息的索引 / Get the model ID to model info index
+
+        Returns:
+            模型ID索引 / Model ID index
+        """
+        categorized = self._current_categorized_models()
+        model_by_id = self._model_by_id
+        if model_by_id is None:
+            model_by_id = {}
+            for category_models in categorized.values():
+                for model in category_models:
+                    # 重复ID保留第一个，与顺序查找一致 / Keep the first of duplicate IDs, matching a linear scan
+                    model_by_id.setdefault(model.get("modelId"), model)
+            if self._derived_source is categorized:
+                self._model_by_id = model_by_id
+        return model_by_id
 
     def get_default_model(self) -> str:
         """
@@ -150,16 +307,9 @@ class ModelManager:
         Returns:
             默认模型ID / Default model ID
         """
-        # 优先使用Claude 3.5 Sonnet / Prefer Claude 3.5 Sonnet
-        preferred_models = [
-            "anthropic.claude-3-5-sonnet-20241022-v2:0",
-            "anthropic.claude-3-sonnet-20240229-v1:0",
-            "amazon.nova-pro-v1:0",
-            "deepseek.deepseek-v2.5",
-        ]
-
-        # 检查首选模型是否可用 / Check if preferred models are available
-        for model_id in preferred_models:
+        # 优先使用Claude 3.5 Sonnet，检查首选模型是否可用
+        # Prefer Claude 3.5 Sonnet; check if preferred models are available
+        for model_id in _PREFERRED_MODELS:
             if self.is_model_available(model_id):
                 return model_id
 
@@ -175,28 +325,27 @@ class ModelManager:
         """
         获取用于UI显示的模型列表 / Get model list for UI display
 
+        结果在模型列表刷新前被缓存，调用方不应修改。
+        The result is cached until the model list changes; callers must not mutate it.
+
         Returns:
             UI模型列表 / UI model list
         """
-        categorized = self.get_models_by_category()
+        categorized = self._current_categorized_models()
+        ui_cache = self._ui_cache
+        if ui_cache is not None:
+            return ui_cache
+
         ui_models = []
 
         # 按类别顺序添加模型 / Add models in category order
-        category_order = ["claude", "nova", "deepseek", "openai"]
-        category_labels = {
-            "claude": "Claude (Anthropic)",
-            "nova": "Nova (Amazon)",
-            "deepseek": "DeepSeek",
-            "openai": "OpenAI",
-        }
-
-        for category in category_order:
+        for category, category_label in _CATEGORY_LABELS.items():
             if category in categorized and categorized[category]:
                 # 添加类别分隔符 / Add category separator
                 ui_models.append(
                     {
                         "value": f"---{category}---",
-                        "label": f"--- {category_labels[category]} ---",
+                        "label": f"--- {category_label} ---",
                         "disabled": True,
                     }
                 )
@@ -211,6 +360,8 @@ class ModelManager:
                         }
                     )
 
+        if self._derived_source is categorized:
+            self._ui_cache = ui_models
         return ui_models
 
     def _get_fallback_models(self) -> Dict[str, List[Dict[str, Any]]]:
@@ -253,15 +404,31 @@ class ModelManager:
         Returns:
             是否有访问权限 / Whether has access permission
         """
+        # 缓存未过期时直接返回，避免重复的网络调用 / Return cached results while fresh to avoid repeated network calls
+        now = time.monotonic()
+        cached = self._access_cache.get(model_id)
+        if cached is not None:
+            accessible, checked_at = cached
+            ttl = _ACCESS_OK_TTL if accessible else _ACCESS_FAIL_TTL
+            if now - checked_at < ttl:
+                return accessible
+
         try:
             # 尝试调用模型进行简单测试 / Try to call model for simple test
             messages = self.bedrock_client.format_messages("test")
             self.bedrock_client.converse(
-                model_id=model_id, messages=messages, max_tokens=10, temperature=0.1
+                model_id=model_id,
+                messages=messages,
+                max_tokens=10,
+                temperature=0.1,
+                use_cache=False,
             )
-            return True
+            accessible = True
         except Exception as e:
             self.logger.warning(
                 f"模型 {model_id} 访问验证失败: {e} / Model {model_id} access validation failed: {e}"
             )
-            return False
+            accessible = False
+
+        self._access_cache[model_id] = (accessible, now)
+        return accessible
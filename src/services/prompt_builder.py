@@ -5,9 +5,47 @@ Prompt构建器 / Prompt Builder
 Responsible for building and formatting prompts for LLM
 """
 
+import bisect
+import itertools
 import logging
+import re
 from typing import Optional
 
+# 行首尾空白（不含换行符） / Leading/trailing whitespace on a line, excluding newlines
+_LINE_EDGE_WS_RE = re.compile(r"^[^\S\n]+|[^\S\n]+$", re.MULTILINE)
+
+# 一个或多个空行 / One or more empty lines
+_BLANK_RUN_RE = re.compile(r"\n{2,}")
+
+# 用户提示词的固定片段，与历史信息和案例内容一次拼接
+# Fixed user prompt fragments, joined with the history and case content in one go
+_HISTORY_SECTION_HEAD = "## 历史参考信息 / Historical Reference Information\n"
+_CASE_SECTION_HEAD = "## 需要总结的案例 / Case to Summarize\n"
+_REQUIREMENTS_WITH_HISTORY = (
+    "\n\n## 输出要求 / Output Requirements\n"
+    "请根据上述历史参考信息和案例内容，生成一个结构化、专业的案例总结。\n"
+    "Please generate a structured and professional case summary based on the above historical reference information and case content."
+)
+_REQUIREMENTS_WITHOUT_HISTORY = (
+    "\n\n## 输出要求 / Output Requirements\n"
+    "请根据案例内容，生成一个结构化、专业的案例总结。\n"
+    "Please generate a structured and professional case summary based on the case content."
+)
+
+# 未提供系统提示词时使用的默认值 / Default used when no system prompt is given
+_DEFAULT_SYSTEM_PROMPT = """你是一个专业的案例总结助手。请根据提供的历史参考信息和新的案例输入，生成一个结构化、专业的案例总结。
+
+总结应该包含：
+1. 案例概述
+2. 关键要点
+3. 分析结论
+4. 建议措施
+
+请保持总结的客观性和专业性。"""
+
+# 截断时优先保留的行：标题或包含重要标记 / Lines kept first when truncating: headers or lines with importance markers
+_IMPORTANT_LINE_RE = re.compile(r"^#|重要|关键|important|key", re.IGNORECASE)
+
 
 class PromptBuilder:
     """Prompt构建器 / Prompt Builder"""
@@ -35,35 +73,24 @@ class PromptBuilder:
             # 格式化历史参考信息 / Format history reference information
             formatted_history = self.format_history_reference(history_reference)
 
-            # 构建完整的用户提示词 / Build complete user prompt
-            user_prompt_parts = []
-
-            # 添加历史参考信息 / Add history reference information
-            if formatted_history.strip():
-                user_prompt_parts.append("## 历史参考信息 / Historical Reference Information")
-                user_prompt_parts.append(formatted_history)
-                user_prompt_parts.append("")  # 空行分隔 / Empty line separator
-
-            # 添加案例输入 / Add case input
-            user_prompt_parts.append("## 需要总结的案例 / Case to Summarize")
-            user_prompt_parts.append(case_input.strip())
-            user_prompt_parts.append("")  # 空行分隔 / Empty line separator
-
-            # 添加输出要求 / Add output requirements
-            user_prompt_parts.append("## 输出要求 / Output Requirements")
-            if formatted_history.strip():
-                user_prompt_parts.append("请根据上述历史参考信息和案例内容，生成一个结构化、专业的案例总结。")
-                user_prompt_parts.append(
-                    "Please generate a structured and professional case summary based on the above historical reference information and case content."
+            # 格式化结果已去除首尾空白，为空即没有历史信息
+            # The formatted result has no surrounding whitespace, so empty means no history
+            if formatted_history:
+                user_prompt = "".join(
+                    (
+                        _HISTORY_SECTION_HEAD,
+                        formatted_history,
+                        "\n\n",
+                        _CASE_SECTION_HEAD,
+                        case_input.strip(),
+                        _REQUIREMENTS_WITH_HISTORY,
+                    )
                 )
             else:
-                user_prompt_parts.append("请根据案例内容，生成一个结构化、专业的案例总结。")
-                user_prompt_parts.append(
-                    "Please generate a structured and professional case summary based on the case content."
+                user_prompt = "".join(
+                    (_CASE_SECTION_HEAD, case_input.strip(), _REQUIREMENTS_WITHOUT_HISTORY)
                 )
 
-            user_prompt = "\n".join(user_prompt_parts)
-
             # 检查长度并截断如果需要 / Check length and truncate if needed
             user_prompt = self._ensure_prompt_length(user_prompt, system_prompt)
 
@@ -91,23 +118,11 @@ class PromptBuilder:
         if not history or not history.strip():
             return ""
 
-        # 清理和格式化历史信息 / Clean and format history information
-        lines = history.split("\n")
-        formatted_lines = []
-
-        for line in lines:
-            line = line.strip()
-            if line:
-                formatted_lines.append(line)
-            elif formatted_lines and formatted_lines[-1] != "":
-                # 保留单个空行作为段落分隔 / Keep single empty line as paragraph separator
-                formatted_lines.append("")
-
-        # 移除末尾的空行 / Remove trailing empty lines
-        while formatted_lines and formatted_lines[-1] == "":
-            formatted_lines.pop()
-
-        formatted_history = "\n".join(formatted_lines)
+        # 清理和格式化历史信息：去除每行首尾空白，连续空行只保留一个作为段落分隔，去除首尾空行
+        # Clean and format history: strip each line, keep a single empty line as the
+        # paragraph separator and drop leading/trailing empty lines
+        formatted_history = _LINE_EDGE_WS_RE.sub("", history)
+        formatted_history = _BLANK_RUN_RE.sub("\n\n", formatted_history).strip("\n")
 
         # 如果历史信息太长，进行智能截断 / If history is too long, perform intelligent truncation
         if len(formatted_history) > 15000:  # 历史信息最大长度 / Maximum history length
@@ -142,6 +157,10 @@ class PromptBuilder:
             )
             available_length = 1000
 
+        # 用户提示词已在可用长度内时无需截断 / No truncation needed when the user prompt already fits
+        if len(user_prompt) <= available_length:
+            return user_prompt
+
         # 智能截断用户提示词 / Intelligently truncate user prompt
         truncated_prompt = self._truncate_prompt_intelligently(
             user_prompt, available_length
@@ -171,13 +190,7 @@ class PromptBuilder:
 
         for line in lines:
             line = line.strip()
-            if (
-                line.startswith("#")
-                or "重要" in line
-                or "关键" in line
-                or "important" in line.lower()
-                or "key" in line.lower()
-            ):
+            if _IMPORTANT_LINE_RE.search(line):
                 important_lines.append(line)
             elif line:
                 content_lines.append(line)
@@ -185,15 +198,14 @@ class PromptBuilder:
         # 构建截断后的历史信息 / Build truncated history
         truncated_lines = important_lines.copy()
 
-        # 添加部分内容行，直到达到长度限制 / Add content lines until length limit
-        current_length = len("\n".join(truncated_lines))
+        # 添加部分内容行，直到达到长度限制；用前缀和与二分查找定位截断点
+        # Add content lines until length limit, locating the cut with prefix sums and binary search
+        current_length = max(sum(map(len, truncated_lines)) + len(truncated_lines) - 1, 0)
         target_length = 12000  # 历史信息截断目标长度 / Target length for history truncation
 
-        for line in content_lines:
-            if current_length + len(line) + 1 > target_length:
-                break
-            truncated_lines.append(line)
-            current_length += len(line) + 1
+        cumulative_len = list(itertools.accumulate(len(line) + 1 for line in content_lines))
+        cut = bisect.bisect_right(cumulative_len, target_length - current_length)
+        truncated_lines.extend(content_lines[:cut])
 
         # 添加截断提示 / Add truncation notice
         if len(truncated_lines) < len(lines):
@@ -220,50 +232,44 @@ class PromptBuilder:
 
         lines = prompt.split("\n")
 
-        # 查找关键部分 / Find key sections
+        # 单次遍历查找案例部分并记录行长度前缀和，cumulative_len[i]为前i行（含换行符）的长度
+        # One pass finds the case section and records prefix sums: cumulative_len[i] is
+        # the length of the first i lines, newlines included
         case_section_start = -1
-        requirements_section_start = -1
-
+        cumulative_len = [0]
+        total = 0
         for i, line in enumerate(lines):
             if "需要总结的案例" in line or "Case to Summarize" in line:
                 case_section_start = i
-            elif "输出要求" in line or "Output Requirements" in line:
-                requirements_section_start = i
-
-        # 优先保留案例内容和输出要求 / Prioritize keeping case content and output requirements
-        essential_lines = []
+            total += len(line) + 1
+            cumulative_len.append(total)
 
+        # 优先保留案例内容和输出要求；找不到关键部分时保留后半部分
+        # Prioritize keeping case content and output requirements; keep the latter half if not found
         if case_section_start >= 0:
-            if requirements_section_start >= 0:
-                # 保留案例部分和输出要求 / Keep case section and output requirements
-                essential_lines = lines[case_section_start:]
-            else:
-                # 只保留案例部分 / Only keep case section
-                essential_lines = lines[case_section_start:]
+            essential_start = case_section_start
         else:
-            # 如果找不到关键部分，保留后半部分 / If key sections not found, keep latter half
-            essential_lines = lines[len(lines) // 2 :]
-
-        # 从essential_lines开始，逐行添加直到达到长度限制 / Add lines from essential_lines until length limit
-        truncated_lines = []
-        current_length = 0
-
-        for line in essential_lines:
-            if (
-                current_length + len(line) + 1 > max_length - 100
-            ):  # 保留100字符缓冲 / Reserve 100 characters buffer
-                break
-            truncated_lines.append(line)
-            current_length += len(line) + 1
+            essential_start = len(lines) // 2
+
+        # 从essential_start开始逐行保留直到达到长度限制，用二分查找定位截断点
+        # Keep lines from essential_start until the length limit, locating the cut by binary search
+        budget = max_length - 100  # 保留100字符缓冲 / Reserve 100 characters buffer
+        base = cumulative_len[essential_start]
+        essential_end = (
+            bisect.bisect_right(cumulative_len, base + budget, essential_start + 1) - 1
+        )
+        truncated_lines = lines[essential_start:essential_end]
+        current_length = cumulative_len[essential_end] - base
 
         # 如果还有空间，尝试添加历史信息的开头部分 / If there's still space, try to add beginning of history
         if current_length < max_length * 0.8 and case_section_start > 0:
-            history_lines = lines[:case_section_start]
-            for line in history_lines:
-                if current_length + len(line) + 1 > max_length - 100:
-                    break
-                truncated_lines.insert(-len(essential_lines), line)
-                current_length += len(line) + 1
+            history_end = (
+                bisect.bisect_right(
+                    cumulative_len, budget - current_length, 1, case_section_start + 1
+                )
+                - 1
+            )
+            truncated_lines = lines[:history_end] + truncated_lines
 
         return "\n".join(truncated_lines)
 
@@ -279,15 +285,7 @@ class PromptBuilder:
         """
         if not system_prompt or not system_prompt.strip():
             # 使用默认系统提示词 / Use default system prompt
-            system_prompt = """你是一个专业的案例总结助手。请根据提供的历史参考信息和新的案例输入，生成一个结构化、专业的案例总结。
-
-总结应该包含：
-1. 案例概述
-2. 关键要点
-3. 分析结论
-4. 建议措施
-
-请保持总结的客观性和专业性。"""
+            return _DEFAULT_SYSTEM_PROMPT
 
         return system_prompt.strip()
 
@@ -41,6 +41,11 @@ class GradioInterface:
         Returns:
             Gradio Blocks界面 / Gradio Blocks interface
         """
+        # 后台预加载完整模型列表，界面先只显示默认模型
+        # Preload the full model list in the background; the UI shows only the default model at first
+        self.app_controller.start_model_loading()
+        default_model = self.app_controller.get_default_model_fast()
+
         with gr.Blocks(
             title=self.app_config.get("title", "案例总结生成器"), theme=gr.themes.Soft()
         ) as interface:
@@ -91,8 +96,8 @@ class GradioInterface:
                     # 模型选择 / Model selection
                     model_dropdown = gr.Dropdown(
                         label="选择模型 / Select Model",
-                        choices=[],
-                        value=None,
+                        choices=[default_model],
+                        value=default_model,
                         interactive=True,
                     )
 
@@ -108,7 +113,7 @@ class GradioInterface:
                     # 状态显示 / Status display
                     status_text = gr.Textbox(
                         label="状态 / Status",
-                        value="就绪 / Ready",
+                        value="⏳ 正在加载模型列表… / Loading model list…",
                         interactive=False,
                         lines=2,
                     )
@@ -5,6 +5,10 @@ ConfigManager单元测试 / ConfigManager Unit Tests
 Test various functions of configuration manager, including config loading, validation and AWS credentials management
 """
 
+import json
+import os
+import stat
+
 import pytest
 import tempfile
 import yaml
@@ -70,6 +74,221 @@ class TestConfigManager:
         config_manager.load_config()
         assert non_existent_path.exists()
     
+    def test_default_config_template_not_mutated(self):
+        """测试多次创建默认配置不修改模板 / Test creating the default config repeatedly leaves the template intact"""
+        import copy
+        from src.config import config_manager as cm
+
+        snapshot = copy.deepcopy(cm._DEFAULT_CONFIG_TEMPLATE)
+        for i in range(2):
+            cm._default_config_yaml_bytes.cache_clear()
+            config_path = Path(self.temp_dir) / f"default_{i}.yaml"
+            ConfigManager(str(config_path))._create_default_config()
+            with open(config_path, encoding='utf-8') as f:
+                assert yaml.safe_load(f) == snapshot
+
+        assert cm._DEFAULT_CONFIG_TEMPLATE == snapshot
+
+    def test_create_default_config_keeps_existing_file(self):
+        """测试创建默认配置不覆盖已存在的文件 / Test creating the default config doesn't clobber an existing file"""
+        self.config_path.write_text("custom: true\n", encoding='utf-8')
+
+        ConfigManager(str(self.config_path))._create_default_config()
+
+        assert self.config_path.read_text(encoding='utf-8') == "custom: true\n"
+
+    def test_load_config_uses_cache(self):
+        """测试未变化的配置文件复用缓存 / Test unchanged config file reuses the cache"""
+        config_data = {
+            'aws': {'auth_method': 'profile', 'profile_name': 'default', 'region': 'us-east-1'},
+            'models': self.get_minimal_valid_models(),
+            'history_folder': './test_history',
+            'app': {'max_tokens': 1000, 'temperature': 0.5}
+        }
+        self.create_test_config(config_data)
+        ConfigManager.clear_cache()
+
+        first = ConfigManager(str(self.config_path)).load_config()
+        with patch('src.config.config_manager.yaml.load') as mock_load:
+            second = ConfigManager(str(self.config_path)).load_config()
+            mock_load.assert_not_called()
+
+        assert second == first
+        # 默认共享同一份数据 / Data is shared by default
+        assert second is first
+        # shared=False 返回副本，修改不影响缓存 / shared=False returns a copy, mutations don't leak into the cache
+        private = ConfigManager(str(self.config_path), shared=False).load_config()
+        assert private is not first
+        private['app']['max_tokens'] = 1
+        assert ConfigManager(str(self.config_path)).load_config()['app']['max_tokens'] == 1000
+
+        # force=True 绕过缓存 / force=True bypasses the cache
+        with patch.object(ConfigManager, '_validate_config') as mock_validate:
+            ConfigManager(str(self.config_path)).load_config(force=True)
+            mock_validate.assert_called_once()
+
+    def test_load_config_uses_json_sidecar(self):
+        """测试跨进程复用JSON旁路缓存 / Test the JSON sidecar is reused across processes"""
+        config_data = {
+            'aws': {'auth_method': 'profile', 'profile_name': 'default', 'region': 'us-east-1'},
+            'models': self.get_minimal_valid_models(),
+            'history_folder': './test_history',
+            'app': {'max_tokens': 1000, 'temperature': 0.5}
+        }
+        self.create_test_config(config_data)
+        ConfigManager.clear_cache()
+
+        first = ConfigManager(str(self.config_path)).load_config()
+        sidecar = self.config_path.with_name(self.config_path.name + '.cache.json')
+        assert sidecar.exists()
+
+        # 模拟新进程：清空内存缓存 / Simulate a fresh process: drop the in-memory cache
+        ConfigManager.clear_cache()
+        with patch('src.config.config_manager.yaml.load') as mock_load:
+            second = ConfigManager(str(self.config_path)).load_config()
+            mock_load.assert_not_called()
+        assert second == first
+
+    def test_json_sidecar_mode_and_contents(self):
+        """测试旁路缓存沿用配置文件权限且不包含AWS密钥 / Test the sidecar keeps the config file mode and never holds AWS secrets"""
+        config_data = {
+            'aws': {'auth_method': 'profile', 'profile_name': 'default', 'region': 'us-east-1'},
+            'models': self.get_minimal_valid_models(),
+            'history_folder': './test_history',
+            'app': {'max_tokens': 1000}
+        }
+        self.create_test_config(config_data)
+        os.chmod(self.config_path, 0o600)
+        ConfigManager.clear_cache()
+
+        ConfigManager(str(self.config_path)).load_config()
+        sidecar = self.config_path.with_name(self.config_path.name + '.cache.json')
+        assert stat.S_IMODE(sidecar.stat().st_mode) == 0o600
+        assert json.loads(sidecar.read_bytes().split(b'\n', 1)[1]) == config_data
+
+        # 使用AK/SK时删除旁路缓存 / The sidecar is removed for AK/SK configs
+        config_data['aws'] = {
+            'auth_method': 'ak_sk',
+            'access_key_id': 'AKIAEXAMPLE',
+            'secret_access_key': 'secret-example',
+            'region': 'us-east-1',
+        }
+        self.create_test_config(config_data)
+        ConfigManager.clear_cache()
+
+        ConfigManager(str(self.config_path)).load_config()
+        assert not sidecar.exists()
+        cache_files = [path for path in Path(self.temp_dir).iterdir() if path != self.config_path]
+        assert not any(b'secret-example' in path.read_bytes() for path in cache_files)
+
+    def test_load_aws_only(self):
+        """测试仅解析aws配置节 / Test parsing only the aws section"""
+        config_data = {
+            'aws': {'auth_method': 'profile', 'profile_name': 'dev', 'region': 'us-west-2'},
+            'models': self.get_minimal_valid_models(),
+            'history_folder': './test_history',
+            'app': {'max_tokens': 1000}
+        }
+        self.create_test_config(config_data)
+        config_manager = ConfigManager(str(self.config_path))
+
+        with patch.object(ConfigManager, 'load_config') as mock_load:
+            assert config_manager.load_aws_only() == config_data['aws']
+            mock_load.assert_not_called()
+
+    def test_load_aws_only_falls_back_for_nested_values(self):
+        """测试aws节包含嵌套值时回退到完整加载 / Test falling back to a full load for nested aws values"""
+        self.config_path.write_text(
+            "aws:\n  auth_method: profile\n  tags: {team: a}\n", encoding='utf-8'
+        )
+        config_manager = ConfigManager(str(self.config_path))
+
+        with patch.object(
+            ConfigManager, 'load_config', return_value={'aws': {'auth_method': 'profile'}}
+        ) as mock_load:
+            assert config_manager.load_aws_only() == {'auth_method': 'profile'}
+            mock_load.assert_called_once()
+
+    def test_touched_config_skips_revalidation(self):
+        """测试内容未变仅修改时间时跳过验证 / Test a touched but unchanged config skips validation"""
+        import os
+
+        config_data = {
+            'aws': {'auth_method': 'profile', 'profile_name': 'default', 'region': 'us-east-1'},
+            'models': self.get_minimal_valid_models(),
+            'history_folder': './test_history',
+            'app': {'max_tokens': 1000}
+        }
+        self.create_test_config(config_data)
+        ConfigManager.clear_cache()
+        ConfigManager(str(self.config_path)).load_config()
+
+        st = os.stat(self.config_path)
+        os.utime(self.config_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        with patch.object(ConfigManager, '_validate_config') as mock_validate:
+            loaded = ConfigManager(str(self.config_path)).load_config()
+            mock_validate.assert_not_called()
+        assert loaded['app']['max_tokens'] == 1000
+
+    def test_load_config_invalid_yaml(self):
+        """测试YAML语法错误保留原始异常链 / Test YAML syntax errors keep the original exception chain"""
+        self.config_path.write_text("aws: [unclosed\n", encoding='utf-8')
+        ConfigManager.clear_cache()
+
+        with pytest.raises(ConfigurationError, match="配置文件解析失败") as exc_info:
+            ConfigManager(str(self.config_path)).load_config()
+        assert isinstance(exc_info.value.__cause__, yaml.YAMLError)
+
+    def test_config_cache_evicts_least_recently_used(self):
+        """测试配置缓存超过上限时淘汰最久未用条目 / Test the config cache evicts the LRU entry past its limit"""
+        from src.config import config_manager as cm
+
+        config_data = {
+            'aws': {'auth_method': 'profile', 'profile_name': 'default', 'region': 'us-east-1'},
+            'models': self.get_minimal_valid_models(),
+            'history_folder': './test_history',
+            'app': {'max_tokens': 1000},
+        }
+        ConfigManager.clear_cache()
+        paths = []
+        for i in range(3):
+            path = Path(self.temp_dir) / f"config_{i}.yaml"
+            with open(path, 'w', encoding='utf-8') as f:
+                yaml.dump(config_data, f)
+            paths.append(path)
+
+        with patch.object(cm, '_CONFIG_CACHE_MAX_ENTRIES', 2):
+            ConfigManager(str(paths[0])).load_config()
+            ConfigManager(str(paths[1])).load_config()
+            ConfigManager(str(paths[0])).load_config()  # 命中，变为最近使用 / hit, now most recent
+            ConfigManager(str(paths[2])).load_config()
+
+        cached_paths = {key[0] for key in cm._CONFIG_CACHE}
+        assert cached_paths == {str(paths[0].resolve()), str(paths[2].resolve())}
+
+    def test_module_import_does_not_load_boto3(self):
+        """测试导入配置模块不加载boto3 / Test importing the config module doesn't load boto3"""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, src.config.config_manager; "
+            "sys.exit(int('boto3' in sys.modules or 'botocore' in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], cwd=Path(__file__).resolve().parents[2]
+        )
+        assert result.returncode == 0
+
+    def test_uses_libyaml_backend_when_available(self):
+        """测试libyaml可用时使用C加载器和转储器 / Test the C loader and dumper are used when libyaml is available"""
+        from src.config import config_manager as cm
+
+        if not yaml.__with_libyaml__:
+            pytest.skip("libyaml not available")
+        assert cm._Loader is yaml.CSafeLoader
+        assert cm._Dumper is yaml.CSafeDumper
+
     def test_validate_config_missing_section(self):
         """测试缺少必要配置节的验证 / Test validation with missing required sections"""
         config_data = {
@@ -87,6 +306,39 @@ class TestConfigManager:
         with pytest.raises(ConfigurationError, match="缺少必要配置节"):
             config_manager.load_config()
     
+    def test_validate_error_includes_config_path(self):
+        """测试校验错误信息包含配置路径 / Test validation errors name the failing config path"""
+        config_data = {
+            'aws': {'auth_method': 'profile', 'region': 'us-east-1'},
+            'models': self.get_minimal_valid_models(),
+            'history_folder': './test',
+            'app': {'temperature': 5}
+        }
+        self.create_test_config(config_data)
+
+        with pytest.raises(ConfigurationError, match=r"^app\.temperature: temperature必须在0-2之间"):
+            ConfigManager(str(self.config_path)).load_config()
+
+    def test_validate_model_cache_ttl_zero(self):
+        """测试模型缓存时间为0时校验失败 / Test a zero model cache TTL is rejected"""
+        config_data = {
+            'aws': {'auth_method': 'profile', 'region': 'us-east-1'},
+            'models': self.get_minimal_valid_models(),
+            'history_folder': './test',
+            'app': {'model_cache_ttl': 0}
+        }
+        self.create_test_config(config_data)
+
+        with pytest.raises(ConfigurationError, match=r"^app\.model_cache_ttl: model_cache_ttl必须是正整数"):
+            ConfigManager(str(self.config_path)).load_config()
+
+    def test_validate_config_top_level_not_mapping(self):
+        """测试顶层不是映射的配置文件 / Test a config file whose top level isn't a mapping"""
+        self.config_path.write_text("- aws\n- models\n", encoding='utf-8')
+
+        with pytest.raises(ConfigurationError, match="顶层必须是映射"):
+            ConfigManager(str(self.config_path)).load_config()
+
     def test_validate_invalid_auth_method(self):
         """测试无效的认证方式 / Test invalid authentication method"""
         config_data = {
@@ -402,3 +654,100 @@ class TestConfigManager:
         
         app = config_manager.get_app_config()
         assert app == app_config
+
+    def test_getters_return_read_only_views(self):
+        """测试凭证和模型配置以只读视图返回 / Test credentials and models are returned as read-only views"""
+        config_manager = ConfigManager(str(self.config_path))
+        config_manager.config_data = {
+            'aws': {'auth_method': 'profile', 'region': 'us-east-1'},
+            'models': self.get_minimal_valid_models(),
+        }
+
+        credentials = config_manager.get_aws_credentials()
+        models = config_manager.get_models_config()
+        with pytest.raises(TypeError):
+            credentials['region'] = 'eu-west-1'
+        with pytest.raises(TypeError):
+            models['extra'] = []
+        assert dict(credentials) == {
+            'auth_method': 'profile', 'region': 'us-east-1', 'profile_name': 'default'
+        }
+
+    def test_get_app_config_defaults_shared(self):
+        """测试未配置app节时返回共享的默认配置 / Test the shared defaults are returned without an app section"""
+        config_manager = ConfigManager(str(self.config_path))
+        config_manager.config_data = {'app': None}
+
+        app = config_manager.get_app_config()
+        assert app['max_tokens'] == 4000
+        assert app['system_prompts']['active_prompt'] == 'default'
+        assert ConfigManager(str(self.config_path)).get_app_config() is app
+
+    def test_getters_memoized_until_config_changes(self):
+        """测试getter结果在配置变化前被缓存 / Test getter results are cached until config changes"""
+        config_data = {
+            'aws': {'auth_method': 'profile', 'profile_name': 'default', 'region': 'us-east-1'},
+            'models': self.get_minimal_valid_models(),
+            'history_folder': './test',
+            'app': {'max_tokens': 2000}
+        }
+        self.create_test_config(config_data)
+        config_manager = ConfigManager(str(self.config_path))
+        config_manager.load_config()
+
+        first = config_manager.get_app_config()
+        assert config_manager.get_app_config() is first
+
+        config_manager.config_data = {**config_data, 'app': {'max_tokens': 3000}}
+        assert config_manager.get_app_config()['max_tokens'] == 3000
+
+    @patch('boto3.Session')
+    def test_boto3_session_reused(self, mock_session):
+        """测试boto3 session在调用间复用 / Test boto3 session is reused across calls"""
+        mock_session.return_value.client.return_value.get_caller_identity.return_value = {
+            'Account': '123456789012'
+        }
+        config_data = {
+            'aws': {'auth_method': 'profile', 'profile_name': 'default', 'region': 'us-east-1'},
+            'models': self.get_minimal_valid_models(),
+            'history_folder': './test',
+            'app': {}
+        }
+        self.create_test_config(config_data)
+        config_manager = ConfigManager(str(self.config_path))
+        config_manager.load_config()
+
+        config_manager.validate_aws_credentials()
+        session = config_manager.get_boto3_session()
+
+        assert session is mock_session.return_value
+        assert mock_session.call_count == 1
+
+        # 重新加载配置后重建session / Session is rebuilt after reload
+        config_manager.reload_config()
+        config_manager.get_boto3_session()
+        assert mock_session.call_count == 2
+
+    @patch('boto3.Session')
+    def test_validate_aws_credentials_cached_within_ttl(self, mock_session):
+        """测试有效期内不重复调用STS / Test STS is not called again within the TTL"""
+        sts = mock_session.return_value.client.return_value
+        sts.get_caller_identity.return_value = {'Account': '123456789012'}
+        config_data = {
+            'aws': {'auth_method': 'profile', 'profile_name': 'default', 'region': 'us-east-1'},
+            'models': self.get_minimal_valid_models(),
+            'history_folder': './test',
+            'app': {}
+        }
+        self.create_test_config(config_data)
+        config_manager = ConfigManager(str(self.config_path))
+        config_manager.load_config()
+
+        assert config_manager.validate_aws_credentials() is True
+        assert config_manager.validate_aws_credentials() is True
+        assert sts.get_caller_identity.call_count == 1
+
+        # 过期后重新验证 / Re-checked once the TTL expires
+        with patch('src.config.config_manager._IDENTITY_CACHE_TTL', 0):
+            config_manager.validate_aws_credentials()
+        assert sts.get_caller_identity.call_count == 2
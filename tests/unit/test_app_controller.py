@@ -120,6 +120,45 @@ class TestAppController:
         assert result == "Generated summary"
         mock_bedrock_client_instance.converse.assert_called_once()
     
+    @pytest.mark.asyncio
+    @patch('src.services.app_controller.ConfigManager')
+    @patch('src.services.app_controller.HistoryProcessor')
+    @patch('src.services.app_controller.BedrockClient')
+    @patch('src.services.app_controller.ModelManager')
+    async def test_aprocess_case_summary(self, mock_model_manager, mock_bedrock_client, mock_history_processor, mock_config_manager):
+        """测试异步处理案例总结 / Test asynchronous case summary processing"""
+        self._setup_successful_mocks(mock_config_manager, mock_history_processor, mock_bedrock_client, mock_model_manager)
+        mock_model_manager.return_value.is_model_available.return_value = True
+        mock_history_processor.return_value.load_history_files.return_value = []
+        mock_bedrock_client_instance = mock_bedrock_client.return_value
+        mock_bedrock_client_instance.converse.return_value = "Generated summary"
+
+        controller = AppController()
+        controller.system_prompt_manager = Mock()
+        controller.system_prompt_manager.get_active_prompt.return_value = None
+
+        result = await controller.aprocess_case_summary("This is a test case input", "test-model-id")
+
+        assert result == "Generated summary"
+        assert mock_bedrock_client_instance.converse.call_args.kwargs['system_prompt'] == "Test system prompt"
+
+        mock_model_manager.return_value.is_model_available.return_value = False
+        with pytest.raises(CaseSummaryError):
+            await controller.aprocess_case_summary("This is a test case input", "test-model-id")
+
+    @patch('src.services.app_controller.ConfigManager')
+    @patch('src.services.app_controller.HistoryProcessor')
+    @patch('src.services.app_controller.BedrockClient')
+    @patch('src.services.app_controller.ModelManager')
+    def test_load_history_reference_empty_input(self, mock_model_manager, mock_bedrock_client, mock_history_processor, mock_config_manager):
+        """测试空输入时跳过历史文件读取 / Test empty input skips reading history files"""
+        self._setup_successful_mocks(mock_config_manager, mock_history_processor, mock_bedrock_client, mock_model_manager)
+
+        controller = AppController()
+
+        assert controller._load_history_reference("   ") == ""
+        mock_history_processor.return_value.load_history_files.assert_not_called()
+
     def test_validate_input_empty(self):
         """测试验证空输入 / Test validating empty input"""
         with patch('src.services.app_controller.ConfigManager'):
@@ -248,6 +287,28 @@ class TestAppController:
         
         assert result == mock_app_config
     
+    @patch('src.services.app_controller.ConfigManager')
+    @patch('src.services.app_controller.HistoryProcessor')
+    @patch('src.services.app_controller.BedrockClient')
+    @patch('src.services.app_controller.ModelManager')
+    def test_app_config_snapshot_and_reload(self, mock_model_manager, mock_bedrock_client, mock_history_processor, mock_config_manager):
+        """测试配置快照与重新加载 / Test config snapshot and reload"""
+        self._setup_successful_mocks(mock_config_manager, mock_history_processor, mock_bedrock_client, mock_model_manager)
+        mock_config_instance = mock_config_manager.return_value
+
+        controller = AppController()
+        calls = mock_config_instance.get_app_config.call_count
+        controller.get_app_config()
+        controller.get_app_config()
+        assert mock_config_instance.get_app_config.call_count == calls
+
+        mock_config_instance.get_app_config.return_value = {'max_tokens': 1000}
+        mock_config_instance.get_system_prompt.return_value = "Reloaded prompt"
+        assert controller.reload_config() == {'max_tokens': 1000}
+        mock_config_instance.reload_config.assert_called_once()
+        assert controller.get_app_config() == {'max_tokens': 1000}
+        assert controller._system_prompt == "Reloaded prompt"
+
     @patch('src.services.app_controller.ConfigManager')
     @patch('src.services.app_controller.HistoryProcessor')
     @patch('src.services.app_controller.BedrockClient')
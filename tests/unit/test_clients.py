@@ -5,12 +5,23 @@
 Test various functions of clients module
 """
 
+import os
+import time
+
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 import boto3
-from botocore.exceptions import ClientError
+from botocore.credentials import Credentials
+from botocore.exceptions import ClientError, ConnectionClosedError
 
-from src.clients.bedrock_client import BedrockClient, ModelInvocationError
+from src.clients import bedrock_client
+from src.clients.bedrock_client import (
+    RESPONSE_CACHE_TTL,
+    BedrockClient,
+    ModelInvocationError,
+    _json_dumps_sorted,
+    is_stale_connection_error,
+)
 
 
 class TestBedrockClient:
@@ -23,7 +34,7 @@ class TestBedrockClient:
         self.mock_bedrock_runtime_client = Mock()
         
         # 设置session.client返回mock客户端 / Setup session.client to return mock clients
-        def mock_client(service_name):
+        def mock_client(service_name, **kwargs):
             if service_name == 'bedrock':
                 return self.mock_bedrock_client
             elif service_name == 'bedrock-runtime':
@@ -72,6 +83,25 @@ class TestBedrockClient:
         assert 'deepseek.deepseek-v2.5' in model_ids
         assert 'unsupported.model-v1:0' not in model_ids
     
+    def test_list_foundation_models_precomputes_provider(self):
+        """测试模型列表预先计算提供商类别 / Test model list precomputes provider category"""
+        self.mock_bedrock_client.list_foundation_models.return_value = {
+            'modelSummaries': [
+                {'modelId': 'amazon.nova-pro-v1:0', 'inferenceTypesSupported': ['ON_DEMAND']},
+                {'modelId': 'deepseek.r1-v1:0', 'inferenceTypesSupported': ['INFERENCE_PROFILE']},
+            ]
+        }
+        self.mock_bedrock_client.list_inference_profiles.return_value = {
+            'inferenceProfileSummaries': []
+        }
+
+        client = BedrockClient(self.mock_session)
+        models = client.list_foundation_models()
+
+        assert [model['_provider'] for model in models] == ['nova', 'deepseek']
+        categorized = client.filter_models_by_provider(models)
+        assert categorized['deepseek'][0]['modelId'] == 'deepseek.r1-v1:0'
+
     def test_list_foundation_models_client_error(self):
         """测试获取模型列表时的客户端错误 / Test client error when getting model list"""
         self.mock_bedrock_client.list_foundation_models.side_effect = ClientError(
@@ -248,7 +278,233 @@ class TestBedrockClient:
                 model_id='invalid-model-id',
                 messages=messages
             )
-    
+
+    def test_converse_stream(self):
+        """测试流式对话 / Test streaming conversation"""
+        self.mock_bedrock_runtime_client.converse_stream.return_value = {
+            'stream': [
+                {'messageStart': {'role': 'assistant'}},
+                {'contentBlockDelta': {'delta': {'text': '这是'}}},
+                {'contentBlockDelta': {'delta': {'text': '流式响应'}}},
+                {'messageStop': {'stopReason': 'end_turn'}},
+            ]
+        }
+
+        client = BedrockClient(self.mock_session)
+        messages = client.format_messages("测试输入")
+
+        chunks = list(client.converse_stream(
+            model_id='anthropic.claude-3-5-sonnet-20241022-v2:0',
+            messages=messages,
+            system_prompt="你是一个助手"
+        ))
+
+        assert chunks == ['这是', '流式响应']
+        call_args = self.mock_bedrock_runtime_client.converse_stream.call_args
+        assert call_args[1]['system'] == [{'text': '你是一个助手'}]
+
+    def test_converse_stream_client_error(self):
+        """测试流式对话时的客户端错误 / Test client error during streaming conversation"""
+        self.mock_bedrock_runtime_client.converse_stream.side_effect = ClientError(
+            {'Error': {'Code': 'ValidationException', 'Message': 'Invalid model ID'}},
+            'ConverseStream'
+        )
+
+        client = BedrockClient(self.mock_session)
+        messages = client.format_messages("测试输入")
+
+        with pytest.raises(ModelInvocationError, match="AWS API错误: ValidationException"):
+            list(client.converse_stream(
+                model_id='invalid-model-id',
+                messages=messages
+            ))
+
+    def test_converse_retries_on_stale_connection(self):
+        """测试连接失效时重建客户端并重试 / Test client rebuild and retry on stale connection"""
+        self.mock_bedrock_runtime_client.converse.side_effect = [
+            ConnectionClosedError(endpoint_url='https://bedrock-runtime'),
+            {'output': {'message': {'content': [{'text': '重试成功'}]}}},
+        ]
+
+        client = BedrockClient(self.mock_session)
+        messages = client.format_messages("测试输入")
+
+        result = client.converse(model_id='amazon.nova-pro-v1:0', messages=messages)
+
+        assert result == '重试成功'
+        assert self.mock_bedrock_runtime_client.converse.call_count == 2
+        assert self.mock_session.client.call_count == 4
+
+    def test_stale_connection_only_rebuilds_own_session(self):
+        """测试连接失效只重建本会话的客户端 / Test a stale connection only rebuilds the failing session's clients"""
+        other_session = Mock(spec=boto3.Session)
+        other_session.client.side_effect = lambda service_name, **kwargs: Mock()
+        other = BedrockClient(other_session)
+
+        self.mock_bedrock_runtime_client.converse.side_effect = [
+            ConnectionClosedError(endpoint_url='https://bedrock-runtime'),
+            {'output': {'message': {'content': [{'text': '重试成功'}]}}},
+        ]
+        client = BedrockClient(self.mock_session)
+        client.converse(model_id='amazon.nova-pro-v1:0', messages=client.format_messages("测试输入"))
+
+        assert self.mock_session.client.call_count == 4
+        assert BedrockClient(other_session).bedrock_runtime_client is other.bedrock_runtime_client
+        assert other_session.client.call_count == 2
+
+    def test_is_stale_connection_error(self):
+        """测试连接失效错误识别 / Test stale connection error detection"""
+        assert is_stale_connection_error(
+            ConnectionClosedError(endpoint_url='https://bedrock-runtime')
+        )
+        assert not is_stale_connection_error(ValueError("bad input"))
+        assert not is_stale_connection_error(AssertionError("local assertion"))
+
+    def test_submit_batch(self):
+        """测试提交批量推理任务 / Test submitting a batch inference job"""
+        mock_s3 = Mock()
+        self.mock_session.client.side_effect = lambda service_name, **kwargs: {
+            'bedrock': self.mock_bedrock_client,
+            'bedrock-runtime': self.mock_bedrock_runtime_client,
+            's3': mock_s3,
+        }[service_name]
+        self.mock_bedrock_client.create_model_invocation_job.return_value = {
+            'jobArn': 'arn:aws:bedrock:us-east-1:123:model-invocation-job/abc'
+        }
+
+        client = BedrockClient(self.mock_session)
+        model_id = 'anthropic.claude-3-5-haiku-20241022-v1:0'
+        inputs = [
+            client.build_batch_model_input(model_id, f"案例{i}", "你是助手")
+            for i in range(2)
+        ]
+
+        job_arn = client.submit_batch(
+            model_id, inputs, 's3://bucket/in/cases.jsonl', 's3://bucket/out/', 'arn:role'
+        )
+
+        assert job_arn.endswith('/abc')
+        put_kwargs = mock_s3.put_object.call_args[1]
+        assert put_kwargs['Bucket'] == 'bucket'
+        assert put_kwargs['Key'] == 'in/cases.jsonl'
+        lines = put_kwargs['Body'].decode('utf-8').splitlines()
+        assert len(lines) == 2
+        assert '"system": "你是助手"' in lines[0]
+        job_kwargs = self.mock_bedrock_client.create_model_invocation_job.call_args[1]
+        assert job_kwargs['modelId'] == model_id
+        assert job_kwargs['roleArn'] == 'arn:role'
+
+    def test_converse_response_cache(self, tmp_path):
+        """测试磁盘响应缓存 / Test on-disk response cache"""
+        self.mock_bedrock_runtime_client.converse.return_value = {
+            'output': {'message': {'content': [{'text': '缓存的响应'}]}}
+        }
+
+        client = BedrockClient(self.mock_session, cache_dir=str(tmp_path))
+        messages = client.format_messages("测试输入")
+
+        first = client.converse(model_id='amazon.nova-pro-v1:0', messages=messages)
+        second = client.converse(model_id='amazon.nova-pro-v1:0', messages=messages)
+
+        assert first == second == '缓存的响应'
+        assert self.mock_bedrock_runtime_client.converse.call_count == 1
+        assert len(list((tmp_path / 'converse').glob('*.json'))) == 1
+
+        client.converse(model_id='amazon.nova-pro-v1:0', messages=messages, use_cache=False)
+        assert self.mock_bedrock_runtime_client.converse.call_count == 2
+
+    def test_converse_response_cache_expires(self, tmp_path):
+        """测试过期的响应缓存不再使用 / Test expired cached responses are not reused"""
+        self.mock_bedrock_runtime_client.converse.return_value = {
+            'output': {'message': {'content': [{'text': '缓存的响应'}]}}
+        }
+
+        client = BedrockClient(self.mock_session, cache_dir=str(tmp_path))
+        messages = client.format_messages("测试输入")
+        client.converse(model_id='amazon.nova-pro-v1:0', messages=messages)
+
+        cache_file = next((tmp_path / 'converse').glob('*.json'))
+        expired = time.time() - RESPONSE_CACHE_TTL - 1
+        os.utime(cache_file, (expired, expired))
+
+        client.converse(model_id='amazon.nova-pro-v1:0', messages=messages)
+        assert self.mock_bedrock_runtime_client.converse.call_count == 2
+
+    def test_response_cache_key_independent_of_orjson(self):
+        """测试有无orjson时缓存键序列化一致 / Test cache key serialization is identical with and without orjson"""
+        params = {
+            'modelId': 'amazon.nova-pro-v1:0',
+            'messages': [{'role': 'user', 'content': [{'text': '测试输入'}]}],
+            'inferenceConfig': {'temperature': 0.5, 'maxTokens': 100},
+        }
+        # orjson的紧凑输出格式 / orjson's compact output format
+        expected = (
+            '{"inferenceConfig":{"maxTokens":100,"temperature":0.5},'
+            '"messages":[{"content":[{"text":"测试输入"}],"role":"user"}],'
+            '"modelId":"amazon.nova-pro-v1:0"}'
+        ).encode('utf-8')
+
+        with patch.object(bedrock_client, 'orjson', None):
+            assert _json_dumps_sorted(params) == expected
+
+        if bedrock_client.orjson is not None:
+            assert _json_dumps_sorted(params) == expected
+
+    @patch('src.clients.bedrock_client.time.sleep')
+    def test_converse_retries_throttling(self, mock_sleep):
+        """测试限流时指数退避重试 / Test exponential backoff retry on throttling"""
+        self.mock_bedrock_runtime_client.converse.side_effect = [
+            ClientError(
+                {'Error': {'Code': 'ThrottlingException', 'Message': 'Rate exceeded'}},
+                'Converse'
+            ),
+            {'output': {'message': {'content': [{'text': '重试成功'}]}}},
+        ]
+
+        client = BedrockClient(self.mock_session)
+        messages = client.format_messages("测试输入")
+
+        result = client.converse(model_id='amazon.nova-pro-v1:0', messages=messages)
+
+        assert result == '重试成功'
+        assert mock_sleep.call_count == 1
+
+    def test_parse_converse_response_bytes(self):
+        """测试解析字节形式的响应 / Test parsing a raw bytes response"""
+        client = BedrockClient(self.mock_session)
+        raw = '{"output": {"message": {"content": [{"text": "字节响应"}]}}}'.encode('utf-8')
+
+        assert client._parse_converse_response(raw) == '字节响应'
+
+    def test_get_inference_profile_for_model_uses_cache(self):
+        """测试推理配置文件查询复用缓存映射 / Test inference profile lookup reuses the cached mapping"""
+        self.mock_bedrock_client.list_foundation_models.return_value = {
+            'modelSummaries': [
+                {
+                    'modelId': 'anthropic.claude-3-5-haiku-20241022-v1:0',
+                    'inferenceTypesSupported': ['INFERENCE_PROFILE'],
+                }
+            ]
+        }
+        self.mock_bedrock_client.list_inference_profiles.return_value = {
+            'inferenceProfileSummaries': [
+                {
+                    'inferenceProfileId': 'us.anthropic.claude-3-5-haiku-20241022-v1:0',
+                    'models': [
+                        {'modelArn': 'arn:aws:bedrock:us-east-1::foundation-model/anthropic.claude-3-5-haiku-20241022-v1:0'}
+                    ],
+                }
+            ]
+        }
+
+        client = BedrockClient(self.mock_session)
+
+        assert client.get_inference_profile_for_model(
+            'anthropic.claude-3-5-haiku-20241022-v1:0'
+        ) == 'us.anthropic.claude-3-5-haiku-20241022-v1:0'
+        assert client.get_inference_profile_for_model('anthropic.claude-3-5-haiku') is None
+        assert self.mock_bedrock_client.list_inference_profiles.call_count == 1
+
     def test_format_messages(self):
         """测试消息格式化 / Test message formatting"""
         client = BedrockClient(self.mock_session)
@@ -268,3 +524,213 @@ class TestBedrockClient:
         ]
         
         assert messages == expected
+
+    def test_list_foundation_models_uses_cache(self):
+        """测试模型列表缓存命中 / Test model list cache hit"""
+        self.mock_bedrock_client.list_foundation_models.return_value = {
+            'modelSummaries': [
+                {'modelId': 'amazon.nova-pro-v1:0', 'inferenceTypesSupported': ['ON_DEMAND']}
+            ]
+        }
+
+        client = BedrockClient(self.mock_session)
+        first = client.list_foundation_models()
+        second = BedrockClient(self.mock_session).list_foundation_models()
+
+        assert first == second
+        assert self.mock_bedrock_client.list_foundation_models.call_count == 1
+
+        client.list_foundation_models(force_refresh=True)
+        assert self.mock_bedrock_client.list_foundation_models.call_count == 2
+
+    def test_list_foundation_models_stale_cache_fallback(self):
+        """测试刷新失败时回退到过期缓存 / Test falling back to stale cache when refresh fails"""
+        self.mock_bedrock_client.list_foundation_models.return_value = {
+            'modelSummaries': [
+                {'modelId': 'amazon.nova-pro-v1:0', 'inferenceTypesSupported': ['ON_DEMAND']}
+            ]
+        }
+
+        client = BedrockClient(self.mock_session)
+        models = client.list_foundation_models()
+
+        self.mock_bedrock_client.list_foundation_models.side_effect = ClientError(
+            {'Error': {'Code': 'ServiceUnavailable', 'Message': 'Unavailable'}},
+            'ListFoundationModels'
+        )
+        assert client.list_foundation_models(force_refresh=True) == models
+
+    def test_list_foundation_models_disk_cache(self, tmp_path):
+        """测试模型列表磁盘缓存 / Test on-disk model list cache"""
+        from src.clients import bedrock_client
+
+        self.mock_session.region_name = 'test-disk-region'
+        self.mock_bedrock_client.list_foundation_models.return_value = {
+            'modelSummaries': [
+                {'modelId': 'amazon.nova-pro-v1:0', 'inferenceTypesSupported': ['ON_DEMAND']}
+            ]
+        }
+
+        client = BedrockClient(self.mock_session, cache_dir=str(tmp_path))
+        models = client.list_foundation_models()
+        cache_key = client._get_model_cache_key()
+        assert cache_key[0] == 'test-disk-region'
+        assert len(list(tmp_path.glob('bedrock_models_test-disk-region_*.json'))) == 1
+        assert len(list(tmp_path.glob('bedrock_models_test-disk-region_*.last_sync'))) == 1
+
+        # 清空内存缓存后应从磁盘恢复 / Should restore from disk after memory cache is cleared
+        bedrock_client._MODEL_CACHE.pop(cache_key, None)
+        restored = BedrockClient(self.mock_session, cache_dir=str(tmp_path)).list_foundation_models()
+
+        assert restored == models
+        assert self.mock_bedrock_client.list_foundation_models.call_count == 1
+        bedrock_client._MODEL_CACHE.pop(cache_key, None)
+
+    def test_list_foundation_models_cache_per_credentials(self, tmp_path):
+        """测试同一区域不同凭证不共享模型缓存 / Test different credentials in one region don't share the model cache"""
+        from src.clients import bedrock_client
+
+        self.mock_session.region_name = 'test-shared-region'
+        self.mock_session.profile_name = 'default'
+        self.mock_bedrock_client.list_foundation_models.return_value = {
+            'modelSummaries': [
+                {'modelId': 'amazon.nova-pro-v1:0', 'inferenceTypesSupported': ['ON_DEMAND']}
+            ]
+        }
+
+        keys = []
+        for access_key in ('AKIAFIRST', 'AKIASECOND'):
+            self.mock_session.get_credentials.return_value = Credentials(access_key, 'secret')
+            client = BedrockClient(self.mock_session, cache_dir=str(tmp_path))
+            client.list_foundation_models()
+            keys.append(client._get_model_cache_key())
+
+        assert keys[0] != keys[1]
+        assert self.mock_bedrock_client.list_foundation_models.call_count == 2
+        assert len(list(tmp_path.glob('bedrock_models_test-shared-region_*.json'))) == 2
+        for key in keys:
+            bedrock_client._MODEL_CACHE.pop(key, None)
+
+    def test_initialize_clients_reuses_cached_clients(self):
+        """测试同一会话复用已创建的客户端 / Test clients are reused for the same session"""
+        first = BedrockClient(self.mock_session)
+        second = BedrockClient(self.mock_session)
+
+        assert second.bedrock_client is first.bedrock_client
+        assert second.bedrock_runtime_client is first.bedrock_runtime_client
+        assert self.mock_session.client.call_count == 2
+
+    def test_initialize_clients_with_pool_config(self):
+        """测试客户端使用连接池配置 / Test clients are created with connection pool config"""
+        BedrockClient(self.mock_session)
+
+        configs = {}
+        for call in self.mock_session.client.call_args_list:
+            config = call[1]['config']
+            assert config.max_pool_connections == 100
+            assert config.tcp_keepalive is True
+            configs[call[0][0]] = config
+
+        # 运行时客户端只由 wait_and_retry 重试 / The runtime client is retried by wait_and_retry only
+        assert configs['bedrock'].retries == {'mode': 'adaptive', 'max_attempts': 5}
+        assert configs['bedrock-runtime'].retries == {'mode': 'adaptive', 'max_attempts': 1}
+
+    def test_converse_latency_optimized(self):
+        """测试延迟优化推理配置 / Test latency-optimized inference config"""
+        self.mock_bedrock_runtime_client.converse.return_value = {
+            'output': {'message': {'content': [{'text': '响应'}]}}
+        }
+
+        client = BedrockClient(self.mock_session)
+        messages = client.format_messages("测试输入")
+
+        client.converse(
+            model_id='us.anthropic.claude-3-5-haiku-20241022-v1:0',
+            messages=messages,
+            latency_optimized=True
+        )
+        call_args = self.mock_bedrock_runtime_client.converse.call_args
+        assert call_args[1]['performanceConfig'] == {'latency': 'optimized'}
+
+        # 不支持的模型应跳过 / Unsupported models should be skipped
+        client.converse(
+            model_id='anthropic.claude-3-sonnet-20240229-v1:0',
+            messages=messages,
+            latency_optimized=True
+        )
+        call_args = self.mock_bedrock_runtime_client.converse.call_args
+        assert 'performanceConfig' not in call_args[1]
+
+    def test_converse_prompt_cache(self):
+        """测试系统提示词缓存点 / Test system prompt cache point"""
+        self.mock_bedrock_runtime_client.converse.return_value = {
+            'output': {'message': {'content': [{'text': '响应'}]}}
+        }
+
+        client = BedrockClient(self.mock_session)
+        messages = client.format_messages("测试输入")
+
+        client.converse(
+            model_id='us.anthropic.claude-3-7-sonnet-20250219-v1:0',
+            messages=messages,
+            system_prompt='你是助手'
+        )
+        system = self.mock_bedrock_runtime_client.converse.call_args[1]['system']
+        assert system == [{'text': '你是助手'}, {'cachePoint': {'type': 'default'}}]
+
+        client.converse(
+            model_id='us.anthropic.claude-3-7-sonnet-20250219-v1:0',
+            messages=messages,
+            system_prompt='你是助手',
+            enable_prompt_cache=False
+        )
+        system = self.mock_bedrock_runtime_client.converse.call_args[1]['system']
+        assert system == [{'text': '你是助手'}]
+
+    def test_format_messages_with_static_prefix(self):
+        """测试带固定前缀的消息格式化 / Test message formatting with static prefix"""
+        client = BedrockClient(self.mock_session)
+
+        messages = client.format_messages(
+            "用户输入", static_prefix="示例", model_id='amazon.nova-pro-v1:0'
+        )
+        assert messages[0]['content'] == [
+            {'text': '示例'},
+            {'cachePoint': {'type': 'default'}},
+            {'text': '用户输入'}
+        ]
+
+        # 不支持缓存的模型不插入缓存点 / No cache point for unsupported models
+        messages = client.format_messages(
+            "用户输入", static_prefix="示例", model_id='deepseek.r1-v1:0'
+        )
+        assert messages[0]['content'] == [{'text': '示例'}, {'text': '用户输入'}]
+
+    @pytest.mark.asyncio
+    async def test_converse_many(self):
+        """测试并行调用多个模型 / Test invoking multiple models in parallel"""
+        def mock_converse(**kwargs):
+            return {'output': {'message': {'content': [{'text': kwargs['modelId']}]}}}
+
+        self.mock_bedrock_runtime_client.converse.side_effect = mock_converse
+
+        client = BedrockClient(self.mock_session)
+        messages = client.format_messages("测试输入")
+        model_ids = ['amazon.nova-pro-v1:0', 'deepseek.r1-v1:0']
+
+        results = await client.converse_many(model_ids, messages, system_prompt='你是助手')
+
+        assert results == model_ids
+        assert self.mock_bedrock_runtime_client.converse.call_count == 2
+
+    def test_get_model_display_name_cached(self):
+        """测试显示名称按模型ID缓存 / Test display names are cached per model ID"""
+        client = BedrockClient(self.mock_session)
+        model_id = 'us.amazon.nova-lite-v1:0:300k'
+
+        first = client.get_model_display_name(model_id)
+        hits = BedrockClient.get_model_display_name.cache_info().hits
+        second = client.get_model_display_name(model_id)
+
+        assert first == second == "Nova Lite (300K)"
+        assert BedrockClient.get_model_display_name.cache_info().hits == hits + 1
@@ -93,6 +93,37 @@ class TestModelManager:
         assert 'nova' in result
         assert len(result['claude']) > 0  # 应该有配置文件中的模型 / Should have models from config
     
+    def test_refresh_keeps_existing_display_names(self):
+        """测试刷新时不重复计算已有的显示名称 / Test refresh does not recompute existing display names"""
+        named = {'modelId': 'amazon.nova-pro-v1:0', 'displayName': 'Nova Pro'}
+        unnamed = {'modelId': 'amazon.nova-lite-v1:0'}
+        self.mock_bedrock_client.list_foundation_models.return_value = [named, unnamed]
+        self.mock_bedrock_client.filter_models_by_provider.return_value = {'nova': [named, unnamed]}
+        self.mock_bedrock_client.get_model_display_name.side_effect = lambda x: f"Display {x}"
+
+        manager = ModelManager(self.mock_bedrock_client, self.config)
+        manager.refresh_available_models()
+
+        assert named['displayName'] == 'Nova Pro'
+        assert unnamed['displayName'] == 'Display amazon.nova-lite-v1:0'
+        self.mock_bedrock_client.get_model_display_name.assert_called_once_with('amazon.nova-lite-v1:0')
+    
+    def test_background_refresh_reused(self):
+        """测试后台预加载结果被后续刷新复用 / Test a background preload is reused by the next refresh"""
+        self.mock_bedrock_client.list_foundation_models.return_value = self.mock_api_models
+        self.mock_bedrock_client.filter_models_by_provider.return_value = self.mock_categorized_models
+        self.mock_bedrock_client.get_model_display_name.side_effect = lambda x: f"Display {x}"
+
+        manager = ModelManager(self.mock_bedrock_client, self.config)
+        assert manager.get_default_model_fast() == manager.default_models['claude']
+
+        ready = manager.start_background_refresh()
+        result = manager.refresh_available_models()
+
+        assert ready.is_set()
+        assert result == self.mock_categorized_models
+        self.mock_bedrock_client.list_foundation_models.assert_called_once()
+    
     def test_get_models_by_category_with_cache(self):
         """测试从缓存获取模型分类 / Test getting model categories from cache"""
         manager = ModelManager(self.mock_bedrock_client, self.config)
@@ -104,6 +135,32 @@ class TestModelManager:
         # 不应该调用API / Should not call API
         self.mock_bedrock_client.list_foundation_models.assert_not_called()
     
+    def test_get_models_by_category_cache_ttl(self):
+        """测试模型缓存过期或失效后重新刷新 / Test the model cache refreshes after expiry or invalidation"""
+        self.mock_bedrock_client.list_foundation_models.return_value = self.mock_api_models
+        self.mock_bedrock_client.filter_models_by_provider.return_value = self.mock_categorized_models
+        self.mock_bedrock_client.get_model_display_name.side_effect = lambda x: f"Display {x}"
+
+        manager = ModelManager(self.mock_bedrock_client, {**self.config, 'app': {'model_cache_ttl': 60}})
+        assert manager.cache_ttl == 60
+
+        manager.get_models_by_category()
+        manager.get_models_by_category()
+        assert self.mock_bedrock_client.list_foundation_models.call_count == 1
+
+        self.mock_bedrock_client.list_foundation_models.assert_called_with(force_refresh=False)
+
+        # 过期或失效后绕过客户端缓存 / Expiry or invalidation bypasses the client cache
+        manager._cache_timestamp -= 61
+        manager.get_models_by_category()
+        assert self.mock_bedrock_client.list_foundation_models.call_count == 2
+        self.mock_bedrock_client.list_foundation_models.assert_called_with(force_refresh=True)
+
+        manager.invalidate_cache()
+        manager.get_models_by_category()
+        assert self.mock_bedrock_client.list_foundation_models.call_count == 3
+        self.mock_bedrock_client.list_foundation_models.assert_called_with(force_refresh=True)
+    
     def test_get_models_by_category_without_cache(self):
         """测试无缓存时获取模型分类 / Test getting model categories without cache"""
         # 设置mock返回值 / Setup mock return values
@@ -167,6 +224,38 @@ class TestModelManager:
         
         assert result is False
     
+    def test_model_index_rebuilt_when_models_replaced(self):
+        """测试模型列表替换后重建索引 / Test the model index is rebuilt when the model list is replaced"""
+        manager = ModelManager(self.mock_bedrock_client, self.config)
+        manager._categorized_models = self.mock_categorized_models
+
+        index = manager._get_model_index()
+        assert manager._get_model_index() is index
+        assert manager.is_model_available('anthropic.claude-3-5-sonnet-20241022-v2:0')
+
+        manager._categorized_models = {'nova': [{'modelId': 'amazon.nova-lite-v1:0'}]}
+        assert not manager.is_model_available('anthropic.claude-3-5-sonnet-20241022-v2:0')
+        assert manager.get_model_info('amazon.nova-lite-v1:0') == {'modelId': 'amazon.nova-lite-v1:0'}
+    
+    def test_model_lookups_survive_concurrent_swap(self):
+        """测试其他线程替换模型列表时查询仍返回结果 / Test lookups still return results when another thread swaps the model list"""
+
+        class RacingModelManager(ModelManager):
+            def __setattr__(self, name, value):
+                super().__setattr__(name, value)
+                # 模拟另一个线程在缓存写入后立即替换分组字典并清空缓存
+                # Simulate another thread swapping the dict and clearing caches right after a cache is written
+                if name in ('_model_by_id', '_supported_cache', '_ui_cache') and value is not None:
+                    super().__setattr__(name, None)
+
+        manager = RacingModelManager(self.mock_bedrock_client, self.config)
+        manager._categorized_models = self.mock_categorized_models
+
+        assert manager.is_model_available('anthropic.claude-3-5-sonnet-20241022-v2:0')
+        assert manager.get_model_info('amazon.nova-pro-v1:0') is not None
+        assert manager.get_supported_models_only()
+        assert manager.get_models_for_ui()
+
     def test_get_default_model_preferred_available(self):
         """测试获取默认模型（首选可用）/ Test getting default model (preferred available)"""
         manager = ModelManager(self.mock_bedrock_client, self.config)
@@ -214,6 +303,20 @@ class TestModelManager:
         model_count = sum(1 for item in result if not item.get('disabled', False))
         assert model_count > 0
     
+    def test_supported_and_ui_models_cached_until_replaced(self):
+        """测试支持模型与UI列表在模型列表替换前被缓存 / Test supported and UI lists are cached until the model list is replaced"""
+        manager = ModelManager(self.mock_bedrock_client, self.config)
+        manager._categorized_models = self.mock_categorized_models
+
+        supported = manager.get_supported_models_only()
+        ui_models = manager.get_models_for_ui()
+        assert manager.get_supported_models_only() is supported
+        assert manager.get_models_for_ui() is ui_models
+
+        manager._categorized_models = {'nova': [{'modelId': 'amazon.nova-lite-v1:0'}]}
+        assert manager.get_supported_models_only() == [{'modelId': 'amazon.nova-lite-v1:0'}]
+        assert [item['value'] for item in manager.get_models_for_ui()] == ['---nova---', 'amazon.nova-lite-v1:0']
+    
     def test_get_fallback_models(self):
         """测试获取备选模型列表 / Test getting fallback model list"""
         manager = ModelManager(self.mock_bedrock_client, self.config)
@@ -254,3 +357,21 @@ class TestModelManager:
         result = manager.validate_model_access('test-model-id')
         
         assert result is False
+
+    def test_validate_model_access_cached(self):
+        """测试模型访问验证结果被缓存，失败结果较快过期 / Test access results are cached and failures expire sooner"""
+        self.mock_bedrock_client.format_messages.return_value = [{'role': 'user', 'content': [{'text': 'test'}]}]
+        self.mock_bedrock_client.converse.side_effect = ModelInvocationError("Access denied")
+
+        manager = ModelManager(self.mock_bedrock_client, self.config)
+
+        assert manager.validate_model_access('test-model-id') is False
+        assert manager.validate_model_access('test-model-id') is False
+        assert self.mock_bedrock_client.converse.call_count == 1
+
+        # 失败结果过期后重新验证 / Failed result is re-validated after expiry
+        self.mock_bedrock_client.converse.side_effect = None
+        manager._access_cache['test-model-id'] = (False, manager._access_cache['test-model-id'][1] - 61)
+        assert manager.validate_model_access('test-model-id') is True
+        assert manager.validate_model_access('test-model-id') is True
+        assert self.mock_bedrock_client.converse.call_count == 2
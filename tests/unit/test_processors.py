@@ -64,6 +64,16 @@ class TestHistoryProcessor:
         files = processor.load_history_files()
         assert files == []
     
+    def test_load_history_files_folder_created_later(self):
+        """测试启动后创建的文件夹在下次加载时被发现 / Test a folder created after startup is found on the next load"""
+        folder = Path(self.temp_dir) / "later"
+        processor = HistoryProcessor(str(folder))
+
+        assert processor.load_history_files() == []
+        folder.mkdir()
+        (folder / "case.md").write_text("# 案例\n内容", encoding='utf-8')
+        assert len(processor.load_history_files()) == 1
+
     def test_load_history_files_empty_files_ignored(self):
         """测试忽略空文件 / Test empty files are ignored"""
         self.create_test_file("empty.txt", "")
@@ -93,6 +103,42 @@ class TestHistoryProcessor:
         assert 'data.json' not in file_names
         assert 'script.py' not in file_names
     
+    def test_load_history_files_reuses_unchanged_files(self):
+        """测试未修改的文件不会被重新读取 / Test unchanged files are not re-read"""
+        self.create_test_file("category1/case1.txt", "案例1的内容")
+        changed = self.create_test_file("category1/case2.txt", "案例2的内容")
+
+        processor = HistoryProcessor(str(self.history_folder))
+        processor.load_history_files()
+
+        changed.write_text("案例2的新内容，更长一些", encoding='utf-8')
+        with patch.object(
+            processor, '_read_file_content', wraps=processor._read_file_content
+        ) as mock_read:
+            files = processor.load_history_files()
+            mock_read.assert_called_once_with(changed)
+
+        contents = {f['name']: f['content'] for f in files}
+        assert contents['case2.txt'] == "案例2的新内容，更长一些"
+
+        processor.clear_cache()
+        with patch.object(
+            processor, '_read_file_content', wraps=processor._read_file_content
+        ) as mock_read:
+            processor.load_history_files()
+            assert mock_read.call_count == 2
+
+    def test_process_history_content_cached(self):
+        """测试相同文件列表复用格式化结果 / Test the same file list reuses the formatted result"""
+        self.create_test_file("category1/case1.txt", "案例1的内容")
+        processor = HistoryProcessor(str(self.history_folder))
+
+        first = processor.process_history_content(processor.load_history_files())
+        with patch.object(processor, '_format_file_content') as mock_format:
+            second = processor.process_history_content(processor.load_history_files())
+            mock_format.assert_not_called()
+        assert second == first
+
     def test_process_history_content_empty_files(self):
         """测试处理空文件列表 / Test processing empty file list"""
         processor = HistoryProcessor(str(self.history_folder))
@@ -190,6 +236,18 @@ class TestHistoryProcessor:
         assert '时' not in keywords
         assert '需要' not in keywords
     
+    def test_extract_keywords_within_chinese_runs(self):
+        """测试中文词汇不跨越标点或英文 / Test Chinese n-grams don't span punctuation or English"""
+        processor = HistoryProcessor(str(self.history_folder))
+
+        keywords = processor._extract_keywords("登录失败，密码错误 VPN 连接")
+
+        assert '登录失败' in keywords
+        assert '密码错误' in keywords
+        assert 'vpn' in keywords
+        assert '失败密码' not in keywords
+        assert '错误连接' not in keywords
+
     def test_get_file_category(self):
         """测试文件类别获取 / Test file category extraction"""
         processor = HistoryProcessor(str(self.history_folder))
@@ -252,6 +310,133 @@ class TestHistoryProcessor:
         assert score_low >= score_none
         assert score_none == 0
     
+    def test_calculate_relevance_score_with_automaton(self):
+        """测试自动机评分与逐关键词计数一致 / Test automaton scoring matches per-keyword counting"""
+        pytest.importorskip("ahocorasick")
+        processor = HistoryProcessor(str(self.history_folder))
+
+        keywords = {'登录', '用户', 'Login'}
+        section = "用户登录系统时需要进行身份认证，login失败通常是登录问题"
+        automaton = processor._build_keyword_automaton(keywords)
+
+        assert automaton is not None
+        assert processor._calculate_relevance_score(section, keywords, automaton) == \
+            processor._calculate_relevance_score(section, keywords)
+
+    def test_count_keywords_overlapping_matches(self):
+        """测试自动机与逐关键词计数对重叠匹配结果一致 / Test automaton and per-keyword counting agree on overlapping matches"""
+        pytest.importorskip("ahocorasick")
+        processor = HistoryProcessor(str(self.history_folder))
+
+        keywords = ('哈哈', 'aa', '哈')
+        section = "哈哈哈 aaaa 哈哈哈哈哈"
+        automaton = processor._build_keyword_automaton(keywords)
+
+        expected = processor._count_keywords(section, keywords)
+        assert expected == {'哈哈': 3, 'aa': 2, '哈': 8}
+        assert processor._count_keywords(section, keywords, automaton) == expected
+
+    def test_rank_sections_prefers_focused_and_rare_matches(self):
+        """测试排序偏向简短且匹配稀有关键词的段落 / Test ranking favors focused sections matching rare keywords"""
+        processor = HistoryProcessor(str(self.history_folder))
+        keywords = {'登录', '用户'}
+        sections = [
+            "用户反馈" + "其他无关的背景描述" * 20,
+            "用户登录失败",
+            "用户信息更新",
+            "天气很好",
+        ]
+
+        ranked = processor._rank_sections(sections, keywords)
+
+        assert [section for section, _ in ranked] == [sections[1], sections[2], sections[0]]
+        assert all(score > 0 for _, score in ranked)
+
+    def test_iter_history_sections_matches_joined_history(self):
+        """测试逐段生成与拼接后分段结果一致 / Test streamed sections match splitting the joined history"""
+        processor = HistoryProcessor(str(self.history_folder))
+        files = [
+            {'path': '/a.md', 'name': 'a.md', 'category': '网络', 'content': "VPN 登录失败\n\n# 处理\n重置密码"},
+            {'path': '/b.md', 'name': 'b.md', 'category': '账号', 'content': "  用户锁定  \n\n\n解锁流程"},
+        ]
+
+        sections = list(processor.iter_history_sections(files))
+        assert sections == processor._split_history_sections(processor.process_history_content(files))
+
+        expected = processor.filter_relevant_history("VPN 登录", processor.process_history_content(files))
+        assert processor.filter_relevant_history_sections("VPN 登录", sections) == expected
+        assert processor.filter_relevant_history_sections("天气晴朗", sections) is None
+
+    def test_filter_relevant_history_files_ranks_once(self):
+        """测试按文件筛选与完整历史筛选一致且只排序一次 / Test file-based filtering matches full-history filtering and ranks once"""
+        processor = HistoryProcessor(str(self.history_folder))
+        files = [
+            {'path': '/a.md', 'name': 'a.md', 'category': '网络', 'content': "VPN 登录失败\n\n# 处理\n重置密码"},
+            {'path': '/b.md', 'name': 'b.md', 'category': '账号', 'content': "  用户锁定  \n\n\n解锁流程"},
+        ]
+        history = processor.process_history_content(files)
+
+        # 有匹配、无匹配（摘要）、无关键词（完整历史） / Match, no match (summary), no keywords (full history)
+        for case_input in ("VPN 登录", "天气晴朗", "!!"):
+            expected = processor.filter_relevant_history(case_input, history)
+            with patch.object(processor, '_rank_sections', wraps=processor._rank_sections) as mock_rank:
+                assert processor.filter_relevant_history_files(case_input, files) == expected
+            assert mock_rank.call_count <= 1
+
+    def test_rank_sections_limit_matches_full_sort(self):
+        """测试限制数量时结果与完整排序前几名一致 / Test limited ranking equals the head of the full ranking"""
+        processor = HistoryProcessor(str(self.history_folder))
+        keywords = {'登录', '用户'}
+        sections = ["用户登录失败", "用户信息", "登录超时", "用户登录", "天气", "用户"] * 3
+
+        full = processor._rank_sections(sections, keywords)
+        assert processor._rank_sections(sections, keywords, limit=5) == full[:5]
+
+    def test_may_contain_keyword_charset_precheck(self):
+        """测试字符集预检不会漏掉匹配 / Test character-set pre-check never drops a match"""
+        processor = HistoryProcessor(str(self.history_folder))
+        charsets = processor._build_keyword_charsets({'VPN', '登录'})
+
+        assert processor._may_contain_keyword("vpn 连接断开", charsets)
+        assert processor._may_contain_keyword("无法录登", charsets)
+        assert not processor._may_contain_keyword("天气很好", charsets)
+        assert not processor._may_contain_keyword("登出", charsets)
+
+    def test_read_file_content_encodings(self):
+        """测试BOM、GBK和换行符处理 / Test BOM, GBK and newline handling"""
+        processor = HistoryProcessor(str(self.history_folder))
+
+        utf8_bom = self.history_folder / "bom.txt"
+        utf8_bom.write_bytes("\ufeff案例\r\n内容".encode('utf-8'))
+        assert processor._read_file_content(utf8_bom) == "案例\n内容"
+
+        utf16 = self.history_folder / "utf16.txt"
+        utf16.write_bytes("案例内容".encode('utf-16'))
+        assert processor._read_file_content(utf16) == "案例内容"
+
+        gbk = self.history_folder / "gbk.txt"
+        gbk.write_bytes("案例内容".encode('gbk'))
+        assert processor._read_file_content(gbk) == "案例内容"
+
+    def test_read_file_content_large_file_mmap(self):
+        """测试大文件通过mmap读取 / Test large files are read through mmap"""
+        from src.processors.history_processor import _MMAP_THRESHOLD
+
+        processor = HistoryProcessor(str(self.history_folder))
+        text = "案例内容\r\n" * (_MMAP_THRESHOLD // 8)
+
+        large_utf8 = self.history_folder / "large.txt"
+        large_utf8.write_bytes(text.encode('utf-8'))
+        assert processor._read_file_content(large_utf8) == text.replace("\r\n", "\n")
+
+        large_utf16 = self.history_folder / "large16.txt"
+        large_utf16.write_bytes(text.encode('utf-16'))
+        assert processor._read_file_content(large_utf16) == text.replace("\r\n", "\n")
+
+        large_gbk = self.history_folder / "large_gbk.txt"
+        large_gbk.write_bytes(text.encode('gbk'))
+        assert processor._read_file_content(large_gbk) == text.replace("\r\n", "\n")
+
     @patch('builtins.open', side_effect=UnicodeDecodeError('utf-8', b'', 0, 1, 'invalid start byte'))
     def test_read_file_content_encoding_error(self, mock_file):
         """测试文件编码错误处理 / Test file encoding error handling"""
@@ -6,6 +6,7 @@ Test various functions of services module
 """
 
 import pytest
+from unittest.mock import patch
 from src.services.prompt_builder import PromptBuilder
 
 
@@ -88,7 +89,15 @@ class TestPromptBuilder:
         
         result = self.prompt_builder.format_history_reference("   \n  \n  ")
         assert result == ""
-    
+
+    def test_format_history_reference_trailing_blank_lines(self):
+        """测试去除大量尾部空行 / Test dropping many trailing blank lines"""
+        history = "内容1\n\n内容2" + "\n   \t" * 1000
+
+        result = self.prompt_builder.format_history_reference(history)
+
+        assert result == "内容1\n\n内容2"
+
     def test_format_history_reference_long_content(self):
         """测试格式化过长的历史参考信息 / Test formatting overly long history reference"""
         # 创建一个很长的历史信息 / Create very long history information
@@ -122,6 +131,17 @@ class TestPromptBuilder:
         assert len(result) < len(long_prompt)
         assert len(result) + len(system_prompt) <= self.prompt_builder.max_prompt_length
     
+    def test_ensure_prompt_length_long_system_prompt_only(self):
+        """测试仅系统提示词过长时不截断用户提示词 / Test the user prompt is not truncated when only the system prompt is long"""
+        user_prompt = "短的用户提示词"
+        system_prompt = "系" * self.prompt_builder.max_prompt_length
+
+        with patch.object(self.prompt_builder, '_truncate_prompt_intelligently') as mock_truncate:
+            result = self.prompt_builder._ensure_prompt_length(user_prompt, system_prompt)
+
+        assert result == user_prompt
+        mock_truncate.assert_not_called()
+    
     def test_truncate_history_intelligently(self):
         """测试智能截断历史信息 / Test intelligent history truncation"""
         history = """
@@ -164,6 +184,18 @@ class TestPromptBuilder:
         assert "需要总结的案例" in result or "Case to Summarize" in result
         assert "输出要求" in result or "Output Requirements" in result
     
+    def test_truncate_prompt_keeps_history_order(self):
+        """测试截断后历史行保持原顺序并位于案例之前 / Test kept history lines stay in order before the case"""
+        prompt = "\n".join(
+            ["历史一", "历史二", "历史三", "## 需要总结的案例 / Case to Summarize", "案例内容" * 40, "x" * 500]
+        )
+
+        result = self.prompt_builder._truncate_prompt_intelligently(prompt, 400)
+
+        assert result.split("\n") == [
+            "历史一", "历史二", "历史三", "## 需要总结的案例 / Case to Summarize", "案例内容" * 40
+        ]
+    
     def test_create_system_message_format_with_prompt(self):
         """测试创建系统消息格式（有提示词）/ Test creating system message format with prompt"""
         system_prompt = "你是专业助手"